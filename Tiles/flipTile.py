@@ -5,6 +5,11 @@ class FlipTile(Tile):
     """
     A decorator/wrapper that mirrors a Tile's internal geometry.
     """
+    __slots__ = ('wrapped_tile',)
+
+    # The shared transition tables are resolved with the mirror applied
+    _flipped = True
+
     def __init__(self, wrapped_tile: Tile):
         # We pass the wrapped tile's current properties to the base Tile
         super().__init__(
@@ -14,6 +19,18 @@ class FlipTile(Tile):
         )
         self.wrapped_tile = wrapped_tile
 
+        # Share the wrapped tile's defaults (its geometry comes through _base_paths below)
+        self._base_defaults = wrapped_tile._base_defaults
+
+    @property
+    def _base_paths(self):
+        return self.wrapped_tile._base_paths
+
+    def clone(self) -> 'FlipTile':
+        clone = super().clone()
+        clone.wrapped_tile = self.wrapped_tile
+        return clone
+
     def _flip(self, d: Direction) -> Direction:
         """Horizontal swap: Left becomes Right, Right becomes Left."""
         if d == Direction.Left: return Direction.Right
@@ -21,8 +38,8 @@ class FlipTile(Tile):
         return d
 
     # --- Overriding Transformation Logic ---
-    # Because world_paths in the base Tile class calls self._to_world,
-    # these overrides will automatically 'flip' the output of world_paths.
+    # The hot path uses the flipped transition tables; these keep the
+    # per-direction helpers (e.g. world_defaults) consistent with them.
 
     def _to_world(self, tile_dir: Direction) -> Direction:
         # Flip the design first, then rotate it
@@ -33,16 +50,10 @@ class FlipTile(Tile):
         return self._flip(super()._to_tile(world_dir))
 
     # --- Delegation ---
-    # Ensure FlipTile looks at the wrapped tile's paths, not its own empty dicts.
-
-    @property
-    def _base_paths(self):
-        return self.wrapped_tile._base_paths
-
-    @property
-    def _base_defaults(self):
-        return self.wrapped_tile._base_defaults
 
     def __getattr__(self, name):
         """Pass any other attribute access (like current_directive) to the inner tile."""
-        return getattr(self.wrapped_tile, name)
\ No newline at end of file
+        # Not yet initialised (e.g. mid-copy): nothing to delegate to
+        if name == 'wrapped_tile' or name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.wrapped_tile, name)
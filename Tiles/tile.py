@@ -1,24 +1,167 @@
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Tuple
 
-from board import Coord
 from direction import Direction, Orientation
-from player import Player
+
+if TYPE_CHECKING:
+    from board import Coord
+    from player import Player
+
+# Packed exit code for "no automatic exit" (wall, or a manual choice is required)
+NO_EXIT = 0xFF
+
+
+class Transitions(NamedTuple):
+    """
+    World-space behaviour of one tile configuration, indexed by the entry Direction.value.
+    Every tile with the same geometry, defaults, orientation and flip shares one instance.
+    """
+    options: Tuple[Optional[Tuple[Direction, ...]], ...]  # None = can't enter from that side
+    exits: Tuple[Optional[Direction], ...]  # The automatic exit, or None
+    codes: bytes  # 'exits' packed as Direction.value / NO_EXIT, 4 bytes
+    outlets: Tuple[Direction, ...]  # Every side a path can leave through, in Direction order
+
+
+# (paths, defaults, orientation, flipped) -> shared table
+_TRANSITIONS: Dict[tuple, Transitions] = {}
+
+_FLIP = (Direction.Up, Direction.Right, Direction.Down, Direction.Left)
+
+
+def resolve_transitions(base_paths: Dict[Direction, List[Direction]],
+                        base_defaults: Dict[Direction, Optional[Direction]],
+                        orientation: Orientation, flipped: bool = False) -> Transitions:
+    """Returns the shared transition table for a tile configuration, building it on first use."""
+    key = (
+        tuple((entry, tuple(exits)) for entry, exits in base_paths.items()),
+        tuple(base_defaults.items()),
+        orientation,
+        flipped
+    )
+    table = _TRANSITIONS.get(key)
+    if table is not None:
+        return table
+
+    def to_world(tile_dir: Direction) -> Direction:
+        if flipped:
+            tile_dir = _FLIP[tile_dir.value]
+        return Direction((tile_dir.value + orientation.value) % 4)
+
+    options: List[Optional[Tuple[Direction, ...]]] = [None] * 4
+    for local_entry, local_exits in base_paths.items():
+        options[to_world(local_entry).value] = tuple(to_world(ex) for ex in local_exits)
+
+    defaults = {
+        to_world(local_entry): to_world(local_exit) if local_exit else None
+        for local_entry, local_exit in base_defaults.items()
+    }
+
+    exits: List[Optional[Direction]] = [None] * 4
+    for entry_value, entry_options in enumerate(options):
+        if not entry_options:
+            continue  # Wall collision
+        if len(entry_options) == 1:
+            exits[entry_value] = entry_options[0]
+        else:
+            exits[entry_value] = defaults.get(Direction(entry_value))
+
+    codes = bytes(NO_EXIT if ex is None else ex.value for ex in exits)
+    outlets = tuple(d for d in Direction if any(d in o for o in options if o))
+    table = _TRANSITIONS[key] = Transitions(tuple(options), tuple(exits), codes, outlets)
+    return table
+
+
+# Shared by every tile without automatic choices
+NO_DEFAULTS: Dict[Direction, Optional[Direction]] = {}
+
 
 class Tile:
-    def __init__(self, coord: Optional[Coord], orientation: Orientation, ownership: Player = None):
+    # Subclasses must declare __slots__ too, or they get a __dict__ back
+    __slots__ = ('coords', '_orientation', '_ownership', '_base_defaults', '_transitions', '_observer')
+
+    # Mirrored geometry (see FlipTile)
+    _flipped = False
+
+    # Factory Default (Local Tile-space), one dict per tile type, never mutated
+    _base_paths: Dict[Direction, List[Direction]] = {}
+
+    def __init__(self, coord: Optional['Coord'], orientation: Orientation, ownership: 'Player' = None):
+        # The board this tile is placed on (set by GameBoard), told about rotations and owner changes
+        self._observer = None
+
         self.coords = coord
-        self.orientation = orientation
-        self.ownership = ownership
+        self._ownership = ownership
+
+        # Per-instance only because some tiles take a default choice; always a shared dict
+        self._base_defaults: Dict[Direction, Optional[Direction]] = NO_DEFAULTS
+
+        # World-space table, resolved on first use (and again after each orientation change)
+        self._transitions: Optional[Transitions] = None
+        self._orientation = orientation
+
+    @property
+    def orientation(self) -> Orientation:
+        return self._orientation
 
-        # Factory Default (Local Tile-space)
-        self._base_paths: Dict[Direction, List[Direction]] = {}
-        self._base_defaults: Dict[Direction, Optional[Direction]] = {}
+    @orientation.setter
+    def orientation(self, orientation: Orientation):
+        """Same as orient() for a placed tile; otherwise the transition table is resolved on next use."""
+        if orientation is not self._orientation:
+            if self._observer is not None:
+                self.orient(orientation)
+            else:
+                self._orientation = orientation
+                self._transitions = None
+
+    @property
+    def ownership(self) -> Optional['Player']:
+        return self._ownership
+
+    @ownership.setter
+    def ownership(self, owner: Optional['Player']):
+        previous = self._ownership
+        self._ownership = owner
+        if self._observer is not None:
+            self._observer.on_tile_owner_changed(self, previous)
 
     def rotate(self, clockwise: bool = True):
         """Modifies the tile's orientation in 90-degree increments."""
         current = self.orientation.value
         step = 1 if clockwise else -1
-        self.orientation = Orientation((current + step) % 4)
+        self.orient(Orientation((current + step) % 4))
+
+    def orient(self, orientation: Orientation):
+        """Turns the tile to face 'orientation' directly."""
+        previous = self._orientation
+        self._orientation = orientation
+        self._transitions = resolve_transitions(
+            self._base_paths, self._base_defaults, orientation, self._flipped
+        )
+        if self._observer is not None:
+            self._observer.on_tile_rotated(self, previous)
+
+    def clone(self) -> 'Tile':
+        """
+        Copies the mutable state (coords, orientation, ownership).
+        The geometry dicts and transition table stay shared.
+        """
+        clone = object.__new__(type(self))
+        clone.coords = self.coords
+        clone._orientation = self._orientation
+        clone._ownership = self._ownership
+        clone._base_defaults = self._base_defaults
+        clone._transitions = self._transitions
+        clone._observer = None
+        return clone
+
+    @property
+    def transitions(self) -> Transitions:
+        """The shared world-space transition table for the current orientation."""
+        table = self._transitions
+        if table is None:
+            table = self._transitions = resolve_transitions(
+                self._base_paths, self._base_defaults, self._orientation, self._flipped
+            )
+        return table
 
     def _to_world(self, tile_dir: Direction) -> Direction:
         """Maps a local Tile Direction to a World Direction based on Orientation."""
@@ -31,11 +174,11 @@ class Tile:
     @property
     def world_paths(self) -> Dict[Direction, List[Direction]]:
         """World-space mapping of entries to exits."""
-        rotated = {}
-        for local_entry, local_exits in self._base_paths.items():
-            world_entry = self._to_world(local_entry)
-            rotated[world_entry] = [self._to_world(ex) for ex in local_exits]
-        return rotated
+        return {
+            Direction(entry_value): list(exits)
+            for entry_value, exits in enumerate(self.transitions.options)
+            if exits is not None
+        }
 
     @property
     def world_defaults(self) -> Dict[Direction, Optional[Direction]]:
@@ -51,24 +194,17 @@ class Tile:
 
     def can_enter(self, world_entry_dir: Direction) -> bool:
         """Checks if a robot approaching from a specific world direction can enter."""
-        return world_entry_dir in self.world_paths
+        return self.transitions.options[world_entry_dir.value] is not None
 
     def get_options(self, world_entry_dir: Direction) -> List[Direction]:
         """Returns all possible exit directions in world-space."""
-        return self.world_paths.get(world_entry_dir, [])
+        return list(self.transitions.options[world_entry_dir.value] or ())
 
     def get_exit(self, world_entry_dir: Direction) -> Optional[Direction]:
         """
         Determines the world-space exit.
         Returns Direction for auto-paths, or None if a manual Choice is required.
         """
-        options = self.get_options(world_entry_dir)
-        if not options:
-            return None  # Wall collision
-
-        if len(options) == 1:
-            return options[0]
-
-        return self.world_defaults.get(world_entry_dir)
+        return self.transitions.exits[world_entry_dir.value]
 
-AsymmetricTile = Tile
\ No newline at end of file
+AsymmetricTile = Tile
@@ -1,4 +1,5 @@
-from typing import List, Type, Any
+from typing import List, Type, Any, Optional
+import random
 
 from Tiles.flipTile import FlipTile
 from Tiles.tile import Tile, AsymmetricTile
@@ -13,11 +14,11 @@ from pile import Pile
 class TilePile(Pile[Tile]):
     """Strictly typed pile for Hardware Tiles."""
 
-    def __init__(self, items: List[Tile] = None):
-        super().__init__(items or [])
+    def __init__(self, items: List[Tile] = None, rng: Optional[random.Random] = None):
+        super().__init__(items or [], rng)
 
 
-def generate_tile_pile() -> TilePile:
+def generate_tile_pile(rng: Optional[random.Random] = None) -> TilePile:
     items: List[Tile] = []
 
     def add_tile(cls: Type[Tile], **kwargs: Any):
@@ -61,4 +62,4 @@ def generate_tile_pile() -> TilePile:
     for _ in range(2): add_tile(DivergeMergeTile, default_side=Direction.Left)
     for _ in range(2): add_tile(DivergeMergeTile, default_side=Direction.Right)
 
-    return TilePile(items)
\ No newline at end of file
+    return TilePile(items, rng)
\ No newline at end of file
@@ -1,124 +1,154 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
 from Tiles.tile import Tile, AsymmetricTile
-from board import Coord
 from direction import Direction, Orientation
 
+if TYPE_CHECKING:
+    from board import Coord
+
+# Geometry lives on the class and is shared by every tile of that type.
+# Tiles with a default choice pick one of a few shared defaults dicts per instance.
+
+Defaults = Dict[Direction, Optional[Direction]]
+
 
 class StartTile(Tile):
-    def __init__(self, coord: Optional[Coord], orientation: Orientation):
+    __slots__ = ()
+    _base_paths = {Direction.Up: [Direction.Up]}
+    # No choice possible, no defaults needed.
+
+    def __init__(self, coord: Optional['Coord'], orientation: Orientation):
         super().__init__(coord, orientation)
-        self._base_paths = {Direction.Up: [Direction.Up]}
-        # No choice possible, no defaults needed.
 
 
 class ReverseTile(Tile):
-    def __init__(self, coord: Optional[Coord], orientation: Orientation):
+    __slots__ = ()
+    # Assuming Reverse bounces from all sides back to themselves
+    _base_paths = {
+        Direction.Up: [Direction.Up],
+        Direction.Down: [Direction.Down],
+        Direction.Left: [Direction.Left],
+        Direction.Right: [Direction.Right]
+    }
+    # Every entry has exactly one exit.
+
+    def __init__(self, coord: Optional['Coord'], orientation: Orientation):
         super().__init__(coord, orientation)
-        # Assuming Reverse bounces from all sides back to themselves
-        self._base_paths = {
-            Direction.Up: [Direction.Up],
-            Direction.Down: [Direction.Down],
-            Direction.Left: [Direction.Left],
-            Direction.Right: [Direction.Right]
-        }
-        # Every entry has exactly one exit.
 
 
 class MergeTile(Tile):
-    def __init__(self, coord: Optional[Coord], orientation: Orientation, default_choice: Direction):
+    __slots__ = ()
+    _base_paths = {
+        Direction.Left: [Direction.Up],
+        Direction.Right: [Direction.Up],
+        Direction.Up: [Direction.Left, Direction.Right]
+    }
+    # Choice only exists when entering from the "Output" (Up)
+    _DEFAULTS: Dict[Direction, Defaults] = {d: {Direction.Up: d} for d in Direction}
+
+    def __init__(self, coord: Optional['Coord'], orientation: Orientation, default_choice: Direction):
         super().__init__(coord, orientation)
-        self._base_paths = {
-            Direction.Left: [Direction.Up],
-            Direction.Right: [Direction.Up],
-            Direction.Up: [Direction.Left, Direction.Right]
-        }
-        # Choice only exists when entering from the "Output" (Up)
-        self._base_defaults = {Direction.Up: default_choice}
+        self._base_defaults = self._DEFAULTS[default_choice]
 
 
 class QuadMergeTile(Tile):
-    def __init__(self, coord: Optional[Coord], orientation: Orientation, default_choice: Direction):
+    __slots__ = ()
+    _base_paths = {
+        Direction.Left: [Direction.Up],
+        Direction.Right: [Direction.Up],
+        Direction.Down: [Direction.Up],
+        Direction.Up: [Direction.Left, Direction.Right, Direction.Down]
+    }
+    # Choice only exists when entering from the "Output" (Up)
+    _DEFAULTS: Dict[Direction, Defaults] = {d: {Direction.Up: d} for d in Direction}
+
+    def __init__(self, coord: Optional['Coord'], orientation: Orientation, default_choice: Direction):
         super().__init__(coord, orientation)
-        self._base_paths = {
-            Direction.Left: [Direction.Up],
-            Direction.Right: [Direction.Up],
-            Direction.Down: [Direction.Up],
-            Direction.Up: [Direction.Left, Direction.Right, Direction.Down]
-        }
-        # Choice only exists when entering from the "Output" (Up)
-        self._base_defaults = {Direction.Up: default_choice}
+        self._base_defaults = self._DEFAULTS[default_choice]
 
 
 class ForkTile(AsymmetricTile):
-    def __init__(self, coord: Optional[Coord], orientation: Orientation, default_choice: Direction):
+    __slots__ = ()
+    _base_paths = {
+        Direction.Down: [Direction.Up, Direction.Right],
+        Direction.Up: [Direction.Down],
+        Direction.Right: [Direction.Down]
+    }
+    # Choice only exists when entering from the "Stem" (Down)
+    _DEFAULTS: Dict[Direction, Defaults] = {d: {Direction.Down: d} for d in Direction}
+
+    def __init__(self, coord: Optional['Coord'], orientation: Orientation, default_choice: Direction):
         super().__init__(coord, orientation)
-        self._base_paths = {
-            Direction.Down: [Direction.Up, Direction.Right],
-            Direction.Up: [Direction.Down],
-            Direction.Right: [Direction.Down]
-        }
-        # Choice only exists when entering from the "Stem" (Down)
-        self._base_defaults = {Direction.Down: default_choice}
+        self._base_defaults = self._DEFAULTS[default_choice]
 
 
 class TurnTile(AsymmetricTile):
-    def __init__(self, coord: Optional[Coord], orientation: Orientation):
+    __slots__ = ()
+    _base_paths = {
+        Direction.Down: [Direction.Right],
+        Direction.Right: [Direction.Down]
+    }
+    # Deterministic.
+
+    def __init__(self, coord: Optional['Coord'], orientation: Orientation):
         super().__init__(coord, orientation)
-        self._base_paths = {
-            Direction.Down: [Direction.Right],
-            Direction.Right: [Direction.Down]
-        }
-        # Deterministic.
 
 
 class CrossroadsTile(Tile):
-    def __init__(self, coord: Optional[Coord], orientation: Orientation):
+    __slots__ = ()
+    _base_paths = {
+        Direction.Up: [Direction.Down],
+        Direction.Down: [Direction.Up],
+        Direction.Left: [Direction.Right],
+        Direction.Right: [Direction.Left]
+    }
+    # Deterministic.
+
+    def __init__(self, coord: Optional['Coord'], orientation: Orientation):
         super().__init__(coord, orientation)
-        self._base_paths = {
-            Direction.Up: [Direction.Down],
-            Direction.Down: [Direction.Up],
-            Direction.Left: [Direction.Right],
-            Direction.Right: [Direction.Left]
-        }
-        # Deterministic.
 
 
 class DivergeTile(Tile):
-    def __init__(self, coord: Optional[Coord], orientation: Orientation):
+    __slots__ = ()
+    _base_paths = {
+        Direction.Down: [Direction.Right],
+        Direction.Right: [Direction.Down],
+        Direction.Up: [Direction.Left],
+        Direction.Left: [Direction.Up]
+    }
+    # Deterministic.
+
+    def __init__(self, coord: Optional['Coord'], orientation: Orientation):
         super().__init__(coord, orientation)
-        self._base_paths = {
-            Direction.Down: [Direction.Right],
-            Direction.Right: [Direction.Down],
-            Direction.Up: [Direction.Left],
-            Direction.Left: [Direction.Up]
-        }
-        # Deterministic.
 
 
 class DivergeMergeTile(Tile):
-    def __init__(self, coord: Optional[Coord], orientation: Orientation, default_side: Direction):
+    __slots__ = ()
+    _base_paths = {
+        Direction.Up: [Direction.Left, Direction.Right],
+        Direction.Right: [Direction.Down, Direction.Up],
+        Direction.Down: [Direction.Left, Direction.Right],
+        Direction.Left: [Direction.Up, Direction.Down]
+    }
+
+    # As requested: Diverge Merge defaults are "All Left" or "All Right"
+    # based on the relative entry.
+    _ALL_LEFT: Defaults = {
+        Direction.Up: Direction.Left,
+        Direction.Right: Direction.Up,
+        Direction.Down: Direction.Right,
+        Direction.Left: Direction.Down
+    }
+    _ALL_RIGHT: Defaults = {
+        Direction.Up: Direction.Right,
+        Direction.Right: Direction.Down,
+        Direction.Down: Direction.Left,
+        Direction.Left: Direction.Up
+    }
+
+    def __init__(self, coord: Optional['Coord'], orientation: Orientation, default_side: Direction):
         super().__init__(coord, orientation)
-        self._base_paths = {
-            Direction.Up: [Direction.Left, Direction.Right],
-            Direction.Right: [Direction.Down, Direction.Up],
-            Direction.Down: [Direction.Left, Direction.Right],
-            Direction.Left: [Direction.Up, Direction.Down]
-        }
-
-        # As requested: Diverge Merge defaults are "All Left" or "All Right"
-        # based on the relative entry.
         if default_side == Direction.Left:
-            self._base_defaults = {
-                Direction.Up: Direction.Left,
-                Direction.Right: Direction.Up,
-                Direction.Down: Direction.Right,
-                Direction.Left: Direction.Down
-            }
+            self._base_defaults = self._ALL_LEFT
         else:  # default_side == Direction.Right
-            self._base_defaults = {
-                Direction.Up: Direction.Right,
-                Direction.Right: Direction.Down,
-                Direction.Down: Direction.Left,
-                Direction.Left: Direction.Up
-            }
\ No newline at end of file
+            self._base_defaults = self._ALL_RIGHT
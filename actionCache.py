@@ -0,0 +1,52 @@
+from typing import Any, Callable, Dict
+
+# A compiled card action: takes the game state 'g' and returns the (chained) result.
+ActionFunc = Callable[[Any], Any]
+
+# The card lambdas only ever need len(); everything else is reached through 'g'.
+_CARD_BUILTINS = {"len": len}
+
+
+class ActionCache:
+    """
+    Compiles each distinct 'function' string from cards.json exactly once.
+    Cards that share the same source (e.g. the per-color delete action, or the
+    many 'lambda g: g' placeholders) share the same callable.
+    GameCard gets here through ActionInterpreter.resolve, for the actions the
+    dispatch table doesn't cover.
+    """
+
+    def __init__(self):
+        self._compiled: Dict[str, ActionFunc] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, source: str) -> ActionFunc:
+        """Returns the ready-to-run callable for a lambda string, compiling it on first sight."""
+        action_func = self._compiled.get(source)
+        if action_func is not None:
+            self.hits += 1
+            return action_func
+
+        self.misses += 1
+        code = compile(source, "<card action>", "eval")
+        action_func = eval(code, {"__builtins__": _CARD_BUILTINS})
+        self._compiled[source] = action_func
+        return action_func
+
+    def stats(self) -> Dict[str, int]:
+        """Diagnostic helper."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._compiled)
+        }
+
+    def clear(self):
+        self._compiled.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Shared by every GameCard in the process
+ACTION_CACHE = ActionCache()
@@ -0,0 +1,457 @@
+import ast
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from actionCache import ACTION_CACHE, ActionFunc
+
+# Builder signature: params -> ready-to-run action. Builders run once per distinct action
+# (when cards are built), so every params lookup happens there and not on each play.
+Builder = Callable[[Dict[str, Any]], ActionFunc]
+ActionKey = Tuple[str, Optional[str]]
+
+# The dispatch table, keyed on (action.type, action.params.op)
+DISPATCH: Dict[ActionKey, Builder] = {}
+
+
+def action_key(action: Dict[str, Any]) -> ActionKey:
+    """
+    Dispatch key for a structured action.
+    LOGIC actions use 'op' for the comparator, so they are keyed on 'cond'.
+    RESOURCE actions without an 'op' are keyed on the resource 'type'.
+    """
+    kind = action['type']
+    params = action['params']
+    if kind == 'LOGIC':
+        return kind, params.get('cond')
+    if kind == 'RESOURCE' and 'op' not in params:
+        return kind, params.get('type')
+    return kind, params.get('op')
+
+
+def _handles(kind: str, *ops: Optional[str]):
+    """Registers a builder for one or more (type, op) keys."""
+    def register(builder: Builder) -> Builder:
+        for op in ops:
+            DISPATCH[(kind, op)] = builder
+        return builder
+    return register
+
+
+# --- SECURITY ---
+
+@_handles('SECURITY', 'lock')
+def _lock(params):
+    if params.get('target') == 'self':
+        return lambda g: g.apply_status(target='self', status='locked')
+    return lambda g: g  # Passive card: the lock is the card sitting in the stack
+
+@_handles('SECURITY', 'negate')
+def _negate(params):
+    target = params['target'] if 'target' in params else params['val']
+    return lambda g: g.negate_action(target)
+
+@_handles('SECURITY', 'interrupt')
+def _interrupt(params):
+    return lambda g: g.cancel_current_action()
+
+@_handles('SECURITY', 'discard')
+def _discard(params):
+    count = params['count']
+    if params['target'] == 'all_opponents':
+        return lambda g: g.all_opponents_discard(count)
+    return lambda g: g.target_opponent().discard(count)
+
+@_handles('SECURITY', 'discard_color')
+def _discard_color(params):
+    color = params['val']
+    return lambda g: g.target_opponent().reveal_hand().discard_by_color(color)
+
+@_handles('SECURITY', 'named_discard')
+def _named_discard(params):
+    return lambda g: g.target_opponent().discard_named(g.prompt_title())
+
+@_handles('SECURITY', 'nullify_color')
+def _nullify_color(params):
+    color = params['val']
+    return lambda g: g.apply_stack_modifier(color=color, effect='null_vp')
+
+@_handles('SECURITY', 'lock_in_stack')
+def _lock_in_stack(params):
+    return lambda g: g.apply_status('self', 'immobile')
+
+@_handles('SECURITY', 'permanent_lock')
+def _permanent_lock(params):
+    return lambda g: g.apply_status(g.prompt_tile(), 'bricked')
+
+@_handles('SECURITY', 'throttle')
+def _throttle(params):
+    return lambda g: g.apply_status(g.prompt_tile(), 'throttled')
+
+@_handles('SECURITY', 'skip_draw')
+def _skip_draw(params):
+    return lambda g: g.target_opponent().add_debuff('skip_next_draw')
+
+@_handles('SECURITY', 'swap_active')
+def _swap_active(params):
+    return lambda g: g.swap_active_cards(g.target_opponent())
+
+@_handles('SECURITY', 'null_adjacency')
+def _null_adjacency(params):
+    return lambda g: g.set_adjacency('none')
+
+
+# --- RESOURCE ---
+
+@_handles('RESOURCE', 'battery')
+def _battery(params):
+    val = params['val']
+    return lambda g: g.add_battery(val)
+
+@_handles('RESOURCE', 'all')
+def _all_players(params):
+    loss, battery = -params['vp'], params['battery']
+    return lambda g: g.all_players_lose_vp(loss).add_battery(battery)
+
+
+# --- TRANSFORM ---
+
+# Schema location names that differ from the game API
+_LOCATIONS = {'adjacent_empty': 'adj_empty'}
+
+@_handles('TRANSFORM', None)
+def _draw_place_discard(params):
+    draw, place, discard = params['draw'], params['place'], params['discard']
+    return lambda g: g.draw_tiles(draw).place_tile(place).discard_tiles(discard)
+
+@_handles('TRANSFORM', 'rotate')
+def _rotate(params):
+    target, degrees = params['target'], params['degrees']
+    return lambda g: g.rotate_tile(target=target, deg=degrees)
+
+@_handles('TRANSFORM', 'force_rotate')
+def _force_rotate(params):
+    return lambda g: g.target_opponent().force_rotate_owned()
+
+@_handles('TRANSFORM', 'shift')
+def _shift(params):
+    magnitude = params['magnitude']
+    return lambda g: g.shift_board(magnitude=magnitude)
+
+@_handles('TRANSFORM', 'gravity_shift')
+def _gravity_shift(params):
+    return lambda g: g.shift_row_to_low_density()
+
+@_handles('TRANSFORM', 'swap')
+def _swap(params):
+    count, restriction = params['count'], params['restriction']
+    return lambda g: g.swap_tiles(count=count, filter=restriction)
+
+@_handles('TRANSFORM', 'place')
+def _place(params):
+    kind = params['type']
+    if 'loc' not in params:
+        return lambda g: g.place_tile(kind)
+    loc = _LOCATIONS.get(params['loc'], params['loc'])
+    return lambda g: g.place_tile(type=kind, loc=loc)
+
+@_handles('TRANSFORM', 'add_neutral')
+def _add_neutral(params):
+    count = params['count']
+    return lambda g: g.add_to_board('neutral', count)
+
+@_handles('TRANSFORM', 'invert_exits')
+def _invert_exits(params):
+    if 'count' in params:
+        count = params['count']
+        return lambda g: g.invert_exits(range=count)
+    return lambda g: g.invert_tile_exits()
+
+@_handles('TRANSFORM', 'neutralize')
+def _neutralize(params):
+    if 'filter' in params:
+        restriction = params['filter']
+        return lambda g: g.set_owner(g.prompt_tile(filter=restriction), 'neutral')
+    return lambda g: g.set_owner(g.prompt_tile(), 'neutral')
+
+
+# --- DECK_OP ---
+
+def _move_kwargs(params: Dict[str, Any]) -> Dict[str, Any]:
+    """move_card() arguments: the params' source / target and whichever optional arguments are given."""
+    return {key: params[key] for key in ('source', 'target', 'count', 'pos', 'face_down') if key in params}
+
+@_handles('DECK_OP', 'recycle')
+def _recycle(params):
+    kwargs = _move_kwargs(params)
+    source = params['source']
+    return lambda g: g.move_card(**kwargs).shuffle_bottom(source)
+
+@_handles('DECK_OP', 'draw')
+def _draw(params):
+    count = params['count']
+    if params.get('target') == 'all':
+        return lambda g: g.all_players_draw(count)
+    return lambda g: g.draw(count)
+
+@_handles('DECK_OP', 'discard_deck')
+def _discard_deck(params):
+    val = params['val']
+    return lambda g: g.discard_from_deck(val)
+
+@_handles('DECK_OP', 'fill_hand')
+def _fill_hand(params):
+    val = params['val']
+    return lambda g: g.target_opponent().draw_to_limit(val)
+
+@_handles('DECK_OP', 'move_top')
+def _move_top(params):
+    return lambda g: g.move_to_stack_top(g.prompt_stack_card())
+
+@_handles('DECK_OP', 'reorder')
+def _reorder(params):
+    return lambda g: g.reorder_stack()
+
+@_handles('DECK_OP', 'unstash')
+def _unstash(params):
+    return lambda g: g.unstash_card()
+
+@_handles('DECK_OP', 'swap_self')
+def _swap_with_stack(params):
+    return lambda g: g.swap_with_stack(target='self')
+
+@_handles('DECK_OP', 'search')
+def _search(params):
+    return lambda g: g.search_deck(g.prompt_title()).shuffle()
+
+
+# --- FLOW ---
+
+@_handles('FLOW', 'set_pc')
+def _set_pc(params):
+    if 'val' in params:
+        val = params['val']
+        return lambda g: g.set_pc(val)
+    return lambda g: g.set_pc(g.prompt_index())
+
+@_handles('FLOW', 'terminate')
+def _terminate(params):
+    return lambda g: g.set_pc('end')
+
+@_handles('FLOW', 'end_turn')
+def _end_turn(params):
+    return lambda g: g.end_turn()
+
+@_handles('FLOW', 'trigger_index')
+def _trigger_index(params):
+    val = params['val']
+    return lambda g: g.trigger_stack_at(val)
+
+@_handles('FLOW', 'trigger_adj')
+def _trigger_adj(params):
+    return lambda g: g.trigger_adjacent_write()
+
+@_handles('FLOW', 'trigger_row')
+def _trigger_row(params):
+    return lambda g: g.trigger_owned_in_row()
+
+@_handles('FLOW', 'exec_hand')
+def _exec_hand(params):
+    return lambda g: g.execute_hand_card()
+
+@_handles('FLOW', 'delay')
+def _delay(params):
+    return lambda g: g.queue_delayed_action(g.prompt_hand())
+
+@_handles('FLOW', 'skip_next')
+def _skip_next(params):
+    return lambda g: g.add_buff('robot', 'ignore_next_stack')
+
+
+# --- MOVE ---
+
+# Schema targets -> move_robot(target=...) names
+_MOVE_TARGETS = {
+    'neutral': 'any_neutral',
+    'owned': 'any_owned',
+    'min_neighbors': 'min_neighbor_owned'
+}
+
+@_handles('MOVE', None)
+def _move(params):
+    target = params.get('target')
+    if target in _MOVE_TARGETS:
+        move_target = _MOVE_TARGETS[target]
+        return lambda g: g.move_robot(target=move_target)
+    if target == 'start':
+        return lambda g: g.move_robot('start')
+    if target == 'nearest_owned':
+        return lambda g: g.move_robot_linear(target='owned')
+    if params.get('dir') == 'lateral':
+        return lambda g: g.move_robot_lateral()
+    if 'dist' in params:
+        dist, ignore = params['dist'], params.get('ignore', False)
+        return lambda g: g.move_robot(distance=dist, ignore_stack=ignore)
+    if 'stun' in params:
+        bonus = params['bonus']
+        return lambda g: g.apply_status('robot', 'stunned').add_buff('next_move', bonus)
+    if 'bonus' in params:
+        bonus = params['bonus']
+        return lambda g: g.modify_current_move(bonus)
+    val = params['val']
+    return lambda g: g.modify_movement(val)
+
+@_handles('MOVE', 'reverse')
+def _reverse(params):
+    return lambda g: g.reverse_robot_vector()
+
+@_handles('MOVE', 'stop')
+def _stop(params):
+    return lambda g: g.stop_robot()
+
+@_handles('MOVE', 'bridge')
+def _bridge(params):
+    return lambda g: g.create_temp_bridge()
+
+
+# --- COVERAGE ---
+# The params in cards.json don't always say everything the card's lambda does (conditions,
+# computed VP, scheduled effects, literals such as durations). A handler is only used when
+# its calls are exactly the ones the lambda spells out. That is checked once per distinct
+# action by parsing the lambda (never compiling or running it) and running the handler
+# against a recorder.
+
+class _Undescribed(Exception):
+    """The lambda is more than a chain of game calls with literal arguments."""
+
+
+class _Recorder:
+    """Stand-in game for handlers: logs each call and hands back a named result."""
+    __slots__ = ('_path', '_calls')
+
+    def __init__(self, path: str, calls: List[Tuple]):
+        self._path = path
+        self._calls = calls
+
+    def __getattr__(self, name: str) -> '_Recorder':
+        return _Recorder(f"{self._path}.{name}", self._calls)
+
+    def __call__(self, *args, **kwargs) -> '_Recorder':
+        calls = self._calls
+        calls.append((self._path, tuple(map(_recorded, args)),
+                      {key: _recorded(val) for key, val in kwargs.items()}))
+        return _Recorder(f"<{len(calls) - 1}>", calls)
+
+
+def _recorded(value: Any) -> Any:
+    return ('@', value._path) if isinstance(value, _Recorder) else value
+
+
+def _lambda_calls(source: str) -> Tuple[List[Tuple], Any]:
+    """The calls and result a lambda spells out, in the form _Recorder logs them."""
+    lam = ast.parse(source, mode='eval').body
+    if not isinstance(lam, ast.Lambda) or len(lam.args.args) != 1:
+        raise _Undescribed(source)
+    game = lam.args.args[0].arg
+    calls: List[Tuple] = []
+
+    def walk(node):
+        if isinstance(node, ast.Name) and node.id == game:
+            return '@', 'g'
+        if isinstance(node, ast.Attribute):
+            return '@', f"{walk(node.value)[1]}.{node.attr}"
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+            method = walk(node.func)[1]
+            args = tuple(argument(arg) for arg in node.args)
+            kwargs = {}
+            for keyword in node.keywords:
+                if keyword.arg is None:
+                    raise _Undescribed(source)
+                kwargs[keyword.arg] = argument(keyword.value)
+            calls.append((method, args, kwargs))
+            return '@', f"<{len(calls) - 1}>"
+        raise _Undescribed(source)
+
+    def argument(node):
+        if isinstance(node, (ast.Name, ast.Attribute, ast.Call)):
+            return walk(node)
+        try:
+            return ast.literal_eval(node)
+        except ValueError:
+            raise _Undescribed(source)
+
+    result = walk(lam.body)
+    return calls, result
+
+
+def describes(action_func: ActionFunc, source: str) -> bool:
+    """True if 'action_func' makes exactly the calls of the lambda in 'source'."""
+    try:
+        expected = _lambda_calls(source)
+    except (_Undescribed, SyntaxError):
+        return False
+    calls: List[Tuple] = []
+    try:
+        result = action_func(_Recorder('g', calls))
+    except Exception:
+        return False
+    return (calls, _recorded(result)) == expected
+
+
+def compile_action(action: Dict[str, Any]) -> Optional[ActionFunc]:
+    """The dispatch table's callable for an action, or None if its params don't describe it."""
+    builder = DISPATCH.get(action_key(action))
+    if builder is None:
+        return None
+    try:
+        action_func = builder(action['params'])
+    except KeyError:
+        return None
+    return action_func if describes(action_func, action['function']) else None
+
+
+# --- RESOLUTION ---
+
+class ActionInterpreter:
+    """
+    Turns a card's structured 'action' into a callable, built once per distinct action
+    and shared. Actions the dispatch table covers never touch their lambda string; the
+    rest run the lambda, compiled once by ACTION_CACHE.
+    """
+
+    def __init__(self):
+        self._resolved: Dict[str, ActionFunc] = {}
+        self.interpreted = 0
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, action: Dict[str, Any]) -> ActionFunc:
+        # The lambda is part of the key: the same params can stand for different lambdas
+        key = json.dumps(action, sort_keys=True)
+        action_func = self._resolved.get(key)
+        if action_func is not None:
+            self.hits += 1
+            return action_func
+
+        self.misses += 1
+        action_func = compile_action(action)
+        if action_func is None:
+            action_func = ACTION_CACHE.get(action['function'])
+        else:
+            self.interpreted += 1
+        self._resolved[key] = action_func
+        return action_func
+
+    def stats(self) -> Dict[str, int]:
+        """Diagnostic helper. 'compiled' actions run their lambda (see ACTION_CACHE.stats())."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "actions": len(self._resolved),
+            "interpreted": self.interpreted,
+            "compiled": len(self._resolved) - self.interpreted,
+            "handlers": len(DISPATCH)
+        }
+
+
+# Shared by every GameCard in the process
+ACTION_INTERPRETER = ActionInterpreter()
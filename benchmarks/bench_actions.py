@@ -0,0 +1,78 @@
+"""
+Card action benchmark: per-play eval() vs compiled lambdas vs the resolved actions cards
+actually run (the dispatch table where the params describe the action, the compiled
+lambda elsewhere). Parity with the lambdas is checked in tests/test_actions.py.
+
+Run from the repository root:
+    python -m benchmarks.bench_actions
+"""
+import timeit
+
+from actionCache import ACTION_CACHE
+from actionInterpreter import ACTION_INTERPRETER
+from selfplay import load_cards
+
+SLOTS = ('execute', 'write', 'delete')
+
+
+class NullGame(int):
+    """
+    Accepts any chained game call, attribute, index or comparison and reads as 0,
+    so every action (conditions and computed amounts included) runs to the end.
+    """
+    pc = 0
+
+    def __getattr__(self, name):
+        return self
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+    def __getitem__(self, index):
+        return self
+
+    def __len__(self):
+        return 0
+
+
+# --- BENCHMARK ---
+
+def main(repeat: int = 15, number: int = 200):
+    cards = load_cards('cards.json')
+    print(f"{len(cards)} cards: {ACTION_INTERPRETER.stats()}, lambda cache {ACTION_CACHE.stats()}")
+
+    actions = [getattr(card.data, slot)['action'] for card in cards for slot in SLOTS]
+    sources = [a['function'] for a in actions]
+    compiled = [ACTION_CACHE.get(src) for src in sources]
+    resolved = [ACTION_INTERPRETER.resolve(a) for a in actions]
+    game = NullGame()
+
+    def run_eval():
+        # The original GameCard._run_logic path
+        for src in sources:
+            eval(src, {"__builtins__": {"len": len}}, {'g': game})(game)
+
+    def run_compiled():
+        for func in compiled:
+            func(game)
+
+    def run_resolved():
+        for func in resolved:
+            func(game)
+
+    # Repeats are interleaved so drifting machine load hits every path alike; best of each
+    paths = (("eval", run_eval), ("compiled", run_compiled), ("resolved", run_resolved))
+    best = {name: float('inf') for name, _ in paths}
+    for _ in range(repeat):
+        for name, fn in paths:
+            best[name] = min(best[name], timeit.timeit(fn, number=number))
+    results = {name: t / (number * len(actions)) * 1e9 for name, t in best.items()}
+
+    print(f"{len(actions)} card actions, ns per play:")
+    for name, ns in results.items():
+        print(f"  {name:<12} {ns:10.1f}  ({results['eval'] / ns:5.1f}x vs eval)")
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Game branching benchmark: DirectiveGame.clone() and snapshot()/restore() vs copy.deepcopy.
+
+Run from the repository root:
+    python -m benchmarks.bench_clone
+"""
+import copy
+import json
+import random
+import timeit
+
+from card import GameCard
+from game import DirectiveGame
+from hydrate import hydrate_deck
+from Tiles.tilePile import generate_tile_pile
+
+
+def build_game(tiles: int = 60, players: int = 4, seed: int = 0) -> DirectiveGame:
+    """A mid-game position: tiles placed and owned, hands dealt."""
+    rng = random.Random(seed)
+    with open('cards.json', 'r') as f:
+        cards = [GameCard(h) for h in hydrate_deck(json.load(f))]
+
+    game = DirectiveGame(cards, players)
+    pile = generate_tile_pile()
+    for i in range(tiles):
+        tile = pile.draw_one()
+        if tile is None or not game.board.valid_slots:
+            break
+        game.board.place_tile(tile, rng.choice(sorted(game.board.valid_slots)))
+        owner = game.players[i % players]
+        tile.ownership = owner
+        owner.owned_tiles.append(tile)
+
+    for player in game.players:
+        player.hand = game.card_decks.draw(5)
+        player.program = game.card_decks.draw(3)
+    return game
+
+
+def rate(fn, number: int, repeat: int = 5) -> float:
+    """Calls per second (best of 'repeat')."""
+    return number / min(timeit.repeat(fn, repeat=repeat, number=number))
+
+
+def main():
+    game = build_game()
+    snapshot = game.snapshot()
+
+    results = {
+        "deepcopy": rate(lambda: copy.deepcopy(game), number=20),
+        "clone": rate(game.clone, number=500),
+        "snapshot": rate(game.snapshot, number=2_000),
+        "restore": rate(lambda: game.restore(snapshot), number=2_000),
+    }
+
+    print(f"{len(game.board.grid)} tiles, {len(game.players)} players:")
+    for name, per_second in results.items():
+        print(f"  {name:<10} {per_second:12,.0f} /s  ({per_second / results['deepcopy']:6.1f}x vs deepcopy)")
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Frontier benchmark: "which valid slots are connected" answered from the incremental
+GameBoard.feeders index vs a full scan of every candidate's neighbors.
+
+Run from the repository root:
+    python -m benchmarks.bench_frontier
+"""
+import random
+import timeit
+from typing import Dict, Set
+
+from board import GameBoard, Coord
+from direction import Direction, DELTAS
+from Tiles.tilePile import generate_tile_pile
+
+RADII = (5, 15, 30, 50)
+
+
+def scan_connected(board: GameBoard) -> Dict[Coord, Set[Direction]]:
+    """The per-candidate scan the index replaces."""
+    found: Dict[Coord, Set[Direction]] = {}
+    for slot in board.valid_slots:
+        for d in Direction:
+            dx, dy = DELTAS[d.value]
+            # A tile leaves in direction 'd' into the slot from the cell behind it
+            source = board.get_tile_at((slot[0] - dx, slot[1] - dy))
+            if source is not None and d in source.transitions.outlets:
+                found.setdefault(slot, set()).add(d)
+    return found
+
+
+def fill(radius: int, tiles: int, seed: int = 0) -> GameBoard:
+    rng = random.Random(seed)
+    board = GameBoard(radius)
+    pile = generate_tile_pile(rng)
+    for _ in range(tiles):
+        if not board.valid_slots:
+            break
+        tile = pile.draw_one()
+        if tile is None:
+            pile = generate_tile_pile(rng)
+            tile = pile.draw_one()
+        board.place_tile(tile, rng.choice(sorted(board.valid_slots)))
+        if rng.random() < 0.25:
+            tile.rotate()
+    return board
+
+
+def check(board: GameBoard):
+    """The index must agree with the scan after placements and rotations."""
+    indexed = {slot: set(sources.values()) for slot, sources in board.feeders.items()}
+    assert indexed == scan_connected(board), "frontier index out of sync"
+
+
+def main(repeat: int = 5):
+    print(f"{'radius':>6} {'tiles':>6} {'slots':>6} {'scan us':>10} {'index us':>10} {'speedup':>8}")
+    results = {}
+    for radius in RADII:
+        width = 2 * radius + 1
+        board = fill(radius, width * width // 3)
+        check(board)
+
+        candidates = sorted(board.valid_slots)
+        scan_us = min(timeit.repeat(lambda: scan_connected(board), repeat=repeat, number=1)) * 1e6
+        index_us = min(timeit.repeat(
+            lambda: [c for c in candidates if board.is_connected_location(c)],
+            repeat=repeat, number=1
+        )) * 1e6
+        results[radius] = (scan_us, index_us)
+        print(f"{radius:>6} {len(board.grid):>6} {len(candidates):>6} {scan_us:>10.1f} {index_us:>10.1f} "
+              f"{scan_us / index_us:>7.1f}x")
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+"""
+Deck loading: json.load + hydrate_deck vs the streaming parser vs the binary cache
+(hydrate.load_deck), cold (first card only) and fully materialized.
+
+Run from the repository root:
+    python -m benchmarks.bench_hydrate
+"""
+import timeit
+
+import hydrate
+
+PATH = 'cards.json'
+
+
+def main(repeat: int = 20):
+    reference = hydrate.hydrate_json(PATH)
+    assert list(hydrate.iter_deck(PATH)) == reference
+    assert list(hydrate.load_deck(PATH)) == reference  # Also builds the cache if needed
+
+    cases = {
+        "json.load + hydrate": lambda: hydrate.hydrate_json(PATH),
+        "streaming parse": lambda: list(hydrate.iter_deck(PATH)),
+        "cache, first card": lambda: hydrate.load_deck(PATH)[0],
+        "cache, every card": lambda: list(hydrate.load_deck(PATH)),
+    }
+    results = {}
+    for name, fn in cases.items():
+        results[name] = min(timeit.repeat(fn, repeat=repeat, number=1)) * 1e3
+        print(f"  {name:<22} {results[name]:>8.3f} ms")
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""
+Undo journal check and benchmark.
+
+Plays random journaled changes (placements, forced placements over tiles or away from
+the frontier, rotations, owner changes, robot moves, battery, draws / discards with
+reshuffles), then checks that undo_to() returns the
+board, robot and piles exactly to each earlier mark and redo() exactly forward again.
+Then times make/unmake of one turn with the journal against snapshot()/restore().
+
+Run from the repository root:
+    python -m benchmarks.bench_journal
+"""
+import random
+import timeit
+
+from board import GameBoard
+from game import DirectiveGame
+from selfplay import load_cards
+from Tiles.tilePile import generate_tile_pile
+
+
+def fingerprint(game: DirectiveGame, tiles) -> tuple:
+    board, decks = game.board, game.card_decks
+    return (
+        tuple(sorted((c, id(t), t.coords, t.orientation, id(t.ownership)) for c, t in board.grid.items())),
+        frozenset(board.valid_slots),
+        tuple(sorted((slot, tuple(sorted(s.items()))) for slot, s in board.feeders.items())),
+        board.zobrist, tuple(sorted(board._tile_keys.items())),
+        tuple(map(id, board.cells)), bytes(board.kinds), bytes(board.orientations), bytes(board.owners),
+        game.robot.snapshot(),
+        tuple(map(id, decks.draw_pile.items)), decks.draw_pile.hash, decks.draw_pile._weight,
+        tuple(map(id, decks.discard_pile.items)), decks.discard_pile.hash, decks.discard_bits,
+        decks.draw_pile.shuffles, decks.discard_pile.shuffles, tiles.shuffles,
+        tuple(map(id, tiles.items)),
+    )
+
+
+def random_change(game: DirectiveGame, tiles, rng: random.Random):
+    board = game.board
+    op = rng.randrange(8)
+    if op == 0 and board.valid_slots:
+        tile = tiles.draw_one()
+        if tile is not None:
+            board.place_tile(tile, rng.choice(sorted(board.valid_slots)))
+    elif op == 1:
+        rng.choice(list(board.grid.values())).rotate(rng.random() < 0.5)
+    elif op == 2:
+        rng.choice(list(board.grid.values())).ownership = rng.choice(game.players)
+    elif op == 3:
+        game.robot.move(board)
+    elif op == 4:
+        game.card_decks.discard(game.card_decks.draw(rng.randrange(1, 8)))
+    elif op == 5:
+        game.add_battery(rng.randrange(-3, 4))
+    elif op == 6:
+        tile = tiles.draw_one()
+        if tile is not None:
+            r = board.max_radius
+            coords = (rng.randint(-r, r), rng.randint(-r, r))
+            if coords != (0, 0):
+                board.place_tile(tile, coords, force=True)
+    else:
+        game.card_decks.draw_pile.add_to_top(game.card_decks.draw(2))
+
+
+def setup(seed: int = 0):
+    game = DirectiveGame(load_cards('cards.json'), 3, seed)
+    game.board = GameBoard(5, dense=True)
+    game.board.journal = game.journal
+    tiles = generate_tile_pile(game.stream('tiles'))
+    tiles.journal = game.journal
+    return game, tiles
+
+
+def check(seed: int, changes: int = 1500):
+    game, tiles = setup(seed)
+    rng = random.Random(seed)
+    marks = []
+    for _ in range(changes):
+        if rng.random() < 0.05:
+            marks.append((game.journal.mark(), fingerprint(game, tiles)))
+        random_change(game, tiles, rng)
+
+    end = fingerprint(game, tiles)
+    for mark, expected in reversed(marks):
+        game.journal.undo_to(mark)
+        assert fingerprint(game, tiles) == expected, (seed, mark)
+    game.journal.redo(len(game.journal._redo))
+    assert fingerprint(game, tiles) == end, seed
+    return len(marks)
+
+
+def bench():
+    game, tiles = setup(1)
+    rng = random.Random(1)
+    for _ in range(200):
+        random_change(game, tiles, rng)
+
+    def journal_turn():
+        mark = game.journal.mark()
+        for _ in range(4):
+            random_change(game, tiles, rng)
+        game.journal.undo_to(mark)
+
+    def snapshot_turn():
+        snapshot, pile = game.snapshot(), tiles.snapshot()
+        for _ in range(4):
+            random_change(game, tiles, rng)
+        game.restore(snapshot)
+        tiles.restore(pile)
+
+    n = 5_000
+    for name, fn in (("journal make/unmake", journal_turn), ("snapshot/restore", snapshot_turn)):
+        t = min(timeit.repeat(fn, number=n, repeat=3)) / n
+        print(f"  {name:<22} {t * 1e6:8.2f} us per 4-change turn")
+
+
+if __name__ == '__main__':
+    for seed in range(5):
+        print(f"seed {seed}: {check(seed)} marks undone and redone exactly")
+    bench()
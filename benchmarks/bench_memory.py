@@ -0,0 +1,118 @@
+"""
+Memory benchmark: bytes per in-memory game and per loaded card, measured with tracemalloc.
+Games, cards and tiles are also measured as unslotted stand-ins (the same attributes in a
+per-instance __dict__) for a before / after view of __slots__; the game's tiles also get back
+the per-tile geometry dicts they had before those were shared per tile type.
+
+Run from the repository root:
+    python -m benchmarks.bench_memory
+"""
+import gc
+import tracemalloc
+
+from benchmarks.bench_clone import build_game
+from card import GameCard
+from hydrate import hydrate_json
+from Tiles.tilePile import generate_tile_pile
+
+GAMES = 200
+
+
+class Unslotted:
+    """Stand-in holding a slotted object's attributes in an instance __dict__, as before __slots__."""
+
+    def __init__(self, obj):
+        for cls in type(obj).__mro__:
+            for name in getattr(cls, '__slots__', ()):
+                value = getattr(obj, name)
+                setattr(self, name, Unslotted(value) if hasattr(type(value), '__slots__') else value)
+
+
+class BaselineTile:
+    """A tile laid out as before __slots__: its state and its own copies of the geometry dicts."""
+
+    def __init__(self, tile):
+        self.coords = tile.coords
+        self.orientation = tile.orientation
+        self.ownership = tile.ownership
+        wrapped = getattr(tile, 'wrapped_tile', None)
+        if wrapped is None:
+            self._base_paths = {entry: list(exits) for entry, exits in tile._base_paths.items()}
+            self._base_defaults = dict(tile._base_defaults)
+        else:
+            self._base_defaults = {}  # A FlipTile read its paths through the tile it wraps
+            self.wrapped_tile = BaselineTile(wrapped)
+
+
+class BaselineRobot:
+    """The robot laid out as before __slots__, with its plain list history."""
+
+    def __init__(self, robot):
+        self.battery = robot.battery
+        self.location = robot.location
+        self.facing = robot.facing
+        self.is_crashed = robot.is_crashed
+        self.history = robot.history
+
+
+def baseline_game(game):
+    """A clone whose placed tiles and robot are swapped for their pre-__slots__ stand-ins."""
+    clone = game.clone()
+    tiles = {id(t): BaselineTile(t) for t in clone.board.grid.values()}
+    clone.board.grid = {coords: tiles[id(t)] for coords, t in clone.board.grid.items()}
+    for player in clone.players:
+        player.owned_tiles = [tiles.get(id(t), t) for t in player.owned_tiles]
+    clone.robot = BaselineRobot(clone.robot)
+    return clone
+
+
+def fresh_snapshot(game):
+    """A snapshot as taken after a move (an unchanged board would hand back its last one)."""
+    game.board._snapshot = None
+    return game.snapshot()
+
+
+def unslotted_cards(cards):
+    """The cards (and their HydratedCard data) as stand-ins; everything else stays shared."""
+    return [Unslotted(card) for card in cards]
+
+
+def unslotted_pile(pile):
+    """The same pile holding stand-ins for its tiles."""
+    return pile.restore([Unslotted(tile) for tile in pile.items])
+
+
+def measure(build, count: int) -> float:
+    """Average bytes still allocated per object after building 'count' of them."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [build(i) for i in range(count)]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(kept) == count
+    return (after - before) / count
+
+
+def main():
+    game = build_game()
+    deck_size = len(hydrate_json('cards.json'))
+    results = {
+        # Cards are shared by every game; each clone is an independent position
+        "bytes per game (clone)": measure(lambda i: game.clone(), GAMES),
+        "bytes per game (clone, unslotted)": measure(lambda i: baseline_game(game), GAMES),
+        "bytes per game (snapshot)": measure(lambda i: fresh_snapshot(game), GAMES),
+        "bytes per tile pile": measure(lambda i: generate_tile_pile(), GAMES),
+        "bytes per tile pile (unslotted)": measure(lambda i: unslotted_pile(generate_tile_pile()), GAMES),
+        "bytes per card": measure(lambda i: [GameCard(h) for h in hydrate_json('cards.json')], 20) / deck_size,
+        "bytes per card (unslotted)": measure(
+            lambda i: unslotted_cards(GameCard(h) for h in hydrate_json('cards.json')), 20) / deck_size,
+    }
+    for name, value in results.items():
+        print(f"  {name:<32} {value:>10,.0f}")
+    return results
+
+
+if __name__ == '__main__':
+    main()
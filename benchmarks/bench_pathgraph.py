@@ -0,0 +1,62 @@
+"""
+Whole-board path evaluation: pathGraph (NumPy pointer doubling) vs GameBoard.trace
+called once per (cell, facing) state. Also checks that both agree on every state.
+
+Run from the repository root:
+    python -m benchmarks.bench_pathgraph
+"""
+import time
+
+import numpy as np
+
+import pathGraph
+from benchmarks.bench_frontier import fill
+
+RADII = (5, 15, 30)
+STEPS = 1_000
+BATCH = 64
+
+
+def check(board, next_state, steps: int):
+    landed = pathGraph.jump(next_state, steps)
+    for state in range(len(next_state)):
+        coords, facing = pathGraph.decode(board, state)
+        traced = board.trace(coords, facing, steps)
+        assert pathGraph.decode(board, landed[state]) == (traced.location, traced.facing), state
+
+
+def main():
+    print(f"{'radius':>6} {'states':>7} {'trace ms':>10} {'numpy ms':>10} {'speedup':>8} {'batch/board ms':>15}")
+    results = {}
+    for radius in RADII:
+        width = 2 * radius + 1
+        board = fill(radius, width * width // 2)
+        next_state = pathGraph.successors(board)
+        check(board, next_state, STEPS)
+
+        started = time.perf_counter()
+        board.version += 1  # Drop the memo left behind by check()
+        for state in range(len(next_state)):
+            board.trace(*pathGraph.decode(board, state), STEPS)
+        trace_ms = (time.perf_counter() - started) * 1e3
+
+        started = time.perf_counter()
+        pathGraph.jump(pathGraph.successors(board), STEPS)
+        numpy_ms = (time.perf_counter() - started) * 1e3
+
+        boards = [fill(radius, width * width // 2, seed) for seed in range(BATCH)]
+        started = time.perf_counter()
+        stacked = pathGraph.successors_batch(boards)
+        pathGraph.jump(stacked, STEPS)
+        pathGraph.cycle_members(stacked)
+        batch_ms = (time.perf_counter() - started) * 1e3 / BATCH
+        assert np.array_equal(stacked[0], pathGraph.successors(boards[0]))
+
+        results[radius] = (trace_ms, numpy_ms, batch_ms)
+        print(f"{radius:>6} {len(next_state):>7} {trace_ms:>10.2f} {numpy_ms:>10.2f} "
+              f"{trace_ms / numpy_ms:>7.1f}x {batch_ms:>15.2f}")
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Pile microbenchmark: the stack-backed Pile vs the previous list-slicing version.
+
+Run from the repository root:
+    python -m benchmarks.bench_pile
+"""
+import timeit
+from typing import List
+
+from pile import Pile
+
+SIZES = (10, 100, 1_000, 10_000, 100_000)
+
+
+class ListPile:
+    """The original list-backed Pile (top of pile at index 0), kept for comparison."""
+
+    def __init__(self, items: List):
+        self.items = items
+
+    def draw(self, count: int = 1) -> List:
+        drawn = self.items[:count]
+        self.items = self.items[count:]
+        return drawn
+
+    def add_to_top(self, items: List) -> 'ListPile':
+        self.items = [*items, *self.items]
+        return self
+
+    def add_to_bottom(self, items: List) -> 'ListPile':
+        self.items.extend(items)
+        return self
+
+
+def cycle(pile, ops: int):
+    """Draws from the top and pushes straight back, keeping the pile size constant."""
+    for _ in range(ops):
+        pile.add_to_top(pile.draw(1))
+
+
+def main(ops: int = 1_000, repeat: int = 5):
+    print(f"{'size':>8} {'list ns/op':>12} {'stack ns/op':>12} {'speedup':>8}")
+    results = {}
+    for size in SIZES:
+        legacy = ListPile(list(range(size)))
+        current = Pile(range(size))
+        legacy_ns = min(timeit.repeat(lambda: cycle(legacy, ops), repeat=repeat, number=1)) / ops * 1e9
+        current_ns = min(timeit.repeat(lambda: cycle(current, ops), repeat=repeat, number=1)) / ops * 1e9
+        results[size] = (legacy_ns, current_ns)
+        print(f"{size:>8} {legacy_ns:>12.1f} {current_ns:>12.1f} {legacy_ns / current_ns:>7.1f}x")
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,265 @@
+"""
+Benchmark suite for the core hot paths, in the spirit of pyperf: every case is
+calibrated to a loop count that runs for at least MIN_TIME, then timed over several
+repeats. Results go to a JSON file that later runs can be compared against.
+
+Run from the repository root:
+    python -m benchmarks.suite                          # everything, writes bench_results.json
+    python -m benchmarks.suite -k tile_get_exit -o x.json
+    python -m benchmarks.suite --compare baseline.json  # also prints the ratio per case
+"""
+import argparse
+import datetime
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from typing import Callable, Dict, List, Optional, Tuple
+
+from benchmarks.bench_actions import NullGame
+from board import GameBoard
+from cardDecks import CardDecks
+from direction import Direction, Orientation
+from hydrate import hydrate_deck
+from pile import Pile
+from robot import Robot
+from selfplay import POLICIES, load_cards, play_game
+from Tiles.flipTile import FlipTile
+from Tiles.tiles import (
+    StartTile, ReverseTile, MergeTile, QuadMergeTile, ForkTile,
+    TurnTile, CrossroadsTile, DivergeTile, DivergeMergeTile
+)
+from Tiles.tilePile import generate_tile_pile
+
+CARDS_PATH = 'cards.json'
+MIN_TIME = 0.05  # Seconds per timed repeat
+REPEAT = 5
+
+# A case is built by a setup function that returns the callable to time (and how many
+# operations one call performs, so results are reported per operation)
+Case = Callable[[], Tuple[Callable[[], object], int]]
+CASES: Dict[str, Case] = {}
+
+
+def case(name: str):
+    def register(setup: Case) -> Case:
+        CASES[name] = setup
+        return setup
+    return register
+
+
+# --- Piles & Decks ---
+
+@case("pile_draw_add_to_top")
+def _pile_cycle():
+    pile = Pile(range(1_000), random.Random(0))
+
+    def run():
+        for _ in range(100):
+            pile.add_to_top(pile.draw(1))
+    return run, 100
+
+
+@case("deck_draw_with_reshuffle")
+def _deck_draw():
+    decks = CardDecks(load_cards(CARDS_PATH), rng=random.Random(0))
+
+    def run():
+        # 96 cards in 5-card hands: the draw pile runs dry and reshuffles every ~19 draws
+        for _ in range(100):
+            decks.discard(decks.draw(5))
+    return run, 100
+
+
+# --- Board & Tiles ---
+
+@case("board_place_tile_growing")
+def _place_tiles():
+    # Record one random fill of a radius-8 board (289 cells), then replay it on fresh boards
+    rng = random.Random(0)
+    tiles = [t for seed in range(3) for t in generate_tile_pile(random.Random(seed)).items]
+    board = GameBoard(8)
+    placements: List[Tuple[object, Tuple[int, int]]] = []
+    for tile in tiles:
+        if not board.valid_slots:
+            break
+        coords = rng.choice(sorted(board.valid_slots))
+        board.place_tile(tile, coords)
+        placements.append((tile, coords))
+
+    def run():
+        fresh = GameBoard(8)
+        for tile, coords in placements:
+            fresh.place_tile(tile, coords)
+    return run, len(placements)
+
+
+def _tile_case(tile):
+    entries = list(Direction)
+
+    def run():
+        for _ in range(100):
+            for d in entries:
+                tile.get_exit(d)
+    return run, 400
+
+
+_TILES = {
+    "StartTile": lambda: StartTile(None, Orientation.East),
+    "ReverseTile": lambda: ReverseTile(None, Orientation.East),
+    "MergeTile": lambda: MergeTile(None, Orientation.East, Direction.Left),
+    "QuadMergeTile": lambda: QuadMergeTile(None, Orientation.East, Direction.Down),
+    "ForkTile": lambda: ForkTile(None, Orientation.East, Direction.Up),
+    "TurnTile": lambda: TurnTile(None, Orientation.East),
+    "CrossroadsTile": lambda: CrossroadsTile(None, Orientation.East),
+    "DivergeTile": lambda: DivergeTile(None, Orientation.East),
+    "DivergeMergeTile": lambda: DivergeMergeTile(None, Orientation.East, Direction.Left),
+}
+for _name, _make in _TILES.items():
+    case(f"tile_get_exit[{_name}]")(lambda make=_make: _tile_case(make()))
+    case(f"tile_get_exit[FlipTile({_name})]")(lambda make=_make: _tile_case(FlipTile(make())))
+
+
+# --- Robot ---
+
+@case("robot_move_long_path")
+def _robot_move():
+    # A straight corridor ending in a ReverseTile: the robot runs up and down it forever
+    board = GameBoard(10)
+    for y in range(1, 10):
+        board.place_tile(CrossroadsTile(None, Orientation.North), (0, y))
+    board.place_tile(ReverseTile(None, Orientation.North), (0, 10))
+    robot = Robot((0, 0))
+    robot.battery = 1 << 30
+
+    def run():
+        for _ in range(1_000):
+            robot.move(board)
+    return run, 1_000
+
+
+# --- Cards ---
+
+@case("card_execute")
+def _card_execute():
+    # On a game that accepts every call, so each action runs to the end (DirectiveGame
+    # lacks most card APIs, which would time CardFailed handling instead)
+    cards = load_cards(CARDS_PATH)
+    game = NullGame()
+
+    def run():
+        for card in cards:
+            card.execute(game)
+    return run, len(cards)
+
+
+@case("card_execute_eval_baseline")
+def _card_eval():
+    # What every play cost before actions were compiled: eval the lambda source each time,
+    # with the builtins the card lambdas need, on the same game as card_execute
+    cards = load_cards(CARDS_PATH)
+    game = NullGame()
+    sources = [c.data.execute['action']['function'] for c in cards]
+
+    def run():
+        for src in sources:
+            eval(src, {"__builtins__": {"len": len}}, {'g': game})(game)
+    return run, len(sources)
+
+
+@case("hydrate_deck")
+def _hydrate():
+    with open(CARDS_PATH, 'r') as f:
+        text = f.read()
+
+    def run():
+        hydrate_deck(json.loads(text))
+    return run, 1
+
+
+# --- Whole Games ---
+
+@case("full_seeded_game")
+def _full_game():
+    cards = load_cards(CARDS_PATH)
+    seeds = iter(range(1 << 30))
+    policy = POLICIES["random"]
+
+    def run():
+        play_game(cards, next(seeds), 2, policy)
+    return run, 1
+
+
+# --- Runner ---
+
+def measure(setup: Case, repeat: int = REPEAT, min_time: float = MIN_TIME) -> Dict[str, object]:
+    fn, ops = setup()
+    timer = timeit.Timer(fn)
+    loops, _ = timer.autorange()
+    while loops * ops and timer.timeit(loops) < min_time:
+        loops *= 2
+    values = [t / (loops * ops) for t in timer.repeat(repeat=repeat, number=loops)]
+    return {
+        "unit": "seconds per op",
+        "ops_per_call": ops,
+        "loops": loops,
+        "min": min(values),
+        "median": statistics.median(values),
+        "mean": statistics.mean(values),
+        "stdev": statistics.stdev(values) if len(values) > 1 else 0.0,
+        "values": values,
+    }
+
+
+def metadata() -> Dict[str, object]:
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ""
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "commit": commit or None,
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+    }
+
+
+def run_suite(pattern: str = "", repeat: int = REPEAT, min_time: float = MIN_TIME,
+              baseline: Optional[Dict] = None) -> Dict[str, object]:
+    results: Dict[str, object] = {}
+    old = (baseline or {}).get("benchmarks", {})
+    for name, setup in CASES.items():
+        if pattern not in name:
+            continue
+        started = time.perf_counter()
+        result = results[name] = measure(setup, repeat, min_time)
+        line = f"  {name:<38} {result['median'] * 1e9:>14,.1f} ns/op  ±{result['stdev'] / result['median']:6.1%}"
+        if name in old:
+            line += f"  ({old[name]['median'] / result['median']:5.2f}x vs baseline)"
+        print(f"{line}  [{time.perf_counter() - started:.1f}s]")
+    return {"meta": metadata(), "benchmarks": results}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Core hot-path benchmarks.")
+    parser.add_argument('-k', '--filter', default="", help="Only run cases whose name contains this")
+    parser.add_argument('-o', '--output', default='bench_results.json')
+    parser.add_argument('--compare', default=None, help="Earlier results JSON to compare against")
+    parser.add_argument('--repeat', type=int, default=REPEAT)
+    parser.add_argument('--min-time', type=float, default=MIN_TIME)
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)
+
+    report = run_suite(args.filter, args.repeat, args.min_time, baseline)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(report['benchmarks'])} results to {args.output}")
@@ -1,27 +1,106 @@
-from typing import List, Tuple, Dict, Optional, Set
-from Tiles.tile import Tile
+from typing import List, Tuple, Dict, Optional, Set, FrozenSet, Any, NamedTuple
+import copy
+from Tiles.tile import Tile, NO_EXIT
 from Tiles.tiles import StartTile
-from direction import Orientation
+from direction import Direction, Orientation, DELTAS, INVERSE
+from journal import Journal, PLACE, ROTATE, OWNER
+from zobrist import tile_key
 
 # Type alias for cleaner signatures
 Coord = Tuple[int, int]
 
+# ((coords, tile, orientation, ownership, zobrist key), ...), valid_slots,
+# ((slot, ((source, exit), ...)), ...), zobrist
+BoardSnapshot = Tuple[
+    Tuple[Tuple[Coord, Tile, Orientation, Any, int], ...],
+    FrozenSet[Coord],
+    Tuple[Tuple[Coord, Tuple[Tuple[Coord, Direction], ...]], ...],
+    int
+]
+
+class Trace(NamedTuple):
+    """Result of following the tile transitions from a start state."""
+    location: Coord  # Last tile reached
+    facing: Direction
+    steps: int  # Steps actually taken
+    crashed: bool  # True if the path left the board or hit a wall before 'steps'
+
+# Memoized traces kept per board version before the cache is reset
+TRACE_CACHE_LIMIT = 4096
+
+# Packed kind codes: tile class -> small int (0 = empty cell)
+TILE_KINDS: Dict[type, int] = {}
+FLIPPED_KIND = 0x80
+
+_EMPTY_CODES = bytes([NO_EXIT] * 4)
+
+
+def kind_code(tile: Tile) -> int:
+    """Compact code for a tile's class, with FLIPPED_KIND set for mirrored tiles."""
+    base = tile.wrapped_tile if tile._flipped else tile
+    code = TILE_KINDS.get(type(base))
+    if code is None:
+        code = TILE_KINDS[type(base)] = len(TILE_KINDS) + 1
+    return code | FLIPPED_KIND if tile._flipped else code
+
+
 class GameBoard:
-    def __init__(self, max_radius: int = 3):
+    def __init__(self, max_radius: int = 3, dense: bool = False):
         """
         max_radius: Limits the board size. 3 implies a 7x7 grid (Center + 3 in each dir).
+        dense: Also keep the grid as flat arrays indexed by (x + r) * width + (y + r),
+               with packed kind / orientation / owner codes for simulation code.
         """
         self.max_radius = max_radius
+        self.width = 2 * max_radius + 1
+        self.dense = dense
 
         # The central source of truth
-        self.grid: Dict[Coord, Tile] = {
-            (0, 0): StartTile((0, 0), Orientation.North)
-        }
+        self.grid: Dict[Coord, Tile] = {}
+
+        if dense:
+            size = self.width * self.width
+            r = max_radius
+            self.cells: List[Optional[Tile]] = [None] * size
+            self.kinds = bytearray(size)
+            self.orientations = bytearray(size)
+            self.owners = bytearray(size)  # 0 = neutral, see owner_codes
+
+            # Index -> coordinate, and the in-bounds neighbor indices of every cell
+            self.coords_of: List[Coord] = [(i // self.width - r, i % self.width - r) for i in range(size)]
+            self.neighbors: List[Tuple[int, ...]] = [
+                tuple(self.index_of(n) for n in self._get_all_neighbors(c) if self._is_within_bounds(n))
+                for c in self.coords_of
+            ]
+            self.owner_codes: Dict[object, int] = {}
 
         # Optimization: Track empty spots adjacent to placed tiles
         # This makes the UI much faster (don't have to scan the whole grid)
         self.valid_slots: Set[Coord] = set(self._get_all_neighbors((0, 0)))
 
+        # Frontier slot -> {placed neighbor that has a path leaving into it: that exit direction}.
+        # Only slots somebody points into are keys, so 'slot in feeders' is the connected check.
+        self.feeders: Dict[Coord, Dict[Coord, Direction]] = {}
+
+        # Bumped on every change to the layout; trace() results are only reused within a version
+        self.version = 0
+        self._traces: Dict[Tuple[Coord, Direction, int], Trace] = {}
+        self._traces_version = 0
+
+        # XOR of zobrist.tile_key over the placed tiles, kept per coord so changes are O(1)
+        self.zobrist = 0
+        self._tile_keys: Dict[Coord, int] = {}
+
+        # Undo log for placements, rotations and owner changes (see journal.py); off when None
+        self.journal: Optional[Journal] = None
+
+        # Last snapshot(), reused until the board changes (see _changed)
+        self._snapshot: Optional[BoardSnapshot] = None
+
+        self._store(StartTile((0, 0), Orientation.North), (0, 0))
+        self._rekey((0, 0), self.grid[(0, 0)])
+        self._link((0, 0))
+
     def is_valid_location(self, coords: Coord) -> bool:
         """
         Standard Rule:
@@ -52,10 +131,18 @@ class GameBoard:
             raise ValueError(f"Invalid placement at {coords}")
 
         # 1. Update Tile State
+        old_coords = tile.coords
         tile.coords = coords
 
-        # 2. Update Grid State
-        self.grid[coords] = tile
+        # 2. Update Grid State. A forced placement replaces the tile there: drop its
+        # connections and stop it reporting rotations / owner changes to this board.
+        previous = self.grid.get(coords)
+        if previous is not None:
+            self._unlink(coords)
+            previous._observer = None
+        index = self._store(tile, coords)
+        self._rekey(coords, tile)
+        self._changed()
 
         # 3. Update 'Frontier' (Valid Slots)
         # Remove the spot we just filled
@@ -63,12 +150,275 @@ class GameBoard:
             self.valid_slots.remove(coords)
 
         # Add new empty neighbors to the frontier
-        for n_coord in self._get_all_neighbors(coords):
-            if n_coord not in self.grid and self._is_within_bounds(n_coord):
-                self.valid_slots.add(n_coord)
+        if index is not None:
+            cells = self.cells
+            for n in self.neighbors[index]:
+                if cells[n] is None:
+                    self.valid_slots.add(self.coords_of[n])
+        else:
+            for n_coord in self._get_all_neighbors(coords):
+                if n_coord not in self.grid and self._is_within_bounds(n_coord):
+                    self.valid_slots.add(n_coord)
+
+        # 4. Update the connection index. The filled slot stops being a target; the new
+        # slots can only border this tile (older tiles' empty neighbors were already slots).
+        self.feeders.pop(coords, None)
+        self._link(coords)
+
+        if self.journal is not None:
+            self.journal.record(PLACE, self, (tile, old_coords, previous), coords)
+
+    def _unplace(self, coords: Coord, undo: Tuple[Tile, Optional[Coord], Optional[Tile]]):
+        """
+        Exact inverse of place_tile (journal undo). Only the tiles are recorded: the frontier
+        is every empty in-bounds cell next to a tile, so it is worked out again around 'coords'.
+        """
+        tile, old_coords, previous = undo
+
+        self._unlink(coords)
+        if previous is None:
+            del self.grid[coords]
+            self.zobrist ^= self._tile_keys.pop(coords)
+            index = self.index_of(coords) if self.dense else None
+            if index is not None:
+                self.cells[index] = None
+                self.kinds[index] = self.orientations[index] = self.owners[index] = 0
+
+            # Slots only this tile bordered leave the frontier; the cell itself rejoins it
+            # if another tile borders it, fed by their paths into it
+            for slot in self._get_all_neighbors(coords):
+                if slot in self.valid_slots and not self._borders_tile(slot):
+                    self.valid_slots.remove(slot)
+                    self.feeders.pop(slot, None)
+            if self._is_within_bounds(coords) and self._borders_tile(coords):
+                self.valid_slots.add(coords)
+                self._feed(coords)
+        else:
+            self._store(previous, coords)
+            self._rekey(coords, previous)
+            self._link(coords)
+
+        tile.coords = old_coords
+        tile._observer = None
+        self._changed()
+
+    def is_connected_location(self, coords: Coord) -> bool:
+        """A valid slot that at least one placed tile has a path leading into."""
+        return coords in self.feeders
+
+    def connected_slots(self) -> Set[Coord]:
+        """All valid slots with an incoming path."""
+        return set(self.feeders)
+
+    def entry_sides(self, coords: Coord) -> List[Direction]:
+        """The sides of the slot a robot could arrive through, from its placed neighbors."""
+        sources = self.feeders.get(coords)
+        return [INVERSE[d.value] for d in sources.values()] if sources else []
+
+    # --- Search Support ---
+
+    def snapshot(self) -> BoardSnapshot:
+        """
+        The mutable board state: which tile sits where, and each tile's orientation and owner.
+        Tile geometry and transition tables are shared, not copied, and an unchanged board
+        hands back the snapshot it made last time.
+        """
+        if self._snapshot is None:
+            self._snapshot = (
+                tuple((c, t, t.orientation, t.ownership, self._tile_keys[c]) for c, t in self.grid.items()),
+                frozenset(self.valid_slots),
+                tuple((slot, tuple(sources.items())) for slot, sources in self.feeders.items()),
+                self.zobrist
+            )
+        return self._snapshot
+
+    def restore(self, snapshot: BoardSnapshot):
+        """
+        Puts the same tile objects back the way they were when the snapshot was taken.
+        Tiles placed since are left where the snapshot doesn't have them and stop reporting to this board.
+        """
+        entries, valid_slots, feeders, self.zobrist = snapshot
+
+        previous = self.grid
+        self.grid = {}
+        self._tile_keys = {}
+        if self.dense:
+            size = len(self.cells)
+            self.cells = [None] * size
+            self.kinds = bytearray(size)
+            self.orientations = bytearray(size)
+            self.owners = bytearray(size)
+
+        for coords, tile, orientation, ownership, key in entries:
+            tile.coords = coords
+            tile._ownership = ownership  # Quietly: the board is rebuilt below
+            if tile.orientation is not orientation:
+                tile._observer = None  # Likewise; _store re-attaches it
+                tile.orient(orientation)
+            self._store(tile, coords)
+            self._tile_keys[coords] = key
+
+        for tile in previous.values():
+            if self.grid.get(tile.coords) is not tile:
+                tile._observer = None
+
+        self.valid_slots = set(valid_slots)
+        self.feeders = {slot: dict(sources) for slot, sources in feeders}
+        self.version += 1
+        self._snapshot = snapshot
+
+    def rewound(self, snapshot: BoardSnapshot):
+        """
+        Tells the board it is back in the state 'snapshot' was taken in (e.g. after the journal
+        undid everything since), so snapshot() can hand it out again without rebuilding it.
+        """
+        self._snapshot = snapshot
+
+    def clone(self, memo: Dict[int, object]) -> 'GameBoard':
+        """
+        Independent board with its own tile objects (shallow copies sharing geometry).
+        Owners already cloned into 'memo' are swapped in; cloned tiles are added to it.
+        """
+        clone = copy.copy(self)
+        clone.grid = {}
+        clone.valid_slots = set(self.valid_slots)
+        clone._tile_keys = dict(self._tile_keys)
+        clone.feeders = {slot: dict(sources) for slot, sources in self.feeders.items()}
+        clone._traces = {}
+        clone.journal = None
+        clone._snapshot = None
+
+        for coords, tile in self.grid.items():
+            new_tile = tile.clone()
+            new_tile.ownership = memo.get(id(tile.ownership), tile.ownership)
+            new_tile._observer = clone
+            clone.grid[coords] = new_tile
+            memo[id(tile)] = new_tile
+
+        if self.dense:
+            # coords_of / neighbors never change and stay shared
+            clone.cells = [None if t is None else memo[id(t)] for t in self.cells]
+            clone.kinds = bytearray(self.kinds)
+            clone.orientations = bytearray(self.orientations)
+            clone.owners = bytearray(self.owners)
+            clone.owner_codes = {memo.get(id(p), p): code for p, code in self.owner_codes.items()}
+
+        return clone
+
+    def sync_tile(self, coords: Coord):
+        """Refreshes the packed codes of a tile after it was rotated or changed owner."""
+        if self.dense:
+            index = self.index_of(coords)
+            if index is not None and self.cells[index] is not None:
+                self._pack(index, self.cells[index])
 
     # --- Helpers ---
 
+    def _store(self, tile: Tile, coords: Coord) -> Optional[int]:
+        """Writes a tile into the grid (and the dense arrays). Returns its cell index if dense."""
+        self.grid[coords] = tile
+        tile._observer = self
+
+        if not self.dense:
+            return None
+
+        index = self.index_of(coords)
+        if index is not None:
+            self.cells[index] = tile
+            self._pack(index, tile)
+        return index
+
+    def _pack(self, index: int, tile: Tile):
+        self.kinds[index] = kind_code(tile)
+        self.orientations[index] = tile.orientation.value
+
+        owner = tile.ownership
+        if owner is None:
+            self.owners[index] = 0
+        else:
+            code = self.owner_codes.get(owner)
+            if code is None:
+                code = self.owner_codes[owner] = len(self.owner_codes) + 1
+            self.owners[index] = code
+
+    def on_tile_rotated(self, tile: Tile, previous: Orientation):
+        """Called by Tile.orient (and so Tile.rotate) for tiles placed on this board."""
+        self._changed()
+        coords = tile.coords
+        if self.grid.get(coords) is tile:
+            self._unlink(coords)
+            self._link(coords)
+            self._rekey(coords, tile)
+            if self.journal is not None:
+                self.journal.record(ROTATE, tile, previous, tile.orientation)
+        self.sync_tile(coords)
+
+    def on_tile_owner_changed(self, tile: Tile, previous: Any):
+        """Called when a placed tile's ownership is assigned."""
+        self._snapshot = None  # Owners aren't part of the layout, so the version stays
+        coords = tile.coords
+        if self.grid.get(coords) is tile:
+            self._rekey(coords, tile)
+            if self.journal is not None:
+                self.journal.record(OWNER, tile, previous, tile.ownership)
+        self.sync_tile(coords)
+
+    def _changed(self):
+        """The layout changed: cached traces and the last snapshot no longer apply."""
+        self.version += 1
+        self._snapshot = None
+
+    def _rekey(self, coords: Coord, tile: Tile):
+        key = tile_key(coords, tile)
+        self.zobrist ^= self._tile_keys.get(coords, 0) ^ key
+        self._tile_keys[coords] = key
+
+    def _link(self, coords: Coord):
+        """Registers the paths of the tile at 'coords' that leave into frontier slots."""
+        x, y = coords
+        for d in self.grid[coords].transitions.outlets:
+            dx, dy = DELTAS[d.value]
+            slot = (x + dx, y + dy)
+            if slot in self.valid_slots:
+                sources = self.feeders.get(slot)
+                if sources is None:
+                    sources = self.feeders[slot] = {}
+                sources[coords] = d
+
+    def _feed(self, slot: Coord):
+        """Registers the placed neighbors' paths that leave into 'slot' (_link, seen from the slot)."""
+        for source in self._get_all_neighbors(slot):
+            tile = self.grid.get(source)
+            if tile is None:
+                continue
+            x, y = source
+            for d in tile.transitions.outlets:
+                dx, dy = DELTAS[d.value]
+                if (x + dx, y + dy) == slot:
+                    sources = self.feeders.get(slot)
+                    if sources is None:
+                        sources = self.feeders[slot] = {}
+                    sources[source] = d
+
+    def _borders_tile(self, coords: Coord) -> bool:
+        grid = self.grid
+        return any(n in grid for n in self._get_all_neighbors(coords))
+
+    def _unlink(self, coords: Coord):
+        """Drops everything the tile at 'coords' registered with _link."""
+        for slot in self._get_all_neighbors(coords):
+            sources = self.feeders.get(slot)
+            if sources is not None and sources.pop(coords, None) is not None and not sources:
+                del self.feeders[slot]
+
+    def index_of(self, coords: Coord) -> Optional[int]:
+        """Dense cell index of a coordinate, or None if it is outside the board."""
+        x, y = coords
+        r = self.max_radius
+        if abs(x) > r or abs(y) > r:
+            return None
+        return (x + r) * self.width + (y + r)
+
     def _is_within_bounds(self, coords: Coord) -> bool:
         x, y = coords
         return abs(x) <= self.max_radius and abs(y) <= self.max_radius
@@ -84,6 +434,76 @@ class GameBoard:
             (x - 1, y)  # Left (West)
         ]
 
+    # --- Path Simulation ---
+
+    def trace(self, start: Coord, facing: Direction, steps: int) -> Trace:
+        """
+        Follows the robot's path for up to 'steps' moves, exactly as Robot.move would
+        (without the crash penalty and reset). The path is a walk over (coord, facing)
+        states, so once a state repeats the rest is a loop and the final state is read
+        straight off it: any step count costs at most one trip around the cycle.
+        Results are memoized until the board changes.
+        """
+        if self._traces_version != self.version or len(self._traces) >= TRACE_CACHE_LIMIT:
+            self._traces.clear()
+            self._traces_version = self.version
+
+        key = (start, facing, steps)
+        result = self._traces.get(key)
+        if result is not None:
+            return result
+
+        seen: Dict[Tuple[Coord, Direction], int] = {}
+        path: List[Tuple[Coord, Direction]] = []
+        location = start
+        crashed = False
+        step = 0
+
+        while step < steps:
+            state = (location, facing)
+            first = seen.get(state)
+            if first is not None:
+                # path[first:] repeats forever
+                location, facing = path[first + (steps - step) % (step - first)]
+                step = steps
+                break
+            seen[state] = step
+            path.append(state)
+
+            dx, dy = DELTAS[facing.value]
+            next_pos = (location[0] + dx, location[1] + dy)
+            target_tile = self.get_tile_at(next_pos)
+            exit_dir = None if target_tile is None else target_tile.transitions.exits[INVERSE[facing.value].value]
+            if exit_dir is None:
+                crashed = True  # Off-board or wall
+                break
+
+            location = next_pos
+            facing = exit_dir
+            step += 1
+
+        result = self._traces[key] = Trace(location, facing, step, crashed)
+        return result
+
     def get_tile_at(self, coords: Coord) -> Optional[Tile]:
         """Safe getter."""
-        return self.grid.get(coords)
\ No newline at end of file
+        if self.dense:
+            index = self.index_of(coords)
+            if index is not None:
+                return self.cells[index]
+        # Forced placements can land outside the dense area
+        return self.grid.get(coords)
+
+    def pack_transitions(self) -> Tuple[List[Coord], bytes]:
+        """
+        Packs every tile's exit table into one flat buffer for whole-board path evaluation.
+        Tile i (in the order of the returned coords) owns bytes [i*4, i*4 + 4): the exit
+        Direction.value for each entry Direction.value, or NO_EXIT.
+        Dense boards pack every cell in index order, with empty cells all NO_EXIT.
+        """
+        if self.dense:
+            return self.coords_of, b''.join([
+                _EMPTY_CODES if t is None else t.transitions.codes for t in self.cells
+            ])
+        coords = list(self.grid)
+        return coords, b''.join([self.grid[c].transitions.codes for c in coords])
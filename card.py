@@ -1,26 +1,38 @@
 from dataclasses import dataclass
-from game import DirectiveGame
+from typing import TYPE_CHECKING
+
+from actionCache import ActionFunc
+from actionInterpreter import ACTION_INTERPRETER
+from events import CardFailed
 from hydrate import HydratedCard
 
+if TYPE_CHECKING:
+    from game import DirectiveGame
+
 @dataclass
 class GameCard:
     """
     Runtime wrapper for HydratedCard data. 
-    Handles the execution of the 16-bit logic strings.
+    Handles the execution of the 16-bit card actions.
     """
+    # Slotted by hand (dataclass(slots=True) needs Python 3.10). Only 'data' is a dataclass
+    # field, so equality and repr still only look at it; the rest is set by __post_init__.
+    __slots__ = ('data', 'id', 'title', 'color', 'number', '_exec_fn', '_write_fn', '_delete_fn')
+
     data: HydratedCard
 
     def __post_init__(self):
         # Shortcut attributes for easy access
-        self.id = self.data.id
-        self.title = self.data.title
-        self.color = self.data.color
+        self.id: str = self.data.id
+        self.title: str = self.data.title
+        self.color: str = self.data.color
+        self.number: int = self.data.number
 
-        # We pre-compile the lambdas if possible, or store strings
-        # Storing strings is safer for serialization if needed later
-        self._exec_code = self.data.execute['function']
-        self._write_code = self.data.write['function']
-        self._delete_code = self.data.delete['function']
+        # Actions whose params describe them run through the dispatch table; the rest run
+        # their lambda, compiled once. Either way, built once per distinct action and shared.
+        self._exec_fn: ActionFunc = ACTION_INTERPRETER.resolve(self.data.execute['action'])
+        self._write_fn: ActionFunc = ACTION_INTERPRETER.resolve(self.data.write['action'])
+        self._delete_fn: ActionFunc = ACTION_INTERPRETER.resolve(self.data.delete['action'])
 
     def print(self):
         """16-bit terminal visualization."""
@@ -36,25 +48,28 @@ class GameCard:
         print(f"║ W: {self.data.write['text'][:25].ljust(25)} ║")
         print(f"╚{border}╝\033[0m")
 
-    def _run_logic(self, logic_str: str, game_state: DirectiveGame):
+    def _run_logic(self, action_func: ActionFunc, game_state: 'DirectiveGame'):
         """
-        Executes the lambda string with the game state injected as 'g'.
+        Runs a resolved card action with the game state injected as 'g'.
         """
-        context = {'g': game_state}
+        # Effects a card schedules are tagged with it (see DirectiveGame.negate_action)
+        outer = game_state.active_card
+        game_state.active_card = self
         try:
-            # Evaluate the string to get the function, then call it with game_state
-            # Assuming format: "lambda g: g.do_something()"
-            action_func = eval(logic_str, {"__builtins__": None}, context)
             return action_func(game_state)
         except Exception as e:
-            print(f"⚠️ RUNTIME ERROR [{self.id}]: {e}")
+            events = game_state.events
+            if events.subscribers:
+                events.emit(CardFailed(self.id, e))
             return None
+        finally:
+            game_state.active_card = outer
 
-    def execute(self, game: DirectiveGame):
-        return self._run_logic(self._exec_code, game)
+    def execute(self, game: 'DirectiveGame'):
+        return self._run_logic(self._exec_fn, game)
 
-    def write(self, game: DirectiveGame):
-        return self._run_logic(self._write_code, game)
+    def write(self, game: 'DirectiveGame'):
+        return self._run_logic(self._write_fn, game)
 
-    def delete(self, game: DirectiveGame):
-        return self._run_logic(self._delete_code, game)
\ No newline at end of file
+    def delete(self, game: 'DirectiveGame'):
+        return self._run_logic(self._delete_fn, game)
\ No newline at end of file
@@ -1,18 +1,48 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
+import copy
+import random
 from card import GameCard
+from cardSet import bit_of, mask_of
+from events import EventBus, DeckEmpty, DeckReshuffled
+from journal import Journal, FIELD
 from pile import Pile
+from zobrist import zobrist_key
+
+def _draw_key(card: GameCard) -> int:
+    return zobrist_key('draw', card.number)
+
+
+def _discard_key(card: GameCard) -> int:
+    return zobrist_key('discard', card.number)
+
 
 class CardDecks:
-    def __init__(self, all_cards: List[GameCard]):
-        # The Draw Pile
-        self.draw_pile = Pile[GameCard](all_cards).shuffle()
+    def __init__(self, all_cards: List[GameCard], events: Optional[EventBus] = None,
+                 rng: Optional[random.Random] = None):
+        # The Draw Pile (the pile shuffles itself on creation)
+        self.draw_pile = Pile[GameCard](all_cards, rng)
+
+        # The Discard Pile (Starts empty). Reshuffles are dealt by the draw pile.
+        self.discard_pile = Pile[GameCard]([], rng)
+        # Bitset of the discard pile (see cardSet.CardIndex for filters)
+        self.discard_bits = 0
+
+        # Both piles keep an order-sensitive hash for zobrist
+        self.draw_pile.track_hash(_draw_key)
+        self.discard_pile.track_hash(_discard_key)
 
-        # The Discard Pile (Starts empty)
-        self.discard_pile = Pile[GameCard]([])
+        # Status updates go out as structured events (see events.print_event)
+        self.events = EventBus() if events is None else events
+
+        # Undo log (see journal.py); off when None. Use attach_journal to cover the piles too.
+        self.journal: Optional[Journal] = None
+
+    def attach_journal(self, journal: Optional[Journal]):
+        self.journal = self.draw_pile.journal = self.discard_pile.journal = journal
 
     @property
     def remaining(self) -> int:
-        return len(self.draw_pile.items)
+        return len(self.draw_pile)
 
     def draw(self, count: int = 1) -> List[GameCard]:
         """
@@ -35,48 +65,82 @@ class CardDecks:
         """
         Draws a single card. Triggers reshuffle if empty.
         """
-        if not self.draw_pile.items:
+        if not self.draw_pile:
             self._reshuffle_discard_into_draw()
 
         # If still empty after reshuffle attempt, we are out of cards
-        if not self.draw_pile.items:
-            print("⚠️ SYSTEM ALERT: Memory Buffer Empty (No cards left).")
+        if not self.draw_pile:
+            if self.events.subscribers:
+                self.events.emit(DeckEmpty(len(self.discard_pile)))
             return None
 
-        # Helper returns a list, we take the first item
-        result = self.draw_pile.draw(1)
-        return result[0] if result else None
+        return self.draw_pile.draw_one()
 
     def discard(self, cards: List[GameCard]):
         """Moves a list of cards to the discard pile."""
         if not cards:
             return
         self.discard_pile.add_to_top(cards)
+        self._set_discard_bits(self.discard_bits | mask_of(cards))
 
     def discard_one(self, card: GameCard):
         """Moves a single card to the discard pile."""
         self.discard_pile.add_to_top([card])
+        self._set_discard_bits(self.discard_bits | bit_of(card))
 
     def _reshuffle_discard_into_draw(self):
         """
         The 'Cycle' Mechanic:
         Takes discard, shuffles it, becomes the new draw pile.
         """
-        if not self.discard_pile.items:
+        if not self.discard_pile:
             return  # Nothing to recycle
 
-        print("🔄 RECYCLING MEMORY... (Reshuffling Discard to Draw)")
+        if self.events.subscribers:
+            self.events.emit(DeckReshuffled(len(self.discard_pile)))
 
-        # Move items over
-        recyclable = self.discard_pile.draw(len(self.discard_pile.items))
-        self.draw_pile.add_to_bottom(recyclable)
+        # Move items over (one journal entry, however big the discard)
+        self.discard_pile.move_to_bottom(self.draw_pile)
+        self._set_discard_bits(0)
 
         # Shuffle the new main deck
         self.draw_pile.shuffle()
 
+    def _set_discard_bits(self, bits: int):
+        if self.journal is not None and bits != self.discard_bits:
+            self.journal.record(FIELD, self, ('discard_bits', self.discard_bits), bits)
+        self.discard_bits = bits
+
+    # --- Search Support ---
+
+    @property
+    def zobrist(self) -> int:
+        """Hash of both piles' contents, in order."""
+        return self.draw_pile.hash ^ self.discard_pile.hash
+
+    def snapshot(self) -> Tuple:
+        """Both piles, their hashes and shuffle counts (the positions of their shuffle streams)."""
+        return (self.draw_pile.snapshot(), self.discard_pile.snapshot(),
+                self.draw_pile.hash, self.discard_pile.hash,
+                self.draw_pile.shuffles, self.discard_pile.shuffles)
+
+    def restore(self, snapshot: Tuple):
+        draw, discard, draw_hash, discard_hash, self.draw_pile.shuffles, self.discard_pile.shuffles = snapshot
+        self.draw_pile.restore(draw, draw_hash)
+        self.discard_pile.restore(discard, discard_hash)
+        self.discard_bits = mask_of(discard)
+
+    def clone(self, events: Optional[EventBus] = None) -> 'CardDecks':
+        clone = copy.copy(self)
+        clone.draw_pile = self.draw_pile.clone()
+        clone.discard_pile = self.discard_pile.clone()
+        clone.journal = None
+        clone.events = EventBus() if events is None else events
+        return clone
+
     def get_state(self):
         """Diagnostic helper."""
         return {
-            "draw_count": len(self.draw_pile.items),
-            "discard_count": len(self.discard_pile.items)
+            "draw_count": len(self.draw_pile),
+            "discard_count": len(self.discard_pile)
         }
\ No newline at end of file
@@ -1,22 +1,45 @@
 import turtle
 import math
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
+
+import numpy as np
+
+# Pen state and position queries patched while the bounds are active
+PEN_FUNCTIONS = ('pos', 'position', 'xcor', 'ycor', 'isdown', 'penup', 'pu', 'up', 'pendown', 'pd', 'down',
+                 'pencolor', 'pensize', 'width')
+
+# Other turtle calls that read, move or draw at the turtle's position, or change the pen
+# color. While the bounds are active the pending polyline is drawn and the actual turtle is
+# brought to the true position before each one (see _synced).
+SYNCED_FUNCTIONS = ('distance', 'towards', 'dot', 'write', 'stamp', 'begin_fill', 'end_fill', 'color')
+
+# Absolute moves patched to go through the bounded movement (teleport is Python 3.12+)
+MOVE_FUNCTIONS = ('setx', 'sety', 'home', 'teleport')
 
 
 class Bounds(object):
     """
     A context manager for Line Clipping, relying on fast drawing.
-    - All movement updates the actual turtle's position (unclamped).
+    - All movement updates the turtle's true (unclamped) position, which pos() reports.
     - Only the visible segments are drawn, using the color set by the user.
+    - Buffered: contiguous visible segments are collected into one polyline and drawn
+      together when the path leaves the bounds, the pen changes, or the context exits.
+      The actual turtle only catches up with the true position at those points.
     - Stores only the minimal state needed for patching and teardown.
     """
 
-    def __init__(self, xHeight: float, yHeight: float):
-        """Initializes the bounds centered on (0,0)."""
+    def __init__(self, xHeight: float, yHeight: float, buffered: bool = True):
+        """Initializes the bounds centered on (0,0). 'buffered=False' draws every segment as it comes."""
         self.xMin = -xHeight / 2
         self.xMax = xHeight / 2
         self.yMin = -yHeight / 2
         self.yMax = yHeight / 2
+        self.buffered = buffered
+
+        # --- Drawing State (valid inside the context) ---
+        self._pos: Tuple[float, float] = (0.0, 0.0)  # True position
+        self._pen_down = False  # The user's pen state; the actual turtle's pen stays up between draws
+        self._polyline: List[Tuple[float, float]] = []  # Pending visible points, drawn by _flush
 
         # --- MINIMAL STATE TRACKING ---
         self._original_forward = None
@@ -29,6 +52,8 @@ class Bounds(object):
         self._original_penstate = False
         self._original_pendown = None
         self._original_penup = None
+        self._original_pen_functions = {}
+        self._original_synced_functions = {}  # SYNCED_FUNCTIONS and MOVE_FUNCTIONS
         self._original_draw_bounding_box = None
 
     # --- Helper Methods ---
@@ -72,44 +97,179 @@ class Bounds(object):
 
         return ((clipped_x1, clipped_y1), (clipped_x2, clipped_y2))
 
-    def _draw_clipped_segment(self, new_true_pos: Tuple[float, float], old_true_pos: Tuple[float, float]):
+    def clip_segments(self, segments) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Draws the clipped segment using the current user-specified color and
-        then teleports the actual turtle to the new_true_pos to maintain path continuity.
+        Liang-Barsky over a whole batch at once.
+        segments: (N, 4) array of x1, y1, x2, y2.
+        Returns the clipped (N, 4) segments and a boolean mask of the visible ones
+        (rows where the mask is False are meaningless).
         """
-        is_pen_down = turtle.isdown()
-        current_pencolor = turtle.pencolor()
-
-        clipped_segment = self._liang_barsky_clip(old_true_pos, new_true_pos)
+        segments = np.asarray(segments, dtype=float).reshape(-1, 4)
+        x1, y1, x2, y2 = segments.T
+        dx = x2 - x1
+        dy = y2 - y1
 
-        # 1. Draw the segment if visible and pen is down
-        if clipped_segment and is_pen_down:
-            p_start, p_end = clipped_segment
+        # Rows: the four clip edges; columns: segments
+        p = np.stack((-dx, dx, -dy, dy))
+        q = np.stack((x1 - self.xMin, self.xMax - x1, y1 - self.yMin, self.yMax - y1))
 
-            self._original_penup()
-            self._original_goto(p_start)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            u = q / p
+        u1 = np.where(p < 0, u, 0.0).max(axis=0)
+        u2 = np.where(p > 0, u, 1.0).min(axis=0)
 
-            # Draw using the color currently set by the user (current_pencolor)
-            self._original_pendown()
-            # turtle.pencolor(current_pencolor) -- This is already the current color!
-            self._original_goto(p_end)
+        # Parallel to an edge and outside it, or entering after leaving
+        outside = ((p == 0) & (q < 0)).any(axis=0)
+        visible = ~outside & (u1 < u2)
 
-            # Lift pen immediately
-            self._original_penup()
+        clipped = np.column_stack((x1 + u1 * dx, y1 + u1 * dy, x1 + u2 * dx, y1 + u2 * dy))
+        return clipped, visible
 
-        # 2. Teleport the actual turtle to the new *unclamped* position
+    def clip_arc(self, cx: float, cy: float, r: float, start: float, sweep: float) -> List[Tuple[float, float]]:
+        """
+        The visible pieces of an arc around (cx, cy), as (start, sweep) pairs in degrees
+        (angles from the +x axis, positive sweep = counterclockwise). The arc is cut exactly
+        where the circle crosses the bounds' edges: at most eight cuts, whatever the radius.
+        """
+        total = abs(sweep)
+        if total == 0 or r <= 0:
+            return []
+        direction = 1 if sweep > 0 else -1
+
+        # Distance along the arc (in degrees) of every edge crossing
+        cuts = [0.0, total]
+        crossings = []
+        for edge, offset in ((self.xMin, cx), (self.xMax, cx)):
+            c = (edge - offset) / r
+            if -1 < c < 1:
+                a = math.degrees(math.acos(c))
+                crossings += (a, -a)
+        for edge, offset in ((self.yMin, cy), (self.yMax, cy)):
+            s = (edge - offset) / r
+            if -1 < s < 1:
+                a = math.degrees(math.asin(s))
+                crossings += (a, 180 - a)
+        for angle in crossings:
+            t = ((angle - start) * direction) % 360
+            while t < total:
+                if t > 1e-9 and total - t > 1e-9:
+                    cuts.append(t)
+                t += 360  # Arcs longer than a full turn cross every edge again
+        cuts.sort()
+
+        # Keep the pieces whose midpoint is inside, merging neighbors (tangent touches)
+        eps = 1e-9 * max(1.0, r)
+        pieces: List[Tuple[float, float]] = []
+        for t0, t1 in zip(cuts, cuts[1:]):
+            if t1 - t0 <= 1e-9:
+                continue
+            mid = math.radians(start + direction * (t0 + t1) / 2)
+            x, y = cx + r * math.cos(mid), cy + r * math.sin(mid)
+            if self.xMin - eps <= x <= self.xMax + eps and self.yMin - eps <= y <= self.yMax + eps:
+                if pieces and abs(pieces[-1][1] - t0) <= 1e-9:
+                    pieces[-1] = (pieces[-1][0], t1)
+                else:
+                    pieces.append((t0, t1))
+        return [(start + direction * t0, direction * (t1 - t0)) for t0, t1 in pieces]
+
+    # --- Polyline Buffer ---
+
+    def _stroke(self, start: Tuple[float, float], end: Tuple[float, float], continues: bool):
+        """
+        Adds a visible segment to the pending polyline (starting a new one if it doesn't
+        join on). 'continues': the path goes on inside the bounds from 'end'.
+        """
+        line = self._polyline
+        if line and line[-1] != start:
+            self._flush()
+        if not line:
+            line.append(start)
+        line.append(end)
+        if not continues or not self.buffered:
+            self._flush()
+
+    def _flush(self):
+        """Draws the pending polyline in one pen-down run and leaves the actual pen up."""
+        line = self._polyline
+        if not line:
+            return
         self._original_penup()
-        self._original_goto(new_true_pos)
+        self._original_goto(line[0])
+        self._original_pendown()
+        for point in line[1:]:
+            self._original_goto(point)
+        self._original_penup()
+        line.clear()
+
+    def _sync(self):
+        """Draws what is pending and brings the actual turtle (pen up) to the true position."""
+        self._flush()
+        if tuple(self._original_pen_functions['pos']()) != self._pos:
+            self._original_goto(self._pos)
+
+    def _synced(self, original):
+        """Wraps an unpatched turtle call so it sees, and draws at, the true position."""
+        def call(*args, **kwargs):
+            self._sync()
+            result = original(*args, **kwargs)
+            # write(move=True) moves the actual turtle
+            self._pos = tuple(self._original_pen_functions['pos']())
+            return result
+        return call
+
+    def _contains(self, point: Tuple[float, float]) -> bool:
+        return self.xMin <= point[0] <= self.xMax and self.yMin <= point[1] <= self.yMax
+
+    def draw_segments(self, segments):
+        """
+        Draws a batch of (N, 4) segments, clipped, with the current pen color (whatever the
+        pen state). Segments that join end to end are drawn as one polyline.
+        The true position is left where it was.
+        """
+        self._flush()
+        self._draw_segments(segments)
+        self._flush()
 
-        # 3. Restore the user's intended pen state on the actual turtle
-        if is_pen_down:
-            self._original_pendown()
-        # Note: If the user's pen was up, it remains up from the teleport.
+    def _draw_segments(self, segments):
+        """Clips a batch of queued segments in one pass and strokes the visible parts."""
+        segments = np.asarray(segments, dtype=float).reshape(-1, 4)
+        clipped, visible = self.clip_segments(segments)
+
+        # Endpoints already inside are kept exactly, so consecutive segments still join up
+        xs, ys = segments[:, 0::2], segments[:, 1::2]
+        inside = (xs >= self.xMin) & (xs <= self.xMax) & (ys >= self.yMin) & (ys <= self.yMax)
+        clipped[:, :2] = np.where(inside[:, :1], segments[:, :2], clipped[:, :2])
+        clipped[:, 2:] = np.where(inside[:, 1:], segments[:, 2:], clipped[:, 2:])
+
+        for (x1, y1, x2, y2), continues in zip(clipped[visible].tolist(), inside[visible, 1].tolist()):
+            self._stroke((x1, y1), (x2, y2), continues)
+
+    def _draw_clipped_segment(self, new_true_pos: Tuple[float, float], old_true_pos: Tuple[float, float]):
+        """
+        Buffers the visible part of the segment (when the pen is down) and moves the
+        true position on to new_true_pos.
+        """
+        self._pos = new_true_pos
+        if not self._pen_down:
+            return
+
+        new_inside = self._contains(new_true_pos)
+        if new_inside and self._contains(old_true_pos):
+            # The common case: no clipping, extend the polyline
+            self._stroke(old_true_pos, new_true_pos, True)
+            return
+
+        clipped_segment = self._liang_barsky_clip(old_true_pos, new_true_pos)
+        if clipped_segment:
+            p_start, p_end = clipped_segment
+            self._stroke(p_start, new_true_pos if new_inside else p_end, new_inside)
+        else:
+            self._flush()
 
     # --- Bounded Movement Methods ---
 
     def _bounded_forward(self, distance: float):
-        old_true_pos = turtle.pos()
+        old_true_pos = self._pos
         heading = turtle.heading()
 
         new_true_x = old_true_pos[0] + distance * math.cos(math.radians(heading))
@@ -129,44 +289,124 @@ class Bounds(object):
         elif y is None:
             raise ValueError("goto requires both x and y coordinates or a tuple.")
 
-        old_true_pos = turtle.pos()
+        old_true_pos = self._pos
         new_true_pos = (x, y)
 
         self._draw_clipped_segment(new_true_pos, old_true_pos)
 
+    def _bounded_setx(self, x: float):
+        self._bounded_goto(x, self._pos[1])
+
+    def _bounded_sety(self, y: float):
+        self._bounded_goto(self._pos[0], y)
+
+    def _bounded_home(self):
+        self._bounded_goto(0.0, 0.0)
+        self._original_setheading(0)
+
+    def _bounded_teleport(self, x: Optional[float] = None, y: Optional[float] = None, *, fill_gap: bool = False):
+        """Moves without drawing (fill_gap has no effect on the clipped path)."""
+        self._flush()
+        self._pos = (self._pos[0] if x is None else x, self._pos[1] if y is None else y)
+
     def _bounded_circle(self, radius: float, extent: Optional[float] = None, steps: Optional[int] = None):
         """
-        Custom 'circle' method that breaks the arc into small segments and
-        calls the patched forward method for clipping.
+        Custom 'circle' method. The arc is clipped analytically (see clip_arc) and each
+        visible piece is drawn with the original circle, so a fully visible circle is one
+        native arc. An explicit 'steps' still asks for a polygon (see _bounded_polygon).
         """
         if extent is None:
             extent = 360.0
+        if steps is not None:
+            self._bounded_polygon(radius, extent, steps)
+            return
 
-        if steps is None:
-            # Use a fixed number of steps per 360 degrees, scaling for the extent
-            steps = int(abs(extent) / 360.0 * 180)
-            steps = max(steps, 1)  # Ensure at least one step
+        # Turtle geometry: the center is 'radius' to the left (right, if negative)
+        heading = turtle.heading()
+        x, y = self._pos
+        direction = 1 if radius >= 0 else -1
+        r = abs(radius)
+        normal = math.radians(heading + 90)
+        cx, cy = x + radius * math.cos(normal), y + radius * math.sin(normal)
+        start = heading - 90 * direction
+        sweep = extent * direction
+
+        if self._pen_down:
+            self._flush()
+            for piece_start, piece_sweep in self.clip_arc(cx, cy, r, start, sweep):
+                a = math.radians(piece_start)
+                self._original_goto(cx + r * math.cos(a), cy + r * math.sin(a))
+                # Tangent heading; the sign of the radius picks the turning direction
+                self._original_setheading(piece_start + (90 if piece_sweep > 0 else -90))
+                self._original_pendown()
+                self._original_circle(r if piece_sweep > 0 else -r, abs(piece_sweep))
+                self._original_penup()
+
+        # Finish where (and facing the way) the whole arc would have
+        end = math.radians(start + sweep)
+        self._pos = (cx + r * math.cos(end), cy + r * math.sin(end))
+        self._original_setheading(heading + sweep)
+
+    def _bounded_polygon(self, radius: float, extent: float, steps: int):
+        """
+        circle() with an explicit step count: a polygon, queued up front and clipped as
+        one batch (see clip_segments).
+        """
+        steps = max(steps, 1)  # Ensure at least one step
 
         # Calculate the distance and angle for each segment
         arc_length = 2 * math.pi * abs(radius) * (abs(extent) / 360.0)
         segment_length = arc_length / steps
         segment_angle = extent / steps
 
-        # Determine if turning left or right (based on sign of radius)
-        turn_func = turtle.left if radius > 0 else turtle.right
+        # Turning left or right (based on sign of radius)
+        turn = segment_angle if radius > 0 else -segment_angle
+
+        # Heading of each segment: half a turn in, then a full turn after every segment
+        start_heading = turtle.heading()
+        headings = np.radians(start_heading + turn / 2 + turn * np.arange(steps))
+        points = np.empty((steps + 1, 2))
+        points[0] = self._pos
+        points[1:, 0] = points[0, 0] + np.cumsum(segment_length * np.cos(headings))
+        points[1:, 1] = points[0, 1] + np.cumsum(segment_length * np.sin(headings))
+
+        if self._pen_down:
+            self._draw_segments(np.hstack((points[:-1], points[1:])))
 
-        turn_func(segment_angle/2)
+        # Finish where (and facing the way) the step-by-step arc would have
+        self._pos = tuple(points[-1].tolist())
+        self._original_setheading(start_heading + turn * steps)
 
-        # Execute the arc segment by segment
-        for _ in range(steps):
-            # The patched forward method handles the clipped drawing
-            self._bounded_forward(segment_length)
+    # --- Pen State ---
 
-            # The actual turn is executed using the unpatched method
-            # This updates turtle.heading() correctly for the next forward calculation
-            turn_func(segment_angle)
+    def _bounded_pos(self) -> Tuple[float, float]:
+        return self._pos
 
-        turn_func(-segment_angle/2)
+    def _bounded_xcor(self) -> float:
+        return self._pos[0]
+
+    def _bounded_ycor(self) -> float:
+        return self._pos[1]
+
+    def _bounded_isdown(self) -> bool:
+        return self._pen_down
+
+    def _bounded_penup(self):
+        self._flush()
+        self._pen_down = False
+
+    def _bounded_pendown(self):
+        self._pen_down = True
+
+    def _bounded_pencolor(self, *args):
+        if args:
+            self._flush()
+        return self._original_pen_functions['pencolor'](*args)
+
+    def _bounded_pensize(self, *args):
+        if args:
+            self._flush()
+        return self._original_pen_functions['pensize'](*args)
 
     # --- Bounding Box Method ---
 
@@ -175,8 +415,8 @@ class Bounds(object):
         radius = max(0, radius)
 
         # --- State Backup ---
-        isPenDown = turtle.isdown()
-        originalLocation = turtle.pos()
+        # (Position and pen state are the bounded ones, which this doesn't touch)
+        self._flush()
         originalHeading = turtle.heading()
 
         # Calculate bounding box dimensions
@@ -197,23 +437,17 @@ class Bounds(object):
         # Draw the box using original methods
         self._original_setheading(0)  # Start East
 
+        # (The box is the bounds themselves, so nothing needs clipping)
         for _ in range(2):
             self._original_forward(boundingWidth)
-            turtle.circle(radius, 90)
+            self._original_circle(radius, 90)
             self._original_forward(boundingHeight)
-            turtle.circle(radius, 90)
+            self._original_circle(radius, 90)
 
         # --- State Restoration ---
         self._original_penup()
-
-        # Restore position, heading, color, and pensize
-        self._original_goto(originalLocation)
         self._original_setheading(originalHeading)
 
-        # Restore pen state
-        if isPenDown:
-            self._original_pendown()
-
     # --- Context Manager Methods ---
 
     def __enter__(self):
@@ -231,10 +465,19 @@ class Bounds(object):
         self._original_pendown = turtle.pendown
         self._original_penup = turtle.penup
         self._original_circle = turtle.circle
+        self._original_pen_functions = {name: getattr(turtle, name) for name in PEN_FUNCTIONS}
+        self._original_synced_functions = {name: getattr(turtle, name)
+                                           for name in SYNCED_FUNCTIONS + MOVE_FUNCTIONS if hasattr(turtle, name)}
 
         self._original_pencolor = turtle.pencolor()
         self._original_penstate = turtle.isdown()
 
+        # The true position and pen state are tracked here from now on
+        self._pos = tuple(turtle.pos())
+        self._pen_down = self._original_penstate
+        self._polyline = []
+        self._original_penup()
+
         # Monkey-patch Movement
         turtle.forward = self._bounded_forward
         turtle.fd = self._bounded_forward
@@ -246,6 +489,23 @@ class Bounds(object):
         turtle.setposition = self._bounded_goto
         turtle.circle = self._bounded_circle
 
+        # Patch pen state and position queries (pen changes end the pending polyline)
+        turtle.pos = turtle.position = self._bounded_pos
+        turtle.xcor = self._bounded_xcor
+        turtle.ycor = self._bounded_ycor
+        turtle.isdown = self._bounded_isdown
+        turtle.penup = turtle.pu = turtle.up = self._bounded_penup
+        turtle.pendown = turtle.pd = turtle.down = self._bounded_pendown
+        turtle.pencolor = self._bounded_pencolor
+        turtle.pensize = turtle.width = self._bounded_pensize
+
+        # Everything else that depends on the position goes through the true position
+        for name, original in self._original_synced_functions.items():
+            if name in MOVE_FUNCTIONS:
+                setattr(turtle, name, getattr(self, f'_bounded_{name}'))
+            else:
+                setattr(turtle, name, self._synced(original))
+
         # Save and patch boundingbox method
         self._original_draw_bounding_box = getattr(turtle.Turtle, 'boundingbox', None)
         turtle.Turtle.boundingbox = self._bounding_box
@@ -254,6 +514,10 @@ class Bounds(object):
 
     def __exit__(self, exc_type, exc_value, traceback):
         """Teardown: Restores the original Turtle methods and original state."""
+        # Draw what is still pending and bring the actual turtle to the true position
+        self._flush()
+        self._original_goto(self._pos)
+
         # Restore original movement methods
         turtle.forward = self._original_forward
         turtle.fd = self._original_fd
@@ -264,6 +528,10 @@ class Bounds(object):
         turtle.setpos = self._original_setpos
         turtle.setposition = self._original_setposition
         turtle.circle = self._original_circle
+        for name, original in self._original_pen_functions.items():
+            setattr(turtle, name, original)
+        for name, original in self._original_synced_functions.items():
+            setattr(turtle, name, original)
 
         # Restore boundingbox method
         if self._original_draw_bounding_box is None:
@@ -275,7 +543,7 @@ class Bounds(object):
         # Restore final state
         turtle.pencolor(self._original_pencolor)
 
-        # The final position and heading are already correct from the last teleport
+        # The final position and heading are already correct from the teleport above
         if self._original_penstate:
             self._original_pendown()
         else:
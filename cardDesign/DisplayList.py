@@ -0,0 +1,446 @@
+import math
+import struct
+import turtle
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+# A recorded drawing: a flat list of small tuples, replayable to SVG, PNG or a real turtle.
+#   (MOVE, x, y)                              pen-up move
+#   (LINE, x, y)                              pen-down line from the current point
+#   (ARC, cx, cy, r, start, sweep)            arc around (cx, cy) from angle 'start', 'sweep' degrees
+#                                             (positive = counterclockwise); ends at its last point
+#   (PEN, color, width)                       pen style for everything after it
+# Coordinates are turtle coordinates: origin in the middle, y up.
+MOVE = 'M'
+LINE = 'L'
+ARC = 'A'
+PEN = 'P'
+
+Op = Tuple
+
+# Module-level turtle functions the Recorder stands in for while it is installed
+TURTLE_FUNCTIONS = (
+    'pos', 'position', 'xcor', 'ycor', 'heading', 'isdown',
+    'pencolor', 'pensize', 'width',
+    'penup', 'pu', 'up', 'pendown', 'pd', 'down',
+    'setheading', 'seth', 'left', 'lt', 'right', 'rt',
+    'forward', 'fd', 'back', 'backward', 'bk',
+    'goto', 'setpos', 'setposition', 'circle', 'home',
+    'hideturtle', 'showturtle', 'tracer', 'speed', 'update',
+)
+
+# Enough of Tk's color names for the PNG rasterizer; SVG takes any name as-is
+NAMED_COLORS: Dict[str, Tuple[int, int, int]] = {
+    'black': (0, 0, 0), 'white': (255, 255, 255), 'red': (255, 0, 0), 'green': (0, 255, 0),
+    'blue': (0, 0, 255), 'yellow': (255, 255, 0), 'cyan': (0, 255, 255), 'magenta': (255, 0, 255),
+    'orange': (255, 165, 0), 'purple': (160, 32, 240), 'gray': (190, 190, 190), 'grey': (190, 190, 190),
+    'darkgray': (169, 169, 169), 'darkgrey': (169, 169, 169), 'lightgray': (211, 211, 211),
+    'lightgrey': (211, 211, 211), 'gold': (255, 215, 0), 'brown': (165, 42, 42),
+}
+
+
+class DisplayList:
+    def __init__(self):
+        self.ops: List[Op] = []
+
+    def __len__(self) -> int:
+        return len(self.ops)
+
+    def extent(self) -> Tuple[float, float, float, float]:
+        """(xMin, yMin, xMax, yMax) of everything drawn (arcs as their full circle)."""
+        xs, ys = [], []
+        for op in self.ops:
+            if op[0] == ARC:
+                _, cx, cy, r, _, _ = op
+                xs += (cx - r, cx + r)
+                ys += (cy - r, cy + r)
+            elif op[0] != PEN:
+                xs.append(op[1])
+                ys.append(op[2])
+        if not xs:
+            return 0.0, 0.0, 0.0, 0.0
+        return min(xs), min(ys), max(xs), max(ys)
+
+    def _window(self, width: Optional[float], height: Optional[float], margin: float):
+        """The area to export: width x height centered on the origin (like a turtle screen), or the content."""
+        if width is not None and height is not None:
+            return -width / 2, -height / 2, width / 2, height / 2
+        x0, y0, x1, y1 = self.extent()
+        return x0 - margin, y0 - margin, x1 + margin, y1 + margin
+
+    # --- SVG ---
+
+    def to_svg(self, width: Optional[float] = None, height: Optional[float] = None,
+               background: Optional[str] = None, margin: float = 4) -> str:
+        x0, y0, x1, y1 = self._window(width, height, margin)
+        w, h = x1 - x0, y1 - y0
+
+        lines = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{_num(w)}" height="{_num(h)}" '
+                 f'viewBox="{_num(x0)} {_num(-y1)} {_num(w)} {_num(h)}">']
+        if background is not None:
+            lines.append(f'<rect x="{_num(x0)}" y="{_num(-y1)}" width="{_num(w)}" height="{_num(h)}" '
+                         f'fill="{_svg_color(background)}"/>')
+        # Flip y so the paths can stay in turtle coordinates
+        lines.append('<g transform="scale(1,-1)" fill="none" stroke-linecap="round" stroke-linejoin="round">')
+
+        path: List[str] = []
+        color, pen_width = 'black', 1.0
+        current = (0.0, 0.0)  # The pen's position (turtles start at the origin)
+        moved = True  # The path needs an 'M' before the next stroke
+
+        def flush():
+            if path:
+                lines.append(f'<path d="{" ".join(path)}" stroke="{_svg_color(color)}" '
+                             f'stroke-width="{_num(pen_width)}"/>')
+                path.clear()
+
+        for op in self.ops:
+            kind = op[0]
+            if kind == LINE:
+                if moved:
+                    path.append(f"M{_num(current[0])} {_num(current[1])}")
+                    moved = False
+                current = (op[1], op[2])
+                path.append(f"L{_num(op[1])} {_num(op[2])}")
+            elif kind == MOVE:
+                current = (op[1], op[2])
+                moved = True
+            elif kind == ARC:
+                _, cx, cy, r, start, sweep = op
+                # SVG can't draw a full circle as one arc, so split anything past 180 degrees
+                pieces = max(1, math.ceil(abs(sweep) / 180))
+                step = sweep / pieces
+                angle = start
+                sx, sy = _on_circle(cx, cy, r, angle)
+                if moved or not _same(current, (sx, sy)):
+                    path.append(f"M{_num(sx)} {_num(sy)}")
+                    moved = False
+                for _ in range(pieces):
+                    angle += step
+                    ex, ey = _on_circle(cx, cy, r, angle)
+                    path.append(f"A{_num(r)} {_num(r)} 0 0 {1 if sweep > 0 else 0} {_num(ex)} {_num(ey)}")
+                current = (ex, ey)
+            elif kind == PEN:
+                flush()
+                moved = True
+                color, pen_width = op[1], op[2]
+        flush()
+
+        lines.append('</g>')
+        lines.append('</svg>')
+        return "\n".join(lines)
+
+    def write_svg(self, path: str, *args, **kwargs):
+        with open(path, 'w') as f:
+            f.write(self.to_svg(*args, **kwargs))
+
+    # --- PNG ---
+
+    def to_png(self, width: Optional[float] = None, height: Optional[float] = None,
+               scale: float = 1.0, background: str = 'white', margin: float = 4) -> bytes:
+        """Rasterizes the display list (pure Python, no antialiasing) and encodes it as PNG."""
+        x0, y0, x1, y1 = self._window(width, height, margin)
+        canvas = Raster(max(1, round((x1 - x0) * scale)), max(1, round((y1 - y0) * scale)), _rgb(background))
+
+        def to_pixel(x: float, y: float) -> Tuple[int, int]:
+            return round((x - x0) * scale), round((y1 - y) * scale)
+
+        color, radius = (0, 0, 0), 0
+        current = (0.0, 0.0)
+        for op in self.ops:
+            kind = op[0]
+            if kind == LINE:
+                canvas.line(*to_pixel(*current), *to_pixel(op[1], op[2]), color, radius)
+                current = (op[1], op[2])
+            elif kind == MOVE:
+                current = (op[1], op[2])
+            elif kind == ARC:
+                _, cx, cy, r, start, sweep = op
+                # Flatten to chords about two pixels long
+                steps = max(4, math.ceil(abs(math.radians(sweep)) * r * scale / 2))
+                previous = to_pixel(*_on_circle(cx, cy, r, start))
+                for i in range(1, steps + 1):
+                    point = to_pixel(*_on_circle(cx, cy, r, start + sweep * i / steps))
+                    canvas.line(*previous, *point, color, radius)
+                    previous = point
+                current = _on_circle(cx, cy, r, start + sweep)
+            elif kind == PEN:
+                color, radius = _rgb(op[1]), max(0, round(op[2] * scale / 2 - 0.5))
+        return canvas.encode_png()
+
+    def write_png(self, path: str, *args, **kwargs):
+        with open(path, 'wb') as f:
+            f.write(self.to_png(*args, **kwargs))
+
+    # --- Playback ---
+
+    def play(self, target=turtle):
+        """Draws the display list through a turtle (the module or a Turtle instance)."""
+        target.penup()
+        for op in self.ops:
+            kind = op[0]
+            if kind == LINE:
+                target.pendown()
+                target.goto(op[1], op[2])
+            elif kind == MOVE:
+                target.penup()
+                target.goto(op[1], op[2])
+            elif kind == ARC:
+                _, cx, cy, r, start, sweep = op
+                target.penup()
+                target.goto(*_on_circle(cx, cy, r, start))
+                target.setheading(start + (90 if sweep > 0 else -90))
+                target.pendown()
+                target.circle(r if sweep > 0 else -r, abs(sweep))
+            elif kind == PEN:
+                target.pencolor(op[1])
+                target.pensize(op[2])
+        target.penup()
+
+
+class Recorder:
+    """
+    A stand-in for the global turtle module that records into a DisplayList instead of a
+    Tk canvas, so the card art code (which draws through 'turtle.*') runs headless:
+
+        with Recorder() as recorder:
+            with Bounds(600, 960) as bounds:
+                ...
+        recorder.display_list.write_svg('card.svg')
+    """
+
+    def __init__(self, display_list: Optional[DisplayList] = None):
+        self.display_list = DisplayList() if display_list is None else display_list
+        self._x = 0.0
+        self._y = 0.0
+        self._heading = 0.0
+        self._down = True
+        self._color = 'black'
+        self._width = 1.0
+        self._pen_recorded = False
+        self._originals: Dict[str, object] = {}
+
+    # --- Installation ---
+
+    def __enter__(self) -> 'Recorder':
+        for name in TURTLE_FUNCTIONS:
+            self._originals[name] = getattr(turtle, name)
+            setattr(turtle, name, getattr(self, name))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        for name, original in self._originals.items():
+            setattr(turtle, name, original)
+        self._originals.clear()
+        return False
+
+    # --- State ---
+
+    def pos(self) -> Tuple[float, float]:
+        return self._x, self._y
+
+    position = pos
+
+    def xcor(self) -> float:
+        return self._x
+
+    def ycor(self) -> float:
+        return self._y
+
+    def heading(self) -> float:
+        return self._heading
+
+    def isdown(self) -> bool:
+        return self._down
+
+    def pencolor(self, *color):
+        if not color:
+            return self._color
+        self._color = color[0] if len(color) == 1 else tuple(color)
+        self._pen_recorded = False
+
+    def pensize(self, width: Optional[float] = None):
+        if width is None:
+            return self._width
+        self._width = width
+        self._pen_recorded = False
+
+    width = pensize
+
+    def penup(self):
+        self._down = False
+
+    pu = up = penup
+
+    def pendown(self):
+        self._down = True
+
+    pd = down = pendown
+
+    # --- Movement ---
+
+    def setheading(self, angle: float):
+        self._heading = angle % 360
+
+    seth = setheading
+
+    def left(self, angle: float):
+        self._heading = (self._heading + angle) % 360
+
+    lt = left
+
+    def right(self, angle: float):
+        self._heading = (self._heading - angle) % 360
+
+    rt = right
+
+    def goto(self, x, y: Optional[float] = None):
+        if y is None:
+            x, y = x
+        if self._down:
+            self._pen()
+            self.display_list.ops.append((LINE, x, y))
+        else:
+            self.display_list.ops.append((MOVE, x, y))
+        self._x, self._y = x, y
+
+    setpos = setposition = goto
+
+    def forward(self, distance: float):
+        angle = math.radians(self._heading)
+        self.goto(self._x + distance * math.cos(angle), self._y + distance * math.sin(angle))
+
+    fd = forward
+
+    def back(self, distance: float):
+        self.forward(-distance)
+
+    backward = bk = back
+
+    def home(self):
+        self.goto(0.0, 0.0)
+        self._heading = 0.0
+
+    def circle(self, radius: float, extent: Optional[float] = None, steps: Optional[int] = None):
+        """Records one ARC (the turtle's 'steps' polygon approximation is not reproduced)."""
+        if extent is None:
+            extent = 360.0
+        sweep = extent if radius >= 0 else -extent
+        # The center is 'radius' to the turtle's left (to its right for negative radii)
+        normal = math.radians(self._heading + 90)
+        cx = self._x + radius * math.cos(normal)
+        cy = self._y + radius * math.sin(normal)
+        start = self._heading - 90 if radius >= 0 else self._heading + 90
+        end_x, end_y = _on_circle(cx, cy, abs(radius), start + sweep)
+        if self._down:
+            self._pen()
+            self.display_list.ops.append((ARC, cx, cy, abs(radius), start, sweep))
+        else:
+            self.display_list.ops.append((MOVE, end_x, end_y))
+        self._x, self._y = end_x, end_y
+        self._heading = (self._heading + sweep) % 360
+
+    # --- No-ops without a screen ---
+
+    def hideturtle(self):
+        pass
+
+    def showturtle(self):
+        pass
+
+    def tracer(self, *args, **kwargs):
+        pass
+
+    def speed(self, *args):
+        pass
+
+    def update(self):
+        pass
+
+    def _pen(self):
+        """Records the pen style before the first stroke drawn with it."""
+        if not self._pen_recorded:
+            self.display_list.ops.append((PEN, self._color, self._width))
+            self._pen_recorded = True
+
+
+class Raster:
+    """An RGB pixel buffer with just enough drawing for display lists."""
+
+    def __init__(self, width: int, height: int, background: Tuple[int, int, int] = (255, 255, 255)):
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(bytes(background) * (width * height))
+
+    def line(self, x0: int, y0: int, x1: int, y1: int, color: Tuple[int, int, int], radius: int = 0):
+        """Bresenham, stamping a (2 * radius + 1) square brush per pixel for thick pens."""
+        width, height, pixels = self.width, self.height, self.pixels
+        rgb = bytes(color)
+        brush = [(dx, dy) for dx in range(-radius, radius + 1) for dy in range(-radius, radius + 1)]
+
+        dx, dy = abs(x1 - x0), -abs(y1 - y0)
+        sx, sy = (1 if x0 < x1 else -1), (1 if y0 < y1 else -1)
+        err = dx + dy
+        while True:
+            for bx, by in brush:
+                x, y = x0 + bx, y0 + by
+                if 0 <= x < width and 0 <= y < height:
+                    i = (y * width + x) * 3
+                    pixels[i:i + 3] = rgb
+            if x0 == x1 and y0 == y1:
+                return
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x0 += sx
+            if e2 <= dx:
+                err += dx
+                y0 += sy
+
+    def encode_png(self) -> bytes:
+        stride = self.width * 3
+        raw = b''.join(b'\x00' + bytes(self.pixels[y * stride:(y + 1) * stride]) for y in range(self.height))
+
+        def chunk(tag: bytes, data: bytes) -> bytes:
+            return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data))
+
+        header = struct.pack('>IIBBBBB', self.width, self.height, 8, 2, 0, 0, 0)  # 8-bit RGB
+        return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header)
+                + chunk(b'IDAT', zlib.compress(raw, 6)) + chunk(b'IEND', b''))
+
+
+# --- Helpers ---
+
+def _on_circle(cx: float, cy: float, r: float, angle: float) -> Tuple[float, float]:
+    a = math.radians(angle)
+    return cx + r * math.cos(a), cy + r * math.sin(a)
+
+
+def _same(a: Tuple[float, float], b: Tuple[float, float]) -> bool:
+    return abs(a[0] - b[0]) < 1e-6 and abs(a[1] - b[1]) < 1e-6
+
+
+def _num(value: float) -> str:
+    """Short SVG number: two decimals, no trailing zeros."""
+    text = f"{value:.2f}".rstrip('0').rstrip('.')
+    return '0' if text == '-0' else text
+
+
+def _rgb(color) -> Tuple[int, int, int]:
+    """Turtle color (name, '#rrggbb', or an (r, g, b) tuple in 0-1 or 0-255) as 0-255 RGB."""
+    if isinstance(color, str):
+        if color.startswith('#') and len(color) == 7:
+            return int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+        try:
+            return NAMED_COLORS[color.lower().replace(' ', '')]
+        except KeyError:
+            raise ValueError(f"Unknown color {color!r}; use '#rrggbb' or an RGB tuple") from None
+    if all(c <= 1 for c in color):
+        return tuple(round(c * 255) for c in color)
+    return tuple(int(c) for c in color)
+
+
+def _svg_color(color) -> str:
+    if isinstance(color, str):
+        return color
+    return '#%02x%02x%02x' % _rgb(color)
@@ -1,27 +1,23 @@
-from random import randint, random
+from random import Random
+import sys
 import turtle
-from math import sqrt, cos, sin
+from math import sqrt, cos, sin, floor, ceil
+
+import numpy as np
 
 from Bounds import Bounds
+from DisplayList import Recorder
 
-def randbool():
-    return bool(randint(0, 1))
+# Seeds the stream a drawing starts when none is passed in, so a render is repeatable either way
+DEFAULT_SEED = 0
 
-def halfHexagon(center, sideLength):
-    startLocation = (center[0] + sideLength / 2, center[1] - (sideLength * sqrt(3) / 2))
-    turtle.penup()
-    turtle.goto(*startLocation)
-    turtle.pendown()
-    turtle.setheading(60)
-    turtle.forward(sideLength)
-    for i in range(2):
-        turtle.left(60)
-        turtle.forward(sideLength)
+def randbool(rng):
+    return bool(rng.randint(0, 1))
 
-def wiringHead(center, headSize, overlapDetails, start):
+def wiringHead(center, headSize, overlapDetails, start, rng):
     if (overlapDetails[0]):
-        turtle.left(60 * (randint(0, 1) * 2 - 1))
-        return randint(0,1) == 1
+        turtle.left(60 * (rng.randint(0, 1) * 2 - 1))
+        return rng.randint(0,1) == 1
 
     #Initial setup
     isPenDown = turtle.isdown()
@@ -39,29 +35,30 @@ def wiringHead(center, headSize, overlapDetails, start):
 
     if not start:
         # Rotate randomly by 60 degrees and continue
-        turtle.left(60 * (randint(0,1) * 2 - 1))
+        turtle.left(60 * (rng.randint(0,1) * 2 - 1))
     turtle.forward(headSize)
 
     if (isPenDown):
         turtle.pendown()
 
-    return randint(0,1) == 0
+    return rng.randint(0,1) == 0
 
-def addWiring(center, sideLength, overlapDetails, probability=1):
+def addWiring(center, sideLength, overlapDetails, probability=1, rng=None):
+    rng = rng or Random(DEFAULT_SEED)
     hadHead = False
     headSize = sideLength/7
 
     if (probability == 1):
         # Start of wiring - we're not overlapping
         # Choose a wiring head, use that
-        wiringHead(center, headSize, overlapDetails, True)
+        wiringHead(center, headSize, overlapDetails, True, rng)
         hadHead = True
     else:
-        addHead = random() > probability
+        addHead = rng.random() > probability
 
         if addHead:
             # Line might finish - calculate head + done?
-            canContinue = wiringHead(center, headSize, overlapDetails, False)
+            canContinue = wiringHead(center, headSize, overlapDetails, False, rng)
             if not canContinue:
                 return
 
@@ -89,50 +86,80 @@ def addWiring(center, sideLength, overlapDetails, probability=1):
 
     overlapDetails = [not overlapDetails[0] if overlapDetails[1] else overlapDetails[0], overlapDetails[1]]
 
-    addWiring(position, sideLength, overlapDetails, probability)
+    addWiring(position, sideLength, overlapDetails, probability, rng)
 
-def calculateHoneycombCenters(center, sideLength, bounds):
-    offsets = (sideLength*3, sideLength*sqrt(3))
+def honeycombLattice(center, sideLength, bounds, margin=1):
+    """
+    Centers of the flat-topped hexagons covering the bounds (plus 'margin' cells all round),
+    as an (N, 2) array. Columns are 1.5 sides apart and every other column is shifted up
+    half a cell; the lattice is aligned on 'center' the way it always has been.
+    """
+    halfHeight = sideLength * sqrt(3) / 2
+    columnWidth = sideLength * 1.5
 
+    # Phase of the lattice: column 0 / row 0 of the original centered grid
     width = int((bounds.xMax - bounds.xMin)//(sideLength*3) + 2)
     height = int((bounds.yMax - bounds.yMin)//(sideLength*sqrt(3)) + 2)
+    x0 = center[0] - sideLength*3/4 - sideLength*3*(width - 1)/2
+    y0 = center[1] - halfHeight*(2*height - 1)/2
 
-    def calculateCenters(offset, center, number):
-        iRange = [x * offset for x in range(number)]
-        maxIRange = max(iRange)
-        iRange = [x - (maxIRange/2) + center for x in iRange]
-        return iRange
-
-    iRange = calculateCenters(offsets[0], center[0] - (offsets[0]/4), width)
-    i2Range = calculateCenters(offsets[0], center[0] + (offsets[0]/4), width)
-    jRange = calculateCenters(offsets[1]/2, center[1], height*2)
-
-    centers = [(i,j) for i in iRange for j in jRange[::2]] + [(i,j) for i in i2Range for j in jRange[1::2]]
+    pad = margin * 2 * sideLength
+    columns = np.arange(floor((bounds.xMin - pad - x0)/columnWidth), ceil((bounds.xMax + pad - x0)/columnWidth) + 1)
+    rows = np.arange(floor((bounds.yMin - pad - y0)/(2*halfHeight)), ceil((bounds.yMax + pad - y0)/(2*halfHeight)) + 1)
+    c, r = np.meshgrid(columns, rows, indexing='ij')
+    xs = x0 + columnWidth*c
+    ys = y0 + halfHeight*(2*r + (c & 1))
+    return np.column_stack((xs.ravel(), ys.ravel()))
 
-    return centers
+def calculateHoneycombCenters(center, sideLength, bounds):
+    """Centers of the hexagons that show inside the bounds."""
+    centers = honeycombLattice(center, sideLength, bounds)
+    halfHeight = sideLength * sqrt(3) / 2
+    x, y = centers[:, 0], centers[:, 1]
+    visible = ((x >= bounds.xMin - sideLength) & (x <= bounds.xMax + sideLength)
+               & (y >= bounds.yMin - halfHeight) & (y <= bounds.yMax + halfHeight))
+    return [tuple(c) for c in centers[visible].tolist()]
+
+def honeycombEdges(center, sideLength, bounds):
+    """
+    Every visible edge of the honeycomb exactly once, as an (N, 4) array of x1, y1, x2, y2.
+    Each cell owns the three edges of its right half (lower-right, upper-right, top), which
+    between them cover every edge of the lattice; the other three belong to its neighbors.
+    A cell's three edges are consecutive and join end to end, so they draw as one polyline.
+    """
+    centers = honeycombLattice(center, sideLength, bounds)
+    halfHeight = sideLength * sqrt(3) / 2
+    x, y = centers[:, :1], centers[:, 1:]
+
+    # Lower-right vertex -> right vertex -> upper-right vertex -> upper-left vertex
+    xs = np.hstack((x + sideLength/2, x + sideLength, x + sideLength/2, x - sideLength/2))
+    ys = np.hstack((y - halfHeight, y, y + halfHeight, y + halfHeight))
+    edges = np.stack((xs[:, :-1], ys[:, :-1], xs[:, 1:], ys[:, 1:]), axis=-1).reshape(-1, 4)
+
+    _, visible = bounds.clip_segments(edges)
+    return edges[visible]
 
 def Honeycomb(self, center, sideLength, bounds):
     centers = calculateHoneycombCenters(center, sideLength, bounds)
-
-    for center in centers:
-        halfHexagon(center, sideLength)
+    bounds.draw_segments(honeycombEdges(center, sideLength, bounds))
 
     return (centers, sideLength)
 
-def HoneycombWiring(self, centers, sideLength, density=None):
+def HoneycombWiring(self, centers, sideLength, density=None, rng=None):
+    rng = rng or Random(DEFAULT_SEED)
     density = density or 1
     for i in range(int(sqrt(len(centers)) * density)):
-        centerToUse = centers[randint(0, len(centers) - 1)]
+        centerToUse = centers[rng.randint(0, len(centers) - 1)]
         # We can use either the center exactly,
         # or use one of the 6 points equidistant from the midpoint of the hexagon line and the center
         # or use one of the 6 points equidistant from the end of the hexagon line and the center
         # We triple the odds of the center since it looks nice
-        whichToUse = randint(0,4)
-        angleForWiring = randint(0,5) * 60
+        whichToUse = rng.randint(0,4)
+        angleForWiring = rng.randint(0,5) * 60
         if (whichToUse < 2):
             # midpoint
             distanceFromCenter = sideLength * sqrt(3) / 4
-            angleFromCenter = randint(0,5)*60 + 30
+            angleFromCenter = rng.randint(0,5)*60 + 30
             xDelta = cos(angleFromCenter) * distanceFromCenter
             yDelta = sin(angleFromCenter) * distanceFromCenter
             center = [centerToUse[0] + xDelta, centerToUse[1] + yDelta]
@@ -140,7 +167,7 @@ def HoneycombWiring(self, centers, sideLength, density=None):
         elif (whichToUse < 4):
             # end
             distanceFromCenter = sideLength / 2
-            angleFromCenter = randint(0, 5) * 60
+            angleFromCenter = rng.randint(0, 5) * 60
             xDelta = cos(angleFromCenter) * distanceFromCenter
             yDelta = sin(angleFromCenter) * distanceFromCenter
             center = [centerToUse[0] + xDelta, centerToUse[1] + yDelta]
@@ -151,18 +178,33 @@ def HoneycombWiring(self, centers, sideLength, density=None):
             overlapsLine = (False, True)
 
             #TODO :FIX THE DAMN CENTRE LOGIC - THE CIRCLES DON'T ALIGN
-        angleForWiring = randint(0,5)*60
+        angleForWiring = rng.randint(0,5)*60
         turtle.setheading(angleForWiring)
         turtle.penup()
         turtle.goto(*center)
 
-        addWiring(center, sideLength, overlapsLine)
+        addWiring(center, sideLength, overlapsLine, rng=rng)
 
 turtle.Turtle.honeycomb = Honeycomb
 turtle.Turtle.addwiring = HoneycombWiring
 
+def renderCard(rng=None):
+    """Draws the card background through whatever 'turtle' currently is (Tk or a Recorder)."""
+    with Bounds(600, 960) as bounds:
+        honeycomb = Honeycomb(None, (0,0), 36, bounds)
+        bounds._bounding_box(30)
+        HoneycombWiring(None, *honeycomb, rng=rng)
+
 # --- Main Execution Block ---
-if __name__ == '__main__':
+if __name__ == '__main__' and len(sys.argv) > 1:
+    # Headless: python Honeycomb.py card.svg (or card.png)
+    with Recorder() as recorder:
+        renderCard()
+    if sys.argv[1].endswith('.png'):
+        recorder.display_list.write_png(sys.argv[1], 600, 960)
+    else:
+        recorder.display_list.write_svg(sys.argv[1], 600, 960, background='white')
+elif __name__ == '__main__':
     # 1. Setup Screen
     screen = turtle.Screen()
     screen.setup(width=800, height=1000)
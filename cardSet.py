@@ -0,0 +1,126 @@
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from card import GameCard
+
+
+def bit_of(card: GameCard) -> int:
+    """The card's bit (1 << card number)."""
+    number = card.number
+    if number < 0:
+        raise ValueError(f"Card {card.id} has no deck number; load the deck through hydrate to number it")
+    return 1 << number
+
+
+def mask_of(cards: Iterable[GameCard]) -> int:
+    """Bitset of the cards' dense numbers (bit n = card number n)."""
+    bits = 0
+    for card in cards:
+        bits |= bit_of(card)
+    return bits
+
+
+class CardSet(list):
+    """
+    A plain list of cards (hand, program) that also keeps the bitset of its members,
+    so membership is a bit test and color / title filters are popcounts (see CardIndex).
+    Cards are physical and unique, so a card is never in the same set twice.
+    """
+    __slots__ = ('bits',)
+
+    def __init__(self, cards: Iterable[GameCard] = ()):
+        super().__init__(cards)
+        self.bits = mask_of(self)
+
+    def __contains__(self, card) -> bool:
+        number = getattr(card, 'number', -1)
+        if number < 0:
+            return super().__contains__(card)
+        return bool(self.bits >> number & 1)
+
+    def append(self, card: GameCard):
+        bit = bit_of(card)
+        super().append(card)
+        self.bits |= bit
+
+    def insert(self, index: int, card: GameCard):
+        bit = bit_of(card)
+        super().insert(index, card)
+        self.bits |= bit
+
+    def extend(self, cards: Iterable[GameCard]):
+        cards = list(cards)
+        bits = mask_of(cards)
+        super().extend(cards)
+        self.bits |= bits
+
+    def __iadd__(self, cards: Iterable[GameCard]) -> 'CardSet':
+        self.extend(cards)
+        return self
+
+    def remove(self, card: GameCard):
+        super().remove(card)
+        self.bits &= ~(1 << card.number)
+
+    def pop(self, index: int = -1) -> GameCard:
+        card = super().pop(index)
+        self.bits &= ~(1 << card.number)
+        return card
+
+    def clear(self):
+        super().clear()
+        self.bits = 0
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self.bits = mask_of(self)
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self.bits = mask_of(self)
+
+    def copy(self) -> 'CardSet':
+        return CardSet(self)
+
+
+class CardIndex:
+    """
+    The deck's card numbering: card n <-> bit n, plus per-color and per-title masks.
+    Numbers come from hydration order (HydratedCard.number). The cards given may be
+    any part of the deck; numbers they don't use are simply empty.
+    """
+
+    def __init__(self, cards: Sequence[GameCard]):
+        self.cards: List[Optional[GameCard]] = [None] * (max((c.number for c in cards), default=-1) + 1)
+        self.color_masks: Dict[str, int] = {}
+        self.title_masks: Dict[str, int] = {}
+
+        for card in cards:
+            n = card.number
+            if n < 0 or self.cards[n] is not None:
+                raise ValueError(f"Card {card.id} has number {n}; load the deck through hydrate for unique numbers")
+            self.cards[n] = card
+            self.color_masks[card.color] = self.color_masks.get(card.color, 0) | 1 << n
+            self.title_masks[card.title] = self.title_masks.get(card.title, 0) | 1 << n
+
+    def to_cards(self, bits: int) -> List[GameCard]:
+        """The object view of a bitset, in card-number order."""
+        cards = []
+        while bits:
+            low = bits & -bits
+            cards.append(self.cards[low.bit_length() - 1])
+            bits ^= low
+        return cards
+
+    # --- Filters (all take a bitset, e.g. CardSet.bits or CardDecks.discard_bits) ---
+
+    def count_color(self, bits: int, color: str) -> int:
+        return bin(bits & self.color_masks.get(color, 0)).count('1')
+
+    def has_color(self, bits: int, color: str) -> bool:
+        return bool(bits & self.color_masks.get(color, 0))
+
+    def of_color(self, bits: int, color: str) -> List[GameCard]:
+        return self.to_cards(bits & self.color_masks.get(color, 0))
+
+    def has_title(self, bits: int, title: str) -> bool:
+        return bool(bits & self.title_masks.get(title, 0))
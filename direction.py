@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Tuple
 
 class Direction(Enum):
     Up = 0
@@ -17,3 +18,12 @@ class Orientation(Enum):
 
     def rotate(self, clockwise: bool):
         return Orientation((self.value + 1 if clockwise else self.value - 1) % 4)
+
+
+# Grid offsets, indexed by Direction.value (Up, Left, Down, Right)
+DELTAS: Tuple[Tuple[int, int], ...] = ((0, 1), (-1, 0), (0, -1), (1, 0))
+
+# The opposite side, indexed by Direction.value.
+# (Value + 2) % 4 works for both Clockwise and Counter-Clockwise
+# as long as opposites are spaced by 2.
+INVERSE: Tuple[Direction, ...] = tuple(Direction((v + 2) % 4) for v in range(4))
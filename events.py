@@ -0,0 +1,72 @@
+from typing import Callable, List, NamedTuple
+
+from board import Coord
+from direction import Direction
+
+# --- EVENT PAYLOADS ---
+
+class RobotMoved(NamedTuple):
+    location: Coord
+    facing: Direction
+
+class RobotCrashed(NamedTuple):
+    location: Coord  # The coordinate the robot tried to move into
+    reason: str  # 'off_board' or 'wall'
+
+class SystemReset(NamedTuple):
+    location: Coord  # Where the robot was reset to
+
+class DeckReshuffled(NamedTuple):
+    cards: int  # Cards moved from discard to draw
+
+class DeckEmpty(NamedTuple):
+    discard_count: int
+
+class CardFailed(NamedTuple):
+    card_id: str
+    error: Exception
+
+EventHandler = Callable[[NamedTuple], None]
+
+
+class EventBus:
+    """
+    Structured event sink for the game.
+    Emitters check 'subscribers' before building a payload, so with nobody
+    listening an event costs a single truthiness test.
+    """
+
+    def __init__(self):
+        self.subscribers: List[EventHandler] = []
+
+    def subscribe(self, handler: EventHandler) -> EventHandler:
+        self.subscribers.append(handler)
+        return handler
+
+    def unsubscribe(self, handler: EventHandler):
+        self.subscribers.remove(handler)
+
+    def emit(self, event: NamedTuple):
+        for handler in self.subscribers:
+            handler(event)
+
+
+# --- CONSOLE OUTPUT (Opt-in) ---
+
+def print_event(event: NamedTuple):
+    """The classic emoji status lines. Subscribe this to an EventBus to get them back."""
+    if isinstance(event, RobotMoved):
+        print(f"🤖 MOVED: {event.location} | Facing: {event.facing.name}")
+    elif isinstance(event, RobotCrashed):
+        if event.reason == 'off_board':
+            print(f"⚠️ CRASH: Robot moved off-board at {event.location}")
+        else:
+            print(f"⚠️ CRASH: Robot hit a wall at {event.location}")
+    elif isinstance(event, SystemReset):
+        print("🔄 SYSTEM RESET INITIATED...")
+    elif isinstance(event, DeckReshuffled):
+        print("🔄 RECYCLING MEMORY... (Reshuffling Discard to Draw)")
+    elif isinstance(event, DeckEmpty):
+        print("⚠️ SYSTEM ALERT: Memory Buffer Empty (No cards left).")
+    elif isinstance(event, CardFailed):
+        print(f"⚠️ RUNTIME ERROR [{event.card_id}]: {event.error}")
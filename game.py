@@ -1,19 +1,174 @@
-from typing import List
-from board import GameBoard
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import copy
+import random
+
+from board import GameBoard, BoardSnapshot
 from card import GameCard
 from cardDecks import CardDecks
+from cardSet import CardIndex
+from events import CardFailed, EventBus, RobotMoved
+from journal import Journal
 from player import Player
+from rng import SavedStream, derive_saved_stream, derive_stream, copy_stream, stream_state
 from robot import Robot
+from scheduler import EffectScheduler, Effect, Scheduled, SchedulerSnapshot
+from zobrist import zobrist_key
+
+# Default number of entries kept in the game's undo journal before the oldest are dropped
+JOURNAL_CAPACITY = 4096
+
+
+class GameSnapshot(NamedTuple):
+    """Everything mutable about a game. Cards and tile geometry are shared, never copied."""
+    board: BoardSnapshot
+    robot: Tuple
+    players: Tuple[Tuple, ...]
+    card_decks: Tuple
+    current_player_idx: int
+    battery_max: int
+    pc: int
+    scheduler: SchedulerSnapshot
+    rng: Tuple                               # game.rng.getstate() (see rng.stream_state)
+    card_rngs: Tuple[Tuple[str, Tuple], ...]  # (card id, getstate()) for each card stream in use
+    journal: Tuple[int, object]              # game.journal.anchor(), for restoring by undo
 
 
 class DirectiveGame:
-    def __init__(self, cards: List[GameCard], noPlayers: int):
-        self.board = GameBoard(5, 5)
-        self.robot = Robot((2, 2))
+    def __init__(self, cards: List[GameCard], noPlayers: int, seed: Optional[int] = None,
+                 journal_capacity: int = JOURNAL_CAPACITY):
+        # One event stream for the whole game; attach events.print_event for console output
+        self.events = EventBus()
+
+        # Every random stream in the game derives from this, so a seed replays exactly
+        self.seed = random.getrandbits(64) if seed is None else seed
+        self.rng = derive_saved_stream(self.seed, 'game')
+        self._card_rngs: Dict[str, random.Random] = {}
+
+        # Dense card numbers and color / title masks for bitset filters over hands and piles
+        self.card_index = CardIndex(cards)
+
+        # One undo log for the robot, board and piles: game.journal.mark() / undo_to(mark)
+        # take back moves without a snapshot. Hands, scores and pending effects are not in it.
+        # 'journal_capacity' bounds how far back it reaches (and its memory).
+        self.journal = Journal(journal_capacity)
+
+        self.board = GameBoard(5)
+        self.robot = Robot((2, 2), events=self.events, journal=self.journal)
         self.players = [Player(f"Player {str(i)}") for i in range(noPlayers)]
-        self.card_decks = CardDecks(cards)
+        self.card_decks = CardDecks(cards, events=self.events, rng=self.stream('deck'))
+        self.board.journal = self.journal
+        self.card_decks.attach_journal(self.journal)
         self.current_player_idx = 0
         self.battery_max = 20
+        self.pc = 0  # Program counter: position in the current player's program
+
+        # Pending card effects (queue_event / add_trigger / queue_multiplier), fired by event type
+        self.scheduler = EffectScheduler()
+        self.active_card: Optional[GameCard] = None  # Set while a card action runs (see GameCard)
+        self._hooked_bus = False
+
+    # --- Search Support ---
+
+    def snapshot(self) -> GameSnapshot:
+        """Cheap, immutable record of the game state for make/unmake style search."""
+        return GameSnapshot(
+            self.board.snapshot(),
+            self.robot.snapshot(),
+            tuple(p.snapshot() for p in self.players),
+            self.card_decks.snapshot(),
+            self.current_player_idx,
+            self.battery_max,
+            self.pc,
+            self.scheduler.snapshot(),
+            stream_state(self.rng),
+            tuple((card_id, stream_state(r)) for card_id, r in self._card_rngs.items()),
+            self.journal.anchor()
+        )
+
+    def restore(self, snapshot: GameSnapshot):
+        """
+        Rewinds this game (and the same component objects, RNG streams included) to a snapshot.
+        While the journal still reaches back to it, the board, robot and piles are put back by
+        undoing the changes since, which costs what changed rather than the whole board; the
+        undone changes are dropped. Otherwise they are rebuilt from the snapshot and the journal is cleared.
+        """
+        if self.journal.rewind(snapshot.journal):
+            self.board.rewound(snapshot.board)
+        else:
+            self.journal.clear()
+            self.board.restore(snapshot.board)
+            self.robot.restore(snapshot.robot)
+            self.card_decks.restore(snapshot.card_decks)
+        for player, player_snapshot in zip(self.players, snapshot.players):
+            player.restore(player_snapshot)
+        self.current_player_idx = snapshot.current_player_idx
+        self.battery_max = snapshot.battery_max
+        self.pc = snapshot.pc
+        self.scheduler.restore(snapshot.scheduler)
+
+        # Streams are rewound too, so play after a restore replays exactly. Card streams
+        # first used after the snapshot are dropped and re-derived from the seed when needed.
+        self.rng.setstate(snapshot.rng)
+        card_rngs = {}
+        for card_id, state in snapshot.card_rngs:
+            card_rng = self._card_rngs.get(card_id) or SavedStream()
+            card_rng.setstate(state)
+            card_rngs[card_id] = card_rng
+        self._card_rngs = card_rngs
+
+    @property
+    def zobrist(self) -> int:
+        """
+        64-bit hash of the position for transposition tables (see zobrist.py).
+        Board and piles are maintained incrementally as they change; the robot,
+        turn and players are a handful of key lookups.
+        """
+        h = self.board.zobrist ^ self.robot.zobrist ^ self.card_decks.zobrist
+        h ^= zobrist_key('turn', self.current_player_idx, self.pc, self.battery_max)
+        for seat, player in enumerate(self.players):
+            h ^= player.zobrist(seat)
+        return h
+
+    def clone(self) -> 'DirectiveGame':
+        """
+        Independent copy of the game for branching.
+        Only mutable state is copied; cards and tile geometry are shared.
+        The clone gets its own (empty) event bus and journal.
+        """
+        clone = copy.copy(self)
+        clone.events = EventBus()
+        clone.journal = Journal(self.journal.capacity)
+        clone.rng = copy_stream(self.rng)
+        clone._card_rngs = {card_id: copy_stream(r) for card_id, r in self._card_rngs.items()}
+
+        # Players and tiles point at each other: clone players, then the board
+        # (which picks up the new owners), then re-point the owned tiles.
+        memo: Dict[int, object] = {}
+        clone.players = [p.clone(memo) for p in self.players]
+        clone.board = self.board.clone(memo)
+        for player in clone.players:
+            player.owned_tiles = [memo.get(id(t), t) for t in player.owned_tiles]
+        clone.robot = self.robot.clone(clone.events, clone.journal)
+        clone.card_decks = self.card_decks.clone(clone.events)
+        clone.board.journal = clone.journal
+        clone.card_decks.attach_journal(clone.journal)
+        clone.scheduler = self.scheduler.clone()
+        if self._hooked_bus:
+            clone.events.subscribe(clone._on_bus_event)
+        return clone
+
+    # --- Randomness ---
+
+    def stream(self, label: str) -> random.Random:
+        """A fresh RNG for a named part of this game (e.g. 'tiles'), derived from the game seed."""
+        return derive_stream(self.seed, label)
+
+    def card_rng(self, card: GameCard) -> random.Random:
+        """Card-local randomness, seeded from the card's own 'seed' in cards.json."""
+        card_rng = self._card_rngs.get(card.id)
+        if card_rng is None:
+            card_rng = self._card_rngs[card.id] = derive_saved_stream(self.seed, 'card', card.data.seed)
+        return card_rng
 
     @property
     def current_player(self) -> Player:
@@ -32,4 +187,91 @@ class DirectiveGame:
         for p in self.players:
             # Add bonus for tile count, etc.
             p.score += len(p.owned_tiles)
-        return {p.name: p.score for p in self.players}
\ No newline at end of file
+        self.fire('post_score')
+        return {p.name: p.score for p in self.players}
+
+    # --- Scheduled Effects ---
+    # Card lambdas chain these, so they return the game.
+
+    def queue_event(self, event_type: str, effect: Effect, priority: int = 0):
+        """Runs 'effect' once, the next time 'event_type' fires."""
+        self._hook(event_type)
+        self.scheduler.schedule(event_type, effect, priority, self._effect_tags('event'), source=self._source())
+        return self
+
+    def add_trigger(self, event_type: str, effect: Effect, priority: int = 0):
+        """Runs 'effect' every time 'event_type' fires, until negated."""
+        self._hook(event_type)
+        self.scheduler.schedule(event_type, effect, priority, self._effect_tags('trigger'), persistent=True,
+                                source=self._source())
+        return self
+
+    def queue_multiplier(self, target: str = 'next', val: int = 2):
+        """Doubles (etc.) the next card ('next') or the whole stack ('stack'); see take_multiplier."""
+        self.scheduler.schedule(f"multiplier_{target}", val, 0, self._effect_tags('multiplier'), source=self._source())
+        return self
+
+    def take_multiplier(self, target: str = 'next') -> int:
+        """Consumes the pending multipliers for 'target' and returns their product (1 if none)."""
+        product = 1
+        for entry in self.scheduler.take(f"multiplier_{target}"):
+            product *= entry.effect
+        return product
+
+    def trigger_adjacent_write(self):
+        """Queues the Write actions of the program cards either side of the program counter."""
+        program = self.current_player.program
+        for position in (self.pc - 1, self.pc + 1):
+            if 0 <= position < len(program):
+                self.queue_event('post_activation', program[position].write)
+        return self
+
+    def negate_action(self, target: str):
+        """
+        Cancels pending effects tagged 'target': an event type ('exit'), a kind ('trigger'),
+        a card color ('Red'), a color's triggers ('Yellow_reaction') or a card id. If nothing
+        matches yet, the next matching effect is cancelled when it is scheduled.
+        """
+        self.scheduler.negate(target)
+        return self
+
+    def fire(self, event_type: str) -> int:
+        """
+        Runs the effects waiting for 'event_type'. Returns how many ran.
+        Like a card action, an effect that raises is reported as CardFailed and skipped.
+        """
+        return self.scheduler.fire(event_type, self, self._effect_failed)
+
+    def _effect_failed(self, entry: Scheduled, error: Exception):
+        events = self.events
+        if events.subscribers:
+            events.emit(CardFailed(entry.source, error))
+
+    def _source(self) -> str:
+        card = self.active_card
+        return '' if card is None else card.id
+
+    def _effect_tags(self, kind: str) -> Tuple[str, ...]:
+        card = self.active_card
+        if card is None:
+            return (kind,)
+        if kind == 'trigger':
+            return kind, card.id, card.color, f"{card.color}_reaction"
+        return kind, card.id, card.color
+
+    def _hook(self, event_type: str):
+        """Robot events reach the scheduler through the event bus, subscribed on first use."""
+        if event_type in BUS_EVENT_TYPES.values() and not self._hooked_bus:
+            self.events.subscribe(self._on_bus_event)
+            self._hooked_bus = True
+
+    def _on_bus_event(self, event: NamedTuple):
+        event_type = BUS_EVENT_TYPES.get(type(event))
+        if event_type is not None and self.scheduler.has_pending(event_type):
+            self.fire(event_type)
+
+
+# Bus events that fire scheduled effects; everything else is fired by the game loop via fire()
+BUS_EVENT_TYPES: Dict[type, str] = {
+    RobotMoved: 'on_move',
+}
\ No newline at end of file
@@ -1,13 +1,23 @@
+import hashlib
 import json
+import mmap
+import os
+import pickle
+import struct
+import sys
 from dataclasses import dataclass
-from typing import TypedDict, List, Dict, Any
+from typing import TypedDict, List, Dict, Any, Iterator, Optional, Sequence, Tuple, Union
 
 # --- INPUT TYPES (For Type-Safe Reading) ---
 
+class StructuredAction(TypedDict):
+    type: str
+    params: Dict[str, Any]
+    function: str
+
 class ActionSchema(TypedDict):
     text: str
-    action: Dict[str, Any]
-    function: str
+    action: StructuredAction
 
 class RawCardSchema(TypedDict):
     id: str
@@ -24,8 +34,12 @@ class ColorGroupSchema(TypedDict):
 
 # --- OUTPUT TYPE (The Fully Formed Object) ---
 
-@dataclass
+@dataclass(init=False)
 class HydratedCard:
+    # Slotted by hand (dataclass(slots=True) needs Python 3.10). A slot can't also carry a
+    # class-level default, so __init__ is written out below to give 'number' its default.
+    __slots__ = ('id', 'title', 'seed', 'color', 'hex_code', 'execute', 'write', 'delete', 'number')
+
     id: str
     title: str
     seed: int
@@ -34,13 +48,26 @@ class HydratedCard:
     execute: ActionSchema
     write: ActionSchema
     delete: ActionSchema  # Now bundled per card
+    number: int  # Dense position in the deck (bit index for cardSet), set by hydration; -1 if unset
+
+    def __init__(self, id: str, title: str, seed: int, color: str, hex_code: str,
+                 execute: ActionSchema, write: ActionSchema, delete: ActionSchema, number: int = -1):
+        self.id = id
+        self.title = title
+        self.seed = seed
+        self.color = color
+        self.hex_code = hex_code
+        self.execute = execute
+        self.write = write
+        self.delete = delete
+        self.number = number
 
 # --- TRANSFORMATION LOGIC ---
 
-def hydrate_deck(raw_data: List[ColorGroupSchema]) -> List[HydratedCard]:
+def hydrate_deck(raw_data: List[ColorGroupSchema], first_number: int = 0) -> List[HydratedCard]:
     """
     Flattens the nested color groups into a single list of 
-    fully populated card objects.
+    fully populated card objects, numbered from 'first_number'.
     """
     deck = []
     
@@ -52,33 +79,222 @@ def hydrate_deck(raw_data: List[ColorGroupSchema]) -> List[HydratedCard]:
         for card in group['cards']:
             # Create a fully-formed object
             hydrated = HydratedCard(
-                id=card['id'],
+                id=sys.intern(card['id']),
                 title=card['title'],
                 seed=card['seed'],
-                color=color_name,
-                hex_code=hex_val,
+                color=sys.intern(color_name),
+                hex_code=sys.intern(hex_val),
                 execute=card['execute'],
                 write=card['write'],
-                delete=shared_delete
+                delete=shared_delete,
+                number=first_number + len(deck)
             )
             deck.append(hydrated)
             
     return deck
 
+# --- STREAMING PARSE ---
+
+# Read size for the streaming parser
+STREAM_CHUNK = 1 << 16
+
+
+def iter_groups(json_file_path: str) -> Iterator[ColorGroupSchema]:
+    """
+    Parses the top-level array one color group at a time, so only the current
+    group (not the whole file) has to be held in memory.
+    """
+    decoder = json.JSONDecoder()
+    with open(json_file_path, 'r') as f:
+        buf = f.read(STREAM_CHUNK).lstrip()
+        if not buf.startswith('['):
+            raise ValueError(f"{json_file_path}: expected a JSON array of color groups")
+        pos = 1
+        eof = False
+
+        while True:
+            # Skip separators, refilling as needed
+            while True:
+                while pos < len(buf) and buf[pos] in ' \t\r\n,':
+                    pos += 1
+                if pos < len(buf) or eof:
+                    break
+                buf, pos = f.read(STREAM_CHUNK), 0
+                eof = not buf
+
+            if pos >= len(buf) or buf[pos] == ']':
+                return
+
+            try:
+                group, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                more = f.read(STREAM_CHUNK)
+                eof = not more
+                buf = buf[pos:] + more
+                pos = 0
+                continue
+
+            yield group
+            buf, pos = buf[end:], 0
+
+
+def iter_deck(json_file_path: str) -> Iterator[HydratedCard]:
+    """hydrate_deck over a streamed file."""
+    count = 0
+    for group in iter_groups(json_file_path):
+        cards = hydrate_deck([group], count)
+        count += len(cards)
+        yield from cards
+
+
+# --- BINARY CACHE ---
+
+# Layout: MAGIC, header length, header pickle (protocol 5, card blob out-of-band), card blob.
+# The header holds the color groups (shared delete actions) and the blob offsets; each card is
+# its own small pickle inside the blob, unpickled from the memory map on first access.
+CACHE_MAGIC = b'DCKC\x01'
+_HEADER_LEN = struct.Struct('<Q')
+
+# Decks above this size are streamed rather than loaded whole when there is no cache
+STREAM_THRESHOLD = 8 << 20
+
+
+def source_digest(json_file_path: str) -> str:
+    h = hashlib.blake2b(digest_size=12)
+    with open(json_file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def cache_path(json_file_path: str, digest: str) -> str:
+    folder, name = os.path.split(os.path.abspath(json_file_path))
+    return os.path.join(folder, '__pycache__', f"{name}.{digest}.deck")
+
+
+def write_cache(cards: Iterator[HydratedCard], path: str):
+    groups: List[Tuple[str, str, ActionSchema]] = []
+    group_index: Dict[int, int] = {}  # id(shared delete) -> group
+    offsets = [0]
+    blob = bytearray()
+
+    for card in cards:
+        g = group_index.get(id(card.delete))
+        if g is None:
+            g = group_index[id(card.delete)] = len(groups)
+            groups.append((card.color, card.hex_code, card.delete))
+        blob += pickle.dumps((card.id, card.title, card.seed, g, card.execute, card.write),
+                             protocol=pickle.HIGHEST_PROTOCOL)
+        offsets.append(len(blob))
+
+    out_of_band: List[pickle.PickleBuffer] = []
+    header = pickle.dumps((groups, offsets, pickle.PickleBuffer(blob)),
+                          protocol=5, buffer_callback=out_of_band.append)
+
+    # Write-then-rename, so concurrent workers never see a half-written cache
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(CACHE_MAGIC)
+        f.write(_HEADER_LEN.pack(len(header)))
+        f.write(header)
+        for buffer in out_of_band:
+            f.write(buffer.raw())
+    os.replace(tmp, path)
+
+
+class LazyDeck(Sequence):
+    """Read-only deck over a memory-mapped cache file; cards are built on first access."""
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(self._map)
+        start = len(CACHE_MAGIC)
+        if view[:start] != CACHE_MAGIC:
+            raise ValueError(f"{path}: not a deck cache")
+        (header_len,) = _HEADER_LEN.unpack_from(view, start)
+        start += _HEADER_LEN.size
+
+        self._groups, self._offsets, self._blob = pickle.loads(
+            view[start:start + header_len], buffers=[view[start + header_len:]]
+        )
+        self._cards: List[Optional[HydratedCard]] = [None] * (len(self._offsets) - 1)
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        card = self._cards[index]
+        if card is None:
+            if index < 0:
+                index += len(self._cards)
+            card_id, title, seed, g, execute, write = pickle.loads(
+                self._blob[self._offsets[index]:self._offsets[index + 1]]
+            )
+            color, hex_code, delete = self._groups[g]
+            card = self._cards[index] = HydratedCard(
+                sys.intern(card_id), title, seed, sys.intern(color), sys.intern(hex_code), execute, write, delete, index
+            )
+        return card
+
+
+def load_deck(json_file_path: str) -> Sequence[HydratedCard]:
+    """
+    The deck in 'json_file_path', through the binary cache in __pycache__ (keyed by the
+    file's hash and rebuilt whenever the JSON changes). Cards are materialized lazily.
+    If the cache can't be written, falls back to parsing: json.load for normal decks,
+    streaming for anything over STREAM_THRESHOLD.
+    """
+    path = cache_path(json_file_path, source_digest(json_file_path))
+    try:
+        return LazyDeck(path)
+    except (OSError, ValueError, pickle.UnpicklingError):
+        pass  # Missing or unreadable: (re)build it
+
+    streamed = os.path.getsize(json_file_path) > STREAM_THRESHOLD
+    cards = iter_deck(json_file_path) if streamed else iter(hydrate_json(json_file_path))
+    try:
+        write_cache(cards, path)
+        _drop_stale_caches(path)
+        return LazyDeck(path)
+    except OSError:
+        return list(iter_deck(json_file_path)) if streamed else hydrate_json(json_file_path)
+
+
+def hydrate_json(json_file_path: str) -> List[HydratedCard]:
+    with open(json_file_path, 'r') as f:
+        return hydrate_deck(json.load(f))
+
+
+def _drop_stale_caches(current: str):
+    folder, name = os.path.split(current)
+    prefix = name.rsplit('.', 2)[0] + '.'
+    for other in os.listdir(folder):
+        if other.startswith(prefix) and other.endswith('.deck') and other != name:
+            try:
+                os.remove(os.path.join(folder, other))
+            except OSError:
+                pass
+
+
 # --- USAGE EXAMPLE ---
 
 def run_hydration(json_file_path: str):
-    with open(json_file_path, 'r') as f:
-        raw_json = json.load(f)
-        
-    # Transform
-    full_deck = hydrate_deck(raw_json)
+    # Transform (served from the binary cache after the first run)
+    full_deck = load_deck(json_file_path)
     
     print(f"Successfully hydrated {len(full_deck)} cards.")
     
     # Accessing data safely
     sample_card = full_deck[0]
     print(f"Sample Card: {sample_card.title} ({sample_card.color})")
-    print(f"Execute Logic: {sample_card.execute['function']}")
+    print(f"Execute Logic: {sample_card.execute['action']['function']}")
     
     return full_deck
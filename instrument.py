@@ -0,0 +1,156 @@
+"""
+Opt-in hot-path instrumentation.
+
+Nothing here touches the game until Profiler.enable(): then the methods in TARGETS are
+swapped for timing wrappers on their classes, and disable() puts the originals back.
+With the profiler off there is no wrapper and no flag check left on any hot path.
+
+Each call records the call count, cumulative and self nanoseconds, and the net number of
+memory blocks allocated (sys.getallocatedblocks) under the stack of active phases.
+Results export as a flat per-phase table or as collapsed stacks for flamegraph.pl /
+speedscope ("execute:GameCard._run_logic;effects:DirectiveGame.fire 12345").
+"""
+import functools
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+from board import GameBoard
+from card import GameCard
+from cardDecks import CardDecks
+from game import DirectiveGame
+from robot import Robot
+
+# (class, method, phase) wrapped by Profiler.enable()
+TARGETS: List[Tuple[type, str, str]] = [
+    (CardDecks, 'draw', 'draw'),
+    (CardDecks, 'draw_one', 'draw'),
+    (CardDecks, 'discard', 'draw'),
+    (CardDecks, 'discard_one', 'draw'),
+    (GameCard, '_run_logic', 'execute'),
+    (DirectiveGame, 'fire', 'effects'),
+    (GameBoard, 'place_tile', 'build'),
+    (Robot, 'move', 'move'),
+    (DirectiveGame, 'calculate_global_scores', 'score'),
+]
+
+# Stack of frame labels -> [calls, cumulative ns, self ns, allocated blocks]
+Frames = Dict[Tuple[str, ...], List[int]]
+
+
+class Profiler:
+    def __init__(self):
+        self.frames: Frames = {}
+        self.enabled = False
+        self._stack: List[str] = []
+        self._child_ns: List[int] = [0]
+        self._originals: List[Tuple[type, str, Callable]] = []
+
+    # --- Switching ---
+
+    def enable(self) -> 'Profiler':
+        if self.enabled:
+            return self
+        for cls, name, phase in TARGETS:
+            original = cls.__dict__[name]
+            self._originals.append((cls, name, original))
+            setattr(cls, name, self.wrap(original, phase))
+        self.enabled = True
+        return self
+
+    def disable(self):
+        for cls, name, original in reversed(self._originals):
+            setattr(cls, name, original)
+        self._originals.clear()
+        self.enabled = False
+
+    def __enter__(self) -> 'Profiler':
+        return self.enable()
+
+    def __exit__(self, *exc):
+        self.disable()
+
+    def reset(self):
+        self.frames.clear()
+
+    # --- Recording ---
+
+    def wrap(self, func: Callable, phase: str) -> Callable:
+        """
+        A timing wrapper for 'func' under 'phase'. Also usable on its own, e.g. to put a
+        self-play policy in a 'program' phase: play_game(..., profiler.wrap(policy, 'program')).
+        """
+        label = f"{phase}:{func.__qualname__}"
+        stack = self._stack
+        child_ns = self._child_ns
+        frames = self.frames
+        clock = time.perf_counter_ns
+        blocks = sys.getallocatedblocks
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            stack.append(label)
+            child_ns.append(0)
+            start_blocks = blocks()
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                allocated = blocks() - start_blocks
+                inner = child_ns.pop()
+                child_ns[-1] += elapsed
+
+                key = tuple(stack)
+                stack.pop()
+                frame = frames.get(key)
+                if frame is None:
+                    frame = frames[key] = [0, 0, 0, 0]
+                frame[0] += 1
+                frame[1] += elapsed
+                frame[2] += elapsed - inner
+                frame[3] += allocated
+
+        return timed
+
+    # --- Export ---
+
+    def table(self) -> List[Tuple[str, int, int, int, int]]:
+        """
+        (phase, calls, cumulative ns, self ns, allocated blocks) per phase, slowest first.
+        Cumulative time only counts the outermost call of a phase, so nesting
+        (draw -> draw_one) is not counted twice.
+        """
+        totals: Dict[str, List[int]] = {}
+        for key, (calls, cumulative, own, allocated) in self.frames.items():
+            phase = _phase(key[-1])
+            row = totals.setdefault(phase, [0, 0, 0, 0])
+            row[0] += calls
+            row[2] += own
+            if all(_phase(outer) != phase for outer in key[:-1]):
+                row[1] += cumulative
+                row[3] += allocated
+        rows = [(phase, *values) for phase, values in totals.items()]
+        rows.sort(key=lambda row: row[2], reverse=True)
+        return rows
+
+    def format_table(self) -> str:
+        lines = [f"{'phase':<10} {'calls':>10} {'cumulative ms':>14} {'self ms':>10} {'ns/call':>10} {'blocks':>10}"]
+        for phase, calls, cumulative, own, allocated in self.table():
+            lines.append(f"{phase:<10} {calls:>10,} {cumulative / 1e6:>14.2f} {own / 1e6:>10.2f} "
+                         f"{cumulative / calls:>10,.0f} {allocated:>10,}")
+        return "\n".join(lines)
+
+    def collapsed(self) -> str:
+        """Collapsed stacks (one 'frame;frame;frame self_ns' line per stack) for flamegraph tools."""
+        return "\n".join(f"{';'.join(key)} {own}" for key, (_, _, own, _) in sorted(self.frames.items()) if own > 0)
+
+    def write_collapsed(self, path: str):
+        with open(path, 'w') as f:
+            f.write(self.collapsed())
+            f.write("\n")
+
+
+def _phase(label: str) -> str:
+    return label.split(':', 1)[0]
+
@@ -0,0 +1,170 @@
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Tuple
+
+# Append-only undo/redo log of the game's state changes.
+# Components with a 'journal' attached (Robot, GameBoard, Pile, CardDecks) record one Delta
+# per change; undo() and redo() replay them backwards / forwards, so search can make and
+# unmake moves without cloning or snapshotting. The log is a ring buffer: past 'capacity'
+# entries the oldest fall off and can no longer be undone.
+
+# Delta ops
+MOVE = 0  # Robot stepped: (location, facing) before / after
+RESET = 1  # Robot sent back to the kernel: (location, facing) before / after
+BATTERY = 2  # Robot battery: old / new value
+PLACE = 3  # GameBoard.place_tile: (tile, its old coords, replaced tile or None) / coords
+ROTATE = 4  # Placed tile turned: old / new Orientation
+OWNER = 5  # Placed tile changed hands: old / new owner
+PILE_DRAW = 6  # Item taken off the top of a pile (one entry per item): None / item
+PILE_TOP = 7  # Item pushed on top (one entry per item): None / item
+PILE_BOTTOM = 8  # Item added at the bottom (one entry per item): None / item
+SHUFFLE = 9  # Pile shuffled: shuffle number (Pile.shuffles) before / None
+FIELD = 10  # Plain attribute write: (name, old value) / new value
+PILE_MOVE = 11  # Pile.move_to_bottom: item count / the pile they went under
+
+
+class Delta(NamedTuple):
+    """One journal entry. Always four fields; 'before' and 'after' hold what undo / redo need."""
+    op: int
+    target: Any
+    before: Any
+    after: Any
+
+
+# Builds a Delta without the Python-level NamedTuple constructor (record() is on hot paths)
+_new_delta = tuple.__new__
+
+
+class Journal:
+    def __init__(self, capacity: int = 4096):
+        self.capacity = capacity
+        self.entries: Deque[Delta] = deque(maxlen=capacity)
+        self._redo: List[Delta] = []
+        # Number of changes currently applied since the journal started (see mark / undo_to)
+        self.position = 0
+        self._applying = False
+        # Stands in for 'the entry before' in anchors taken on an empty log; replaced by clear()
+        self._origin = object()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def record(self, op: int, target: Any, before: Any, after: Any):
+        """Called by the journaled components. Ignored while undo / redo are replaying."""
+        if self._applying:
+            return
+        self.entries.append(_new_delta(Delta, (op, target, before, after)))
+        self.position += 1
+        if self._redo:
+            self._redo.clear()
+
+    def clear(self):
+        """Forgets everything (e.g. after a snapshot restore, when the entries no longer apply)."""
+        self.entries.clear()
+        self._redo.clear()
+        self._origin = object()
+
+    # --- Undo / Redo ---
+
+    def mark(self) -> int:
+        """The current position, to come back to with undo_to()."""
+        return self.position
+
+    def anchor(self) -> Tuple[int, Any]:
+        """
+        mark() plus the entry just before it. Unlike a bare mark, an anchor tells this
+        history apart from one that was undone past it and rewritten (see reaches()).
+        """
+        return self.position, self.entries[-1] if self.entries else self._origin
+
+    def reaches(self, anchor: Tuple[int, Any]) -> bool:
+        """Whether undoing back to 'anchor' brings back the state it was taken in."""
+        position, last = anchor
+        back = self.position - position
+        if back < 0:
+            return False
+        if back < len(self.entries):
+            return self.entries[-back - 1] is last
+        return back == len(self.entries) and last is self._origin
+
+    def rewind(self, anchor: Tuple[int, Any]) -> bool:
+        """
+        Undoes back to 'anchor' and drops the undone changes rather than keeping them for redo.
+        Returns False, changing nothing, if the anchor can't be reached.
+        """
+        if not self.reaches(anchor):
+            return False
+        self.undo(self.position - anchor[0])
+        self._redo.clear()
+        return True
+
+    def undo(self, count: int = 1) -> int:
+        """Reverts the last 'count' changes. Returns how many were reverted."""
+        return self._replay(self.entries, self._redo, _UNDO, count, -1)
+
+    def redo(self, count: int = 1) -> int:
+        """Re-applies the last 'count' undone changes. Returns how many were applied."""
+        return self._replay(self._redo, self.entries, _REDO, count, 1)
+
+    def undo_to(self, mark: int):
+        """Reverts every change made since mark() returned 'mark'."""
+        if mark < self.position - len(self.entries):
+            raise ValueError(f"Journal position {mark} has fallen off the log (capacity {self.capacity})")
+        self.undo(self.position - mark)
+
+    def _replay(self, source, target, actions: Dict[int, Callable[[Delta], None]], count: int, step: int) -> int:
+        done = 0
+        self._applying = True
+        try:
+            while done < count and source:
+                delta = source.pop()
+                actions[delta.op](delta)
+                target.append(delta)
+                done += 1
+        finally:
+            self._applying = False
+            self.position += step * done
+        return done
+
+
+# --- Replay Actions ---
+# Undo / redo go through the components' own methods where those are exact inverses,
+# with recording suppressed by Journal._applying (or their unjournaled '_' helpers).
+
+def _unmove(delta):
+    source, count, target = delta.target, delta.before, delta.after
+    source._put_top(target._pop_bottom(count))
+
+
+def _set_battery(robot, value):
+    robot._battery = value
+
+
+_UNDO: Dict[int, Callable[[Delta], None]] = {
+    MOVE: lambda d: d.target._unstep(d.before),
+    RESET: lambda d: d.target._unstep(d.before, reset=True),
+    BATTERY: lambda d: _set_battery(d.target, d.before),
+    PLACE: lambda d: d.target._unplace(d.after, d.before),
+    ROTATE: lambda d: d.target.orient(d.before),
+    OWNER: lambda d: setattr(d.target, 'ownership', d.before),
+    PILE_DRAW: lambda d: d.target._put_top([d.after]),
+    PILE_TOP: lambda d: d.target._take(1),
+    PILE_BOTTOM: lambda d: d.target._pop_bottom(1),
+    SHUFFLE: lambda d: d.target._unshuffle(),
+    FIELD: lambda d: setattr(d.target, d.before[0], d.before[1]),
+    PILE_MOVE: _unmove,
+}
+
+_REDO: Dict[int, Callable[[Delta], None]] = {
+    MOVE: lambda d: d.target._step(d.after),
+    RESET: lambda d: d.target._step(d.after, reset=True),
+    BATTERY: lambda d: _set_battery(d.target, d.after),
+    PLACE: lambda d: d.target.place_tile(d.before[0], d.after, force=True),
+    ROTATE: lambda d: d.target.orient(d.after),
+    OWNER: lambda d: setattr(d.target, 'ownership', d.after),
+    PILE_DRAW: lambda d: d.target._take(1),
+    PILE_TOP: lambda d: d.target._put_top([d.after]),
+    PILE_BOTTOM: lambda d: d.target._put_bottom([d.after]),
+    SHUFFLE: lambda d: d.target.shuffle(),
+    FIELD: lambda d: setattr(d.target, d.before[0], d.after),
+    PILE_MOVE: lambda d: d.after._put_bottom(d.target._take(d.before)),
+}
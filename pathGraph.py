@@ -0,0 +1,129 @@
+"""
+Whole-board path evaluation on NumPy arrays.
+
+The robot's movement is a functional graph over states 'cell * 4 + facing', where
+'cell' is the dense GameBoard index (x + r) * width + (y + r) and 'facing' is the
+Direction.value the robot is heading in. next_state[s] is the state after one move.
+A move that crashes (off the board, empty cell, wall, or a manual choice) maps the
+state onto itself, so crashes are the fixed points and the robot stays where it was,
+exactly like GameBoard.trace.
+
+Every operation works on a single board (1-D, one row of states) or on a batch of
+boards of the same size stacked as a 2-D array (one row per board).
+"""
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+
+from board import GameBoard, Coord
+from direction import Direction, DELTAS
+from Tiles.tile import NO_EXIT
+
+# width -> (cells, 4) neighbor index per facing, -1 outside the board
+_NEIGHBORS: Dict[int, np.ndarray] = {}
+
+
+def _neighbors(width: int) -> np.ndarray:
+    table = _NEIGHBORS.get(width)
+    if table is not None:
+        return table
+
+    r = width // 2
+    cell = np.arange(width * width)
+    x, y = cell // width - r, cell % width - r
+    table = np.full((width * width, 4), -1, dtype=np.int64)
+    for d, (dx, dy) in enumerate(DELTAS):
+        nx, ny = x + dx, y + dy
+        inside = (np.abs(nx) <= r) & (np.abs(ny) <= r)
+        table[inside, d] = ((nx + r) * width + (ny + r))[inside]
+    _NEIGHBORS[width] = table
+    return table
+
+
+def exit_codes(board: GameBoard) -> np.ndarray:
+    """(cells, 4) uint8: the exit Direction.value for each entry side, NO_EXIT for walls and empty cells."""
+    cells = board.width * board.width
+    coords, codes = board.pack_transitions()
+    packed = np.frombuffer(codes, dtype=np.uint8).reshape(-1, 4)
+    if board.dense:
+        return packed.copy()
+
+    # Sparse boards: scatter by index, dropping forced placements outside the board
+    r = board.max_radius
+    xy = np.array(coords, dtype=np.int64).reshape(-1, 2)
+    inside = (np.abs(xy[:, 0]) <= r) & (np.abs(xy[:, 1]) <= r)
+    table = np.full((cells, 4), NO_EXIT, dtype=np.uint8)
+    table[(xy[inside, 0] + r) * board.width + (xy[inside, 1] + r)] = packed[inside]
+    return table
+
+
+def successors(board: GameBoard) -> np.ndarray:
+    """next_state for every (cell, facing) state of the board, as a 1-D int64 array."""
+    width = board.width
+    neighbors = _neighbors(width)
+    codes = exit_codes(board)
+    states = np.arange(width * width * 4, dtype=np.int64)
+
+    facing = np.arange(4)
+    target = neighbors.reshape(-1)  # Cell reached from state s = cell*4 + facing
+    entry = np.tile((facing + 2) % 4, width * width)  # Side it is entered through (INVERSE)
+    exit_code = np.where(target >= 0, codes[np.maximum(target, 0), entry], NO_EXIT)
+
+    moves = exit_code != NO_EXIT
+    return np.where(moves, target * 4 + exit_code, states)
+
+
+def successors_batch(boards: Iterable[GameBoard]) -> np.ndarray:
+    """Successor arrays of same-sized boards stacked as (boards, states)."""
+    return np.stack([successors(b) for b in boards])
+
+
+# --- Functional Graph Operations ---
+
+def jump(next_state: np.ndarray, steps: int) -> np.ndarray:
+    """The state reached after 'steps' moves from every state, by pointer doubling (O(log steps) passes)."""
+    result = np.broadcast_to(np.arange(next_state.shape[-1]), next_state.shape).copy()
+    power = next_state
+    while steps:
+        if steps & 1:
+            result = np.take_along_axis(power, result, axis=-1)
+        steps >>= 1
+        if steps:
+            power = np.take_along_axis(power, power, axis=-1)
+    return result
+
+
+def terminal_states(next_state: np.ndarray) -> np.ndarray:
+    """Mask of the crash states (the robot cannot move on from them)."""
+    return next_state == np.arange(next_state.shape[-1])
+
+
+def crashes_within(next_state: np.ndarray, steps: int) -> np.ndarray:
+    """Mask of the states whose path has crashed within 'steps' moves."""
+    return np.take_along_axis(terminal_states(next_state), jump(next_state, steps), axis=-1)
+
+
+def cycle_members(next_state: np.ndarray) -> np.ndarray:
+    """
+    Mask of the states that lie on a loop the robot can run forever.
+    After as many moves as there are states every path has settled onto its cycle
+    (or crashed), so the image of that jump is exactly the set of cycle states.
+    """
+    settled = jump(next_state, next_state.shape[-1])
+    members = np.zeros(next_state.shape, dtype=bool)
+    np.put_along_axis(members, settled, True, axis=-1)
+    return members & ~terminal_states(next_state)
+
+
+# --- Conversions ---
+
+def state_of(board: GameBoard, coords: Coord, facing: Direction) -> int:
+    x, y = coords
+    r = board.max_radius
+    return ((x + r) * board.width + (y + r)) * 4 + facing.value
+
+
+def decode(board: GameBoard, state: int) -> Tuple[Coord, Direction]:
+    cell, facing = divmod(int(state), 4)
+    r = board.max_radius
+    return (cell // board.width - r, cell % board.width - r), Direction(facing)
@@ -1,29 +1,227 @@
-from typing import TypeVar, Generic, List
+from typing import TypeVar, Generic, Callable, List, Iterable, Optional, Tuple
+import copy
 import random
 
+from journal import Journal, PILE_DRAW, PILE_TOP, PILE_BOTTOM, PILE_MOVE, SHUFFLE
+from rng import DEFAULT_SEED, derive_seed, derive_stream
+from zobrist import MASK64, PILE_BASE, PILE_BASE_INVERSE
+
 # Define a Type Variable 'T'.
 # This acts as a placeholder that will be locked in when the class is created.
 T = TypeVar('T')
 
 class Pile(Generic[T]):
-    def __init__(self, items: List[T] = []):
-        # Now Python knows self.items is a list of a specific type, not just anything.
-        self.items: List[T] = items
+    def __init__(self, items: Iterable[T] = (), rng: Optional[random.Random] = None):
+        # Kept as a stack: the top of the pile is the end of this list, so drawing and
+        # pushing on top are O(1) pops / appends. 'items' shows it the usual way, top first.
+        self._stack: List[T] = list(items)
+        self._stack.reverse()
+
+        # Shuffle n deals from its own stream, derived from the pile's seed and n (see
+        # rng.derive_stream), so the journal can replay or take back a shuffle from n alone.
+        # 'rng' only picks the seed; without one it is derived from rng.DEFAULT_SEED,
+        # so such piles come out in the same order on every run.
+        self.seed = rng.getrandbits(64) if rng is not None else derive_seed(DEFAULT_SEED, 'pile')
+        self.shuffles = 0
+
+        # Optional order-sensitive content hash (see track_hash); 'key' is None when off
+        self.key: Optional[Callable[[T], int]] = None
+        self.hash = 0
+        self._weight = 1  # PILE_BASE ** len(items)
+
+        # Undo log for draws, pushes and shuffles (see journal.py); off when None
+        self.journal: Optional[Journal] = None
+
         self.shuffle()
 
+    @property
+    def items(self) -> List[T]:
+        """The pile as a list, top first. A copy: assign to 'items' to change the contents."""
+        return self._stack[::-1]
+
+    @items.setter
+    def items(self, items: Iterable[T]):
+        # Not journaled, like restore()
+        self.restore(tuple(items))
+
+    def __len__(self) -> int:
+        return len(self._stack)
+
+    def track_hash(self, key: Callable[[T], int]) -> 'Pile[T]':
+        """
+        Keeps 'hash' up to date as a polynomial over key(item) (see zobrist.PILE_BASE),
+        so pushes and draws at either end update it in O(1) per item.
+        """
+        self.key = key
+        self._rehash()
+        return self
+
+    def _rehash(self):
+        if self.key is None:
+            return
+        h, weight = 0, 1
+        for item in reversed(self._stack):
+            h = (h + self.key(item) * weight) & MASK64
+            weight = (weight * PILE_BASE) & MASK64
+        self.hash, self._weight = h, weight
+
+    def _unhash_top(self, item: T):
+        self.hash = ((self.hash - self.key(item)) * PILE_BASE_INVERSE) & MASK64
+        self._weight = (self._weight * PILE_BASE_INVERSE) & MASK64
+
+    def _pop_bottom(self, count: int) -> List[T]:
+        """Takes 'count' items off the bottom (the inverse of add_to_bottom), in pile order."""
+        stack = self._stack
+        count = min(count, len(stack))
+        taken = stack[count - 1::-1] if count else []
+        del stack[:count]
+        if self.key is not None:
+            key, h, weight = self.key, self.hash, self._weight
+            for item in reversed(taken):
+                weight = (weight * PILE_BASE_INVERSE) & MASK64
+                h = (h - key(item) * weight) & MASK64
+            self.hash, self._weight = h, weight
+        return taken
+
     def shuffle(self) -> 'Pile[T]':
-        random.shuffle(self.items)
+        n = self.shuffles
+        if self.journal is not None:
+            self.journal.record(SHUFFLE, self, n, None)
+
+        # Dealt top first, so a stream always gives the same order whatever the storage
+        shuffled = self._stack[::-1]
+        derive_stream(self.seed, 'shuffle', n).shuffle(shuffled)
+        shuffled.reverse()
+        self.shuffles = n + 1
+        self._stack = shuffled
+        self._rehash()
         return self
 
+    def _unshuffle(self):
+        """Takes back the latest shuffle (journal undo) by dealing its permutation again and inverting it."""
+        n = self.shuffles = self.shuffles - 1
+        # random.shuffle's draws depend only on the length, so this is the same permutation
+        order = list(range(len(self._stack)))
+        derive_stream(self.seed, 'shuffle', n).shuffle(order)
+        unshuffled = [None] * len(order)
+        for item, source in zip(reversed(self._stack), order):
+            unshuffled[source] = item
+        unshuffled.reverse()
+        self._stack = unshuffled
+        self._rehash()
+
     def draw(self, count: int = 1) -> List[T]:
-        drawn = self.items[:count]
-        self.items = self.items[count:]
+        drawn = self._take(count)
+        journal = self.journal
+        if journal is not None:
+            # One fixed-size entry per card, top card first
+            for item in drawn:
+                journal.record(PILE_DRAW, self, None, item)
+        return drawn
+
+    def _take(self, count: int) -> List[T]:
+        """draw() without the journal entries."""
+        stack = self._stack
+        if count >= len(stack):
+            drawn = stack[::-1]
+            stack.clear()
+            self.hash, self._weight = 0, 1
+            return drawn
+        if count == 1:
+            drawn = [stack.pop()]
+        else:
+            drawn = stack[:-count - 1:-1]
+            del stack[-count:]
+        if self.key is not None:
+            for item in drawn:
+                self._unhash_top(item)
         return drawn
 
-    def add_to_bottom(self, items: List[T]) -> 'Pile[T]':
-        self.items.extend(items)
+    def draw_one(self) -> Optional[T]:
+        """Draws the top item without building a list. Returns None if empty."""
+        if not self._stack:
+            return None
+        item = self._stack.pop()
+        if self.key is not None:
+            self._unhash_top(item)
+        if self.journal is not None:
+            self.journal.record(PILE_DRAW, self, None, item)
+        return item
+
+    def peek(self, count: Optional[int] = None) -> List[T]:
+        """The top 'count' items (all by default) as a list, top first, without drawing them."""
+        if count is None:
+            return self._stack[::-1]
+        return self._stack[:-count - 1:-1] if count > 0 else []
+
+    def add_to_bottom(self, items: Iterable[T]) -> 'Pile[T]':
+        items = list(items)
+        journal = self.journal
+        if journal is not None:
+            for item in items:
+                journal.record(PILE_BOTTOM, self, None, item)
+        self._put_bottom(items)
         return self
 
+    def _put_bottom(self, items: List[T]):
+        if self.key is not None:
+            key, h, weight = self.key, self.hash, self._weight
+            for item in items:
+                h = (h + key(item) * weight) & MASK64
+                weight = (weight * PILE_BASE) & MASK64
+            self.hash, self._weight = h, weight
+        self._stack[:0] = items[::-1]
+
     def add_to_top(self, items: List[T]) -> 'Pile[T]':
-        self.items = [*items, *self.items]
-        return self
\ No newline at end of file
+        journal = self.journal
+        if journal is not None:
+            # In push order, bottom-most first
+            for item in reversed(items):
+                journal.record(PILE_TOP, self, None, item)
+        self._put_top(items)
+        return self
+
+    def _put_top(self, items: List[T]):
+        # Pushed bottom-most first, so items[0] ends up on top
+        self._stack.extend(reversed(items))
+        if self.key is not None:
+            key, h, weight = self.key, self.hash, self._weight
+            for item in reversed(items):
+                h = (key(item) + h * PILE_BASE) & MASK64
+                weight = (weight * PILE_BASE) & MASK64
+            self.hash, self._weight = h, weight
+
+    def move_to_bottom(self, target: 'Pile[T]', count: Optional[int] = None) -> 'Pile[T]':
+        """
+        Draws 'count' items (all by default) and adds them, in the same order, under 'target'.
+        Journaled as a single entry, since the items can be found again at the bottom of 'target'.
+        """
+        count = len(self._stack) if count is None else min(count, len(self._stack))
+        if self.journal is not None:
+            self.journal.record(PILE_MOVE, self, count, target)
+        target._put_bottom(self._take(count))
+        return target
+
+    # --- Search Support ---
+
+    def snapshot(self) -> Tuple[T, ...]:
+        """Immutable copy of the pile (top first). Safe to share between search branches."""
+        return tuple(reversed(self._stack))
+
+    def restore(self, snapshot: Tuple[T, ...], content_hash: Optional[int] = None) -> 'Pile[T]':
+        """'content_hash': the pile's 'hash' when the snapshot was taken, to skip rehashing."""
+        self._stack = list(snapshot)
+        self._stack.reverse()
+        if content_hash is None:
+            self._rehash()
+        elif self.key is not None:
+            self.hash = content_hash
+            self._weight = pow(PILE_BASE, len(snapshot), 1 << 64)
+        return self
+
+    def clone(self) -> 'Pile[T]':
+        """Independent pile holding the same (shared) items; it deals the same shuffles from here on."""
+        clone = copy.copy(self)
+        clone._stack = self._stack.copy()
+        clone.journal = None
+        return clone
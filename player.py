@@ -1,12 +1,65 @@
-from typing import List
+from typing import Dict, Iterable, List, Tuple
+import copy
+
 from card import GameCard
+from cardSet import CardSet
 from Tiles.tile import Tile
+from zobrist import zobrist_key, mix64
 
 
 class Player:
     def __init__(self, name: str):
         self.name = name
-        self.hand: List[GameCard] = []
-        self.program: List[GameCard] = []  # The Stack
+        self.hand: CardSet = CardSet()
+        self.program: CardSet = CardSet()  # The Stack
         self.owned_tiles: List[Tile] = []
         self.score: int = 0
+
+    # Hand and program are CardSets (lists that keep a bitset, see CardIndex);
+    # assigning any iterable of cards converts it.
+
+    @property
+    def hand(self) -> CardSet:
+        return self._hand
+
+    @hand.setter
+    def hand(self, cards: Iterable[GameCard]):
+        self._hand = cards if type(cards) is CardSet else CardSet(cards)
+
+    @property
+    def program(self) -> CardSet:
+        return self._program
+
+    @program.setter
+    def program(self, cards: Iterable[GameCard]):
+        self._program = cards if type(cards) is CardSet else CardSet(cards)
+
+    # --- Search Support ---
+
+    def zobrist(self, seat: int) -> int:
+        """Hash of this player's hand (as a set), program (in order) and score."""
+        h = mix64(self.hand.bits ^ zobrist_key('hand', seat)) ^ zobrist_key('score', seat, self.score)
+        for position, card in enumerate(self.program):
+            h ^= zobrist_key('program', seat, position, card.number)
+        return h
+
+    def snapshot(self) -> Tuple:
+        return tuple(self.hand), tuple(self.program), tuple(self.owned_tiles), self.score
+
+    def restore(self, snapshot: Tuple):
+        hand, program, owned_tiles, self.score = snapshot
+        self.hand = CardSet(hand)
+        self.program = CardSet(program)
+        self.owned_tiles = list(owned_tiles)
+
+    def clone(self, memo: Dict[int, object]) -> 'Player':
+        """
+        Copies the lists, sharing the cards themselves.
+        Tiles already cloned into 'memo' (keyed by id of the original) are swapped in.
+        """
+        clone = copy.copy(self)
+        clone.hand = CardSet(self.hand)
+        clone.program = CardSet(self.program)
+        clone.owned_tiles = [memo.get(id(t), t) for t in self.owned_tiles]
+        memo[id(self)] = clone
+        return clone
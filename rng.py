@@ -0,0 +1,83 @@
+import hashlib
+import random
+from typing import Hashable
+
+# Every random stream in a game is derived from one master seed plus a label, so a
+# game replays bit-identically no matter which process runs it or what ran before.
+
+# Master seed for parts built without a stream of their own (e.g. a Pile with no 'rng'),
+# so they are repeatable too rather than seeded from the global RNG
+DEFAULT_SEED = 0
+
+
+def derive_seed(master_seed: int, *labels: Hashable) -> int:
+    """Stable 64-bit seed for a named sub-stream (unlike hash(), identical across processes)."""
+    key = repr((master_seed,) + labels).encode()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'little')
+
+
+def derive_stream(master_seed: int, *labels: Hashable) -> random.Random:
+    """Independent RNG for a named sub-stream of a master seed."""
+    return random.Random(derive_seed(master_seed, *labels))
+
+
+def derive_saved_stream(master_seed: int, *labels: Hashable) -> 'SavedStream':
+    """derive_stream() for a stream whose state snapshots save (see SavedStream)."""
+    return SavedStream(derive_seed(master_seed, *labels))
+
+
+def copy_stream(rng: random.Random) -> random.Random:
+    """A second stream (of the same kind) that continues exactly where 'rng' currently is."""
+    clone = type(rng)()
+    clone.setstate(rng.getstate())
+    return clone
+
+
+class SavedStream(random.Random):
+    """
+    A stream that counts its draws, so stream_state() can tell it hasn't moved without
+    calling getstate(), which builds a fresh ~625-word tuple every time. Used for the
+    streams game snapshots save; draws the same numbers as random.Random with the same seed.
+    """
+    moves = 0
+    _saved: tuple = ()
+    _saved_at = -1
+
+    def random(self) -> float:
+        self.moves += 1
+        return super().random()
+
+    def getrandbits(self, k: int) -> int:
+        self.moves += 1
+        return super().getrandbits(k)
+
+    def seed(self, *args, **kwargs):
+        self.moves += 1
+        super().seed(*args, **kwargs)
+
+    def setstate(self, state: tuple):
+        if state is self._saved and self._saved_at == self.moves:
+            return  # Already there (a snapshot restored without the stream having moved)
+        super().setstate(state)
+        self.moves += 1
+        self._saved, self._saved_at = state, self.moves  # Restoring a saved state keeps sharing it
+
+    def saved_state(self) -> tuple:
+        if self._saved_at != self.moves:
+            self._saved, self._saved_at = self.getstate(), self.moves
+        return self._saved
+
+
+def stream_state(rng: random.Random) -> tuple:
+    """
+    rng.getstate() for snapshots. While the stream hasn't moved, the previous state tuple
+    is handed out again, so snapshots kept for search share it instead of each holding ~24 KB.
+    """
+    if isinstance(rng, SavedStream):
+        return rng.saved_state()
+    state = rng.getstate()
+    last = getattr(rng, '_last_state', None)
+    if state == last:
+        return last
+    rng._last_state = state
+    return state
@@ -1,18 +1,86 @@
-from typing import Tuple, List
-from direction import Direction
-from board import GameBoard, Coord
+from collections import deque
+from typing import Deque, List, Tuple, Optional
+import copy
+from direction import Direction, DELTAS, INVERSE
+from board import GameBoard, Coord, Trace
+from events import EventBus, RobotMoved, RobotCrashed, SystemReset
+from journal import Journal, MOVE, RESET, BATTERY
+from zobrist import zobrist_key
 
 
 class Robot:
-    def __init__(self, start_pos: Coord = (0, 0), start_facing: Direction = Direction.Up):
+    __slots__ = ('_battery', 'location', 'facing', 'is_crashed', 'journal', 'events', '_path')
+
+    def __init__(self, start_pos: Coord = (0, 0), start_facing: Direction = Direction.Up,
+                 events: Optional[EventBus] = None, journal: Optional[Journal] = None,
+                 history_limit: int = 64):
+        # Undo Support: every move, reset and battery change goes in the journal
+        # (shared with the rest of the game, or a private one of 'history_limit' entries)
+        self.journal = Journal(history_limit) if journal is None else journal
+        self.is_crashed: bool = False
+
+        # Diagnostics: the last 'history_limit' positions, with None marking each reset.
+        # Kept apart from the journal, where other components' entries would crowd moves out.
+        self._path: Deque[Optional[Coord]] = deque([start_pos], maxlen=history_limit)
+
         # State
-        self.battery: int = 10
+        self._battery: int = 10
         self.location: Coord = start_pos
         self.facing: Direction = start_facing
 
-        # Diagnostics / Undo Support
-        self.is_crashed: bool = False
-        self.history: List[Coord] = [start_pos]
+        # Status updates go out as structured events (see events.print_event)
+        self.events = EventBus() if events is None else events
+
+    @property
+    def battery(self) -> int:
+        return self._battery
+
+    @battery.setter
+    def battery(self, value: int):
+        if value != self._battery:
+            self.journal.record(BATTERY, self, self._battery, value)
+            self._battery = value
+
+    @property
+    def history(self) -> List[Coord]:
+        """Positions since the last reset, oldest first (at most 'history_limit' of them)."""
+        path = []
+        for pos in reversed(self._path):
+            if pos is None:
+                break
+            path.append(pos)
+        path.reverse()
+        return path
+
+    # --- Search Support ---
+
+    def snapshot(self) -> Tuple:
+        return self._battery, self.location, self.facing, self.is_crashed
+
+    def restore(self, snapshot: Tuple):
+        """Also clears the journal, whose entries no longer lead to this state, and starts a new history."""
+        self._battery, self.location, self.facing, self.is_crashed = snapshot
+        self.journal.clear()
+        self._path.clear()
+        self._path.append(self.location)
+
+    def clone(self, events: Optional[EventBus] = None, journal: Optional[Journal] = None) -> 'Robot':
+        """The clone starts a fresh journal (with the same capacity unless one is given)."""
+        clone = copy.copy(self)
+        clone._path = self._path.copy()
+        clone.journal = Journal(self.journal.capacity) if journal is None else journal
+        clone.events = EventBus() if events is None else events
+        return clone
+
+    @property
+    def zobrist(self) -> int:
+        """Hash of location, facing, battery and crash flag (a few lookups, so computed on demand)."""
+        key = zobrist_key('robot', self.location, self.facing.value) ^ zobrist_key('battery', self.battery)
+        return key ^ zobrist_key('crashed') if self.is_crashed else key
+
+    def trace(self, board: GameBoard, steps: int) -> Trace:
+        """Where the robot would end up after 'steps' moves from here (see GameBoard.trace)."""
+        return board.trace(self.location, self.facing, steps)
 
     def pay_battery(self, cost: int) -> bool:
         """
@@ -35,7 +103,7 @@ class Robot:
         The main physics step.
         Calculates the next tile based on current facing and attempts to move.
         """
-        if self.is_crashed or self.battery <= 0:
+        if self.is_crashed or self._battery <= 0:
             return  # Robot is dead
 
         # 1. Calculate the coordinate we are moving INTO
@@ -47,7 +115,8 @@ class Robot:
         target_tile = board.get_tile_at(next_pos)
 
         if not target_tile:
-            print(f"⚠️ CRASH: Robot moved off-board at {next_pos}")
+            if self.events.subscribers:
+                self.events.emit(RobotCrashed(next_pos, 'off_board'))
             self._handle_crash()
             return
 
@@ -56,20 +125,23 @@ class Robot:
         entry_side = self._inverse_direction(self.facing)
 
         # 4. Ask the Tile for the Exit
-        # This triggers the Tile's internal logic (Default vs Manual Directive)
-        exit_dir = target_tile.get_exit(entry_side)
+        # A single lookup in the tile's shared transition table (Default vs Manual Directive)
+        exit_dir = target_tile.transitions.exits[entry_side.value]
 
         if exit_dir is None:
-            print(f"⚠️ CRASH: Robot hit a wall at {next_pos}")
+            if self.events.subscribers:
+                self.events.emit(RobotCrashed(next_pos, 'wall'))
             self._handle_crash()
             return
 
         # 5. Success - Update State
+        self.journal.record(MOVE, self, (self.location, self.facing), (next_pos, exit_dir))
         self.location = next_pos
         self.facing = exit_dir
-        self.history.append(self.location)
+        self._path.append(next_pos)
 
-        print(f"🤖 MOVED: {self.location} | Facing: {self.facing.name}")
+        if self.events.subscribers:
+            self.events.emit(RobotMoved(next_pos, exit_dir))
 
     # --- Internal Helpers ---
 
@@ -84,23 +156,35 @@ class Robot:
 
     def _trigger_system_reset(self):
         """Resets robot to the kernel (Start Tile)."""
-        print("🔄 SYSTEM RESET INITIATED...")
+        if self.events.subscribers:
+            self.events.emit(SystemReset((0, 0)))
+        self.journal.record(RESET, self, (self.location, self.facing), ((0, 0), Direction.Up))
         self.location = (0, 0)
         self.facing = Direction.Up
         self.is_crashed = False
-        self.history.clear()
+        self._path.extend((None, (0, 0)))
+
+    # Journal replay (see journal.py): pose changes that keep the move history in step
+
+    def _step(self, pose: Tuple[Coord, Direction], reset: bool = False):
+        self.location, self.facing = pose
+        if reset:
+            self._path.append(None)
+        self._path.append(pose[0])
+
+    def _unstep(self, pose: Tuple[Coord, Direction], reset: bool = False):
+        self.location, self.facing = pose
+        for _ in range(2 if reset else 1):
+            if self._path:
+                self._path.pop()
+        if not self._path:
+            self._path.append(pose[0])
 
     def _get_delta(self, d: Direction) -> Tuple[int, int]:
         # Mapping Direction enum to Grid Math
         # Assuming: Up=0, Left=1, Down=2, Right=3 (Counter-Clockwise)
-        if d == Direction.Up:    return (0, 1)
-        if d == Direction.Left:  return (-1, 0)
-        if d == Direction.Down:  return (0, -1)
-        if d == Direction.Right: return (1, 0)
-        return (0, 0)
+        return DELTAS[d.value]
 
     def _inverse_direction(self, d: Direction) -> Direction:
         # Returns the opposite side (e.g., Up -> Down)
-        # (Value + 2) % 4 works for both Clockwise and Counter-Clockwise
-        # as long as opposites are spaced by 2.
-        return Direction((d.value + 2) % 4)
\ No newline at end of file
+        return INVERSE[d.value]
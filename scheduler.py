@@ -0,0 +1,205 @@
+import heapq
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+# A scheduled card effect: called with the game when its event fires
+Effect = Callable[[Any], Any]
+
+
+class Scheduled(NamedTuple):
+    """One heap entry. Ordered by (priority, seq): lower priority first, then scheduling order."""
+    priority: int
+    seq: int
+    event_type: str
+    effect: Effect
+    tags: Tuple[str, ...]  # What negate() can match on (event type, card id, color, ...)
+    persistent: bool  # Triggers stay after firing; queued events fire once
+    source: str  # Id of the card that scheduled it ('' if none), for error reports
+
+
+# Called with the entry and the exception when an effect raises during fire()
+ErrorHandler = Callable[[Scheduled, Exception], None]
+
+
+SchedulerSnapshot = Tuple[Dict[str, Tuple[Scheduled, ...]], Tuple[Tuple[str, int], ...], int]
+
+
+class EffectScheduler:
+    """
+    Pending card effects, indexed by the event type that fires them.
+    Every event type has its own heap, so scheduling is O(log n) and firing an event
+    only touches the effects waiting for that event, in a deterministic order.
+    Negation is lazy: a cancelled entry stays in its heap until reached, or until dead
+    entries outnumber live ones and the heap is compacted.
+    """
+
+    def __init__(self):
+        self._queues: Dict[str, List[Scheduled]] = {}
+        self._live: Dict[int, Scheduled] = {}  # seq -> entry, for everything not fired or cancelled
+        self._counts: Dict[str, int] = {}  # event type -> live entries in its heap
+        self._by_tag: Dict[str, Set[int]] = {}
+        self._negations: Dict[str, int] = {}  # Armed negations waiting for a matching effect
+        self._seq = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._live)
+
+    def has_pending(self, event_type: str) -> bool:
+        return event_type in self._counts
+
+    def schedule(self, event_type: str, effect: Effect, priority: int = 0,
+                 tags: Iterable[str] = (), persistent: bool = False, source: str = '') -> int:
+        """Adds an effect for 'event_type'. Returns its id (for cancel), or -1 if it was negated on arrival."""
+        tags = (event_type, *tags)
+        for tag in tags:
+            if self._negations.get(tag):
+                self._consume_negation(tag)
+                return -1
+
+        seq = self._seq
+        self._seq += 1
+        entry = Scheduled(priority, seq, event_type, effect, tags, persistent, source)
+        heapq.heappush(self._queues.setdefault(event_type, []), entry)
+        self._live[seq] = entry
+        self._counts[event_type] = self._counts.get(event_type, 0) + 1
+        for tag in tags:
+            self._by_tag.setdefault(tag, set()).add(seq)
+        return seq
+
+    def fire(self, event_type: str, game: Any, on_error: Optional[ErrorHandler] = None) -> int:
+        """
+        Runs everything waiting for 'event_type', in (priority, seq) order, and returns
+        how many effects ran. Effects scheduled while firing wait for the next occurrence.
+        An effect that raises is reported to 'on_error' and the rest still run; without
+        'on_error' the exception propagates and the effects not yet run stay queued.
+        """
+        queue = self._queues.get(event_type)
+        if not queue:
+            return 0
+        self._queues[event_type] = []
+
+        due = [heapq.heappop(queue) for _ in range(len(queue))]
+        fired = 0
+        for i, entry in enumerate(due):
+            if entry.seq not in self._live:
+                continue  # Negated (possibly by an earlier effect in this same batch)
+            if entry.persistent:
+                heapq.heappush(self._queues.setdefault(event_type, []), entry)
+            else:
+                self._forget(entry)
+            try:
+                entry.effect(game)
+            except Exception as e:
+                if on_error is None:
+                    self._requeue(event_type, due[i + 1:])
+                    raise
+                on_error(entry, e)
+            fired += 1
+        return fired
+
+    def cancel(self, seq: int) -> bool:
+        entry = self._live.get(seq)
+        if entry is None:
+            return False
+        self._forget(entry)
+        return True
+
+    def negate(self, tag: str, arm: bool = True) -> int:
+        """
+        Cancels every pending effect carrying 'tag' and returns how many.
+        If none is pending and 'arm' is set, the next effect scheduled with the tag is cancelled instead.
+        """
+        seqs = self._by_tag.pop(tag, None)
+        cancelled = 0
+        for seq in sorted(seqs or ()):
+            entry = self._live.get(seq)
+            if entry is not None:
+                self._forget(entry)
+                cancelled += 1
+        if not cancelled and arm:
+            self._negations[tag] = self._negations.get(tag, 0) + 1
+        return cancelled
+
+    def take(self, event_type: str) -> List[Scheduled]:
+        """
+        Removes and returns the live entries for 'event_type' without running them.
+        Used for multipliers, whose 'effect' is the factor rather than a callable.
+        """
+        queue = self._queues.pop(event_type, None)
+        if not queue:
+            return []
+        taken = []
+        for entry in sorted(queue):
+            if entry.seq in self._live:
+                self._forget(entry)
+                taken.append(entry)
+        return taken
+
+    def clear(self):
+        self.__init__()
+
+    # --- Internal Helpers ---
+
+    def _forget(self, entry: Scheduled):
+        del self._live[entry.seq]
+        event_type = entry.event_type
+        left = self._counts[event_type] - 1
+        if left:
+            self._counts[event_type] = left
+            queue = self._queues.get(event_type)
+            if queue is not None and len(queue) > 2 * left:
+                queue[:] = [e for e in queue if e.seq in self._live]
+                heapq.heapify(queue)
+        else:
+            del self._counts[event_type]
+            self._queues.pop(event_type, None)
+        for tag in entry.tags:
+            seqs = self._by_tag.get(tag)
+            if seqs is not None:
+                seqs.discard(entry.seq)
+                if not seqs:
+                    del self._by_tag[tag]
+
+    def _requeue(self, event_type: str, entries: List[Scheduled]):
+        """Puts popped entries that never ran back in their heap."""
+        queue = self._queues.setdefault(event_type, [])
+        for entry in entries:
+            if entry.seq in self._live:
+                heapq.heappush(queue, entry)
+
+    def _consume_negation(self, tag: str):
+        left = self._negations[tag] - 1
+        if left:
+            self._negations[tag] = left
+        else:
+            del self._negations[tag]
+
+    # --- Search Support ---
+
+    def snapshot(self) -> SchedulerSnapshot:
+        """Live entries per event type, armed negations and the sequence counter."""
+        live = self._live
+        return (
+            {t: tuple(e for e in q if e.seq in live) for t, q in self._queues.items() if q},
+            tuple(self._negations.items()),
+            self._seq
+        )
+
+    def restore(self, snapshot: SchedulerSnapshot):
+        queues, negations, seq = snapshot
+        self.__init__()
+        for event_type, entries in queues.items():
+            queue = self._queues[event_type] = list(entries)
+            heapq.heapify(queue)  # Dropping dead entries can break the heap order
+            self._counts[event_type] = len(entries)
+            for entry in entries:
+                self._live[entry.seq] = entry
+                for tag in entry.tags:
+                    self._by_tag.setdefault(tag, set()).add(entry.seq)
+        self._negations = dict(negations)
+        self._seq = seq
+
+    def clone(self) -> 'EffectScheduler':
+        clone = EffectScheduler()
+        clone.restore(self.snapshot())
+        return clone
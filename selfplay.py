@@ -0,0 +1,181 @@
+import argparse
+import os
+import random
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Deque, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from card import GameCard
+from game import DirectiveGame
+from hydrate import load_deck
+from player import Player
+from Tiles.tilePile import generate_tile_pile
+
+# A policy picks the card to play from the player's hand (or None to pass)
+Policy = Callable[[DirectiveGame, Player, random.Random], Optional[GameCard]]
+
+
+class GameRecord(NamedTuple):
+    """Compact per-game result streamed back from the workers."""
+    seed: int
+    winner: int  # Player index, or -1 for a tie
+    scores: Tuple[int, ...]
+    turns: int
+    cards_played: int
+
+
+# --- POLICIES ---
+
+def random_policy(game: DirectiveGame, player: Player, rng: random.Random) -> Optional[GameCard]:
+    return rng.choice(player.hand) if player.hand else None
+
+def first_policy(game: DirectiveGame, player: Player, rng: random.Random) -> Optional[GameCard]:
+    return player.hand[0] if player.hand else None
+
+# Policies are sent to workers by name, so they never need pickling
+POLICIES: Dict[str, Policy] = {
+    "random": random_policy,
+    "first": first_policy,
+}
+
+
+# --- SINGLE GAME ---
+
+def play_game(cards: List[GameCard], seed: int, players: int, policy: Policy,
+              max_turns: int = 60, hand_size: int = 3) -> GameRecord:
+    """
+    Plays one seeded game. Each turn the current player draws a card, plays one
+    from their hand, places a tile next to the board and the robot takes a step.
+    """
+    game = DirectiveGame(cards, players, seed)
+    tiles = generate_tile_pile(game.stream('tiles'))
+    rng = game.stream('policy')
+    for p in game.players:
+        p.hand.extend(game.card_decks.draw(hand_size))
+
+    cards_played = 0
+    turn = 0
+    for turn in range(1, max_turns + 1):
+        player = game.current_player
+
+        # Draw
+        player.hand.extend(game.card_decks.draw(1))
+
+        # Program + Execute
+        card = policy(game, player, rng)
+        if card is not None:
+            player.hand.remove(card)
+            card.execute(game)
+            game.fire('post_activation')
+            game.card_decks.discard_one(card)
+            cards_played += 1
+
+        # Build
+        tile = tiles.draw_one()
+        if tile is not None and game.board.valid_slots:
+            game.board.place_tile(tile, rng.choice(sorted(game.board.valid_slots)))
+            tile.ownership = player
+            player.owned_tiles.append(tile)
+
+        # Move
+        game.robot.move(game.board)
+
+        game.current_player_idx = (game.current_player_idx + 1) % players
+
+    # Score
+    scores = tuple(game.calculate_global_scores().values())
+    best = max(scores)
+    winner = scores.index(best) if scores.count(best) == 1 else -1
+    return GameRecord(seed, winner, scores, turn, cards_played)
+
+
+# --- WORKERS ---
+
+# Hydrated once per worker process by the pool initializer, then reused for every game
+_WORKER_CARDS: Optional[List[GameCard]] = None
+_WORKER_CARDS_PATH: Optional[str] = None
+
+
+def load_cards(cards_path: str) -> List[GameCard]:
+    return [GameCard(h) for h in load_deck(cards_path)]
+
+
+def _init_worker(cards_path: str):
+    global _WORKER_CARDS, _WORKER_CARDS_PATH
+    # Forked workers inherit the deck run_batch loaded in the parent
+    if _WORKER_CARDS_PATH != cards_path:
+        _WORKER_CARDS = load_cards(cards_path)
+        _WORKER_CARDS_PATH = cards_path
+
+
+def _run_chunk(seeds: Sequence[int], players: int, policy: Union[str, Policy], max_turns: int) -> List[GameRecord]:
+    play = POLICIES[policy] if isinstance(policy, str) else policy
+    return [play_game(_WORKER_CARDS, seed, players, play, max_turns) for seed in seeds]
+
+
+def run_batch(seeds: Sequence[int], players: int = 2, policy: Union[str, Policy] = "random",
+              workers: Optional[int] = None, chunk_size: int = 64, max_turns: int = 60,
+              cards_path: str = 'cards.json') -> Iterator[GameRecord]:
+    """
+    Plays one game per seed across a process pool and streams the records back in seed order.
+    Only a bounded number of chunks is in flight, so seed ranges of any size are fine.
+    Custom policies must be module-level functions (they are pickled); built-ins go by name.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = workers * 4
+    _init_worker(cards_path)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(cards_path,)) as pool:
+        chunks = (seeds[i:i + chunk_size] for i in range(0, len(seeds), chunk_size))
+        in_flight: Deque = deque()
+
+        for chunk in chunks:
+            in_flight.append(pool.submit(_run_chunk, chunk, players, policy, max_turns))
+            if len(in_flight) >= max_in_flight:
+                yield from in_flight.popleft().result()
+
+        while in_flight:
+            yield from in_flight.popleft().result()
+
+
+# --- Main Execution Block ---
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Seeded batch self-play.")
+    parser.add_argument('--start', type=int, default=0, help="First seed")
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--players', type=int, default=2)
+    parser.add_argument('--policy', choices=sorted(POLICIES), default="random")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--turns', type=int, default=60)
+    parser.add_argument('--profile', metavar='PATH', default=None,
+                        help="Play in-process with instrumentation; print the phase table and "
+                             "write collapsed stacks (flamegraph input) to PATH")
+    args = parser.parse_args()
+
+    if args.profile:
+        from instrument import Profiler
+
+        cards = load_cards('cards.json')
+        with Profiler() as profiler:
+            policy = profiler.wrap(POLICIES[args.policy], 'program')
+            for seed in range(args.start, args.start + args.games):
+                play_game(cards, seed, args.players, policy, args.turns)
+        print(profiler.format_table())
+        profiler.write_collapsed(args.profile)
+        print(f"Collapsed stacks written to {args.profile}")
+        raise SystemExit
+
+    wins = [0] * (args.players + 1)  # Last slot counts ties
+    total_cards = 0
+    started = time.perf_counter()
+    for record in run_batch(range(args.start, args.start + args.games), args.players,
+                            args.policy, args.workers, max_turns=args.turns):
+        wins[record.winner] += 1
+        total_cards += record.cards_played
+
+    elapsed = time.perf_counter() - started
+    print(f"Played {args.games} games ({total_cards} cards) in {elapsed:.2f}s ({args.games / elapsed:,.0f} games/s).")
+    for i in range(args.players):
+        print(f"  Player {i}: {wins[i]} wins")
+    print(f"  Ties: {wins[-1]}")
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# The modules are flat scripts: make the repository root and cardDesign importable
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.join(ROOT, 'cardDesign')):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,308 @@
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from actionCache import ACTION_CACHE
+from actionInterpreter import ACTION_INTERPRETER, DISPATCH, ActionInterpreter, action_key, compile_action
+
+CARDS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cards.json')
+
+
+def card_actions():
+    """(where, action) for every distinct action in cards.json."""
+    with open(CARDS_PATH) as f:
+        colors = json.load(f)
+    actions = {}
+    for color in colors:
+        actions.setdefault(json.dumps(color['delete']['action'], sort_keys=True), color['color'] + ' delete')
+        for card in color['cards']:
+            for slot in ('execute', 'write', 'delete'):
+                if slot in card:
+                    actions.setdefault(json.dumps(card[slot]['action'], sort_keys=True), f"{card['id']} {slot}")
+    return [(where, json.loads(action)) for action, where in actions.items()]
+
+
+ACTIONS = card_actions()
+
+
+# --- STUB GAME ---
+
+class StubCards(list):
+    def count_color(self, color):
+        return self.count(color)
+
+    def has_color(self, color):
+        return color in self
+
+    def has_duplicate(self, title):
+        return self.count(title) > 1
+
+
+class StubGame:
+    """
+    Implements every game call the card lambdas make. Effects are logged and return
+    the receiver (so calls chain); queries answer from the state given to __init__;
+    scheduled callbacks are kept so the test can run them.
+    """
+
+    def __init__(self, name='g', log=None, callbacks=None, **state):
+        self.name = name
+        self.log = [] if log is None else log
+        self.callbacks = [] if callbacks is None else callbacks
+        self.vp = 0
+        self.battery = state.get('battery', 5)
+        self.max_battery = state.get('max_battery', 10)
+        self.pc = state.get('pc', 2)
+        self.hand = StubCards(state.get('hand', ['Blue', 'Red']))
+        self.stack = StubCards(state.get('stack', ['Yellow', 'Yellow', 'Red']))
+        self.discard = StubCards(state.get('discard', ['Green'] * 7))
+        self.board_tiles = [None] * state.get('tiles', 9)
+        self.stack_size = len(self.stack)
+        self.max_hand_size = 7
+        self.safe_turn_count = state.get('safe_turns', 2)
+        self.current_move_distance = state.get('distance', 3)
+        self.entry_vector = state.get('vector', 'N')
+        self.next_tile_color = state.get('next_color', 'Red')
+        self.has_triggered_stack = state.get('triggered', False)
+        self._flags = state
+
+        owner = state.get('next_owner', 'self')
+        self.next_tile = SimpleNamespace(owner=owner)
+        self.prev_tile = SimpleNamespace(owner=state.get('prev_owner', owner))
+        self.current_tile = SimpleNamespace(is_edge=state.get('edge', False))
+        self.last_drawn = SimpleNamespace(color=state.get('last_color', 'Blue'))
+        self.current_card = SimpleNamespace(title='Blue')
+        self.previous_tile_card = 'previous_tile_card'
+
+    def _record(self, name, args, kwargs):
+        # Stub results passed back in (g.swap_active_cards(g.target_opponent())) go by name
+        self.log.append((self.name, name, tuple(map(_named, args)),
+                         {key: _named(val) for key, val in kwargs.items()}))
+
+    def _result(self, name, *args, **kwargs):
+        """Logs a call whose result is another object the lambda may keep calling."""
+        self._record(name, args, kwargs)
+        return StubGame(f"{self.name}.{name}", self.log, self.callbacks)
+
+    # --- Queries ---
+
+    def is_next_empty(self):
+        return self._flags.get('next_empty', False)
+
+    def is_next_owned(self):
+        return self._flags.get('next_owned', False)
+
+    def is_at_corner(self):
+        return self._flags.get('corner', False)
+
+    def check_line_owned(self, length):
+        return self._flags.get('line', 0) >= length
+
+    def count_neighbors(self, owner):
+        return self._flags.get('neighbors', 1)
+
+    def count_tiles(self, owner):
+        return len(self.board_tiles) // 2
+
+    def count_unique_stack_colors(self):
+        return len(set(self.stack))
+
+    def count_stack_color(self, color):
+        return self.stack.count(color)
+
+    def calculate_max_path_length(self):
+        return self._flags.get('path', 4)
+
+    def predict_vp(self, pc):
+        return self._flags.get('next_vp', 0)
+
+    def find_next_color(self, color):
+        return self.pc + 1 + self.stack.count(color)
+
+    # --- Results ---
+
+    def target_opponent(self):
+        return self._result('target_opponent')
+
+    def reveal_hand(self):
+        return self._result('reveal_hand')
+
+    def peek_deck(self, count):
+        return self._result('peek_deck', count)
+
+    def peek_stack(self, target):
+        return self._result('peek_stack', target)
+
+    def peek_opponent_hand(self):
+        return self._result('peek_opponent_hand')
+
+    def discard_hand(self, cards='all'):
+        self.log.append((self.name, 'discard_hand', (cards,), {}))
+        discarded = list(self.hand)
+        self.hand.clear()
+        return discarded if cards == 'all' else self
+
+    def prompt_color(self):
+        return 'prompted_color'
+
+    def prompt_hand(self):
+        return 'prompted_hand'
+
+    def prompt_index(self):
+        return 4
+
+    def prompt_stack_card(self):
+        return 'prompted_stack_card'
+
+    def prompt_tile(self, **kwargs):
+        return ('prompted_tile', tuple(sorted(kwargs.items())))
+
+    def prompt_title(self):
+        return 'prompted_title'
+
+    # --- State ---
+
+    def add_vp(self, amount):
+        self.log.append((self.name, 'add_vp', (amount,), {}))
+        self.vp += amount
+        return self
+
+    def add_battery(self, amount):
+        self.log.append((self.name, 'add_battery', (amount,), {}))
+        self.battery += amount
+        return self
+
+    def set_pc(self, pc):
+        self.log.append((self.name, 'set_pc', (pc,), {}))
+        self.pc = pc
+        return self
+
+    def inc_pc(self, amount):
+        self.log.append((self.name, 'inc_pc', (amount,), {}))
+        self.pc += amount
+        return self
+
+    def draw(self, count):
+        self.log.append((self.name, 'draw', (count,), {}))
+        self.hand.extend(['Green'] * count)
+        return self
+
+    # --- Scheduling ---
+
+    def _schedule(self, name, key, effect):
+        self.log.append((self.name, name, (key,), {}))
+        self.callbacks.append(effect)
+        return self
+
+    def queue_event(self, event, effect):
+        return self._schedule('queue_event', event, effect)
+
+    def add_trigger(self, event, effect):
+        return self._schedule('add_trigger', event, effect)
+
+    def queue_trap(self, target, effect):
+        return self._schedule('queue_trap', target, effect)
+
+    def queue_callback(self, effect):
+        return self._schedule('queue_callback', None, effect)
+
+
+def _named(value):
+    return value.name if isinstance(value, StubGame) else value
+
+
+def _effect(name):
+    def effect(self, *args, **kwargs):
+        self._record(name, args, kwargs)
+        return self
+    effect.__name__ = name
+    return effect
+
+
+# Calls that only change state the test doesn't model: logged, and chain on the receiver
+EFFECTS = (
+    'add_buff', 'add_debuff', 'add_extra_turn', 'add_to_board', 'all_opponents_discard',
+    'all_players_draw', 'all_players_lose_vp', 'all_players_recycle_hand', 'apply_cost_to_next_card',
+    'apply_global_status', 'apply_immunity', 'apply_stack_modifier', 'apply_status', 'apply_trap',
+    'apply_vp_tax', 'cancel_current_action', 'copy_tile_layout', 'cost', 'create_temp_bridge',
+    'discard', 'discard_by_color', 'discard_from_deck', 'discard_named', 'discard_random',
+    'discard_stack_top', 'discard_tiles', 'draw_tiles', 'draw_to_limit', 'emulate_path', 'end_turn',
+    'enforce_hand_limit', 'execute_card', 'execute_hand_card', 'execute_stack_range',
+    'force_rotate_owned', 'invert_exits', 'invert_tile_exits', 'keep_matches', 'keep_or_discard',
+    'keep_to_hand', 'lock_row_shift', 'mark_triggered', 'modify_current_move', 'modify_exit',
+    'modify_movement', 'modify_next_card_params', 'modify_next_type', 'move_card', 'move_robot',
+    'move_robot_lateral', 'move_robot_linear', 'move_to_isolated', 'move_to_opponent_stack',
+    'move_to_stack_top', 'negate_action', 'overlay_tile', 'place_tile', 'place_token',
+    'protect_ownership', 'queue_delayed_action', 'queue_multiplier', 'redistribute_tiles',
+    'remove_adjacent_tiles', 'reorder', 'reorder_stack', 'replace_next_stack_card', 'restrict_color',
+    'restrict_type', 'reverse_robot_vector', 'rotate_tile', 'search_deck', 'send_to_bottom',
+    'set_adjacency', 'set_owner', 'set_tile_color', 'shift_board', 'shift_row_to_low_density',
+    'shuffle', 'shuffle_bottom', 'stash_card', 'steal_random_card', 'steal_vp', 'stop_robot',
+    'stop_robot_processing', 'swap_active_cards', 'swap_physical_position', 'swap_tiles',
+    'swap_with_stack', 'to_bottom', 'to_stack', 'transfer_stack_card', 'trap_color',
+    'trigger_adjacent_write', 'trigger_owned_in_row', 'trigger_stack_at', 'unstash_card', 'warp_robot',
+)
+for _name in EFFECTS:
+    setattr(StubGame, _name, _effect(_name))
+
+
+# Two games far enough apart that every condition in the deck goes both ways
+STATES = (
+    {},
+    dict(battery=10, pc=0, hand=[], stack=['Blue'] * 6, discard=[], tiles=2, vector='E',
+         next_color='Blue', next_owner='neutral', prev_owner='self', triggered=True, next_empty=True,
+         next_owned=True, corner=True, line=3, neighbors=0, edge=True, last_color='Red', next_vp=2),
+)
+
+
+def outcome(action_func, state):
+    """What a play did to a stub game: calls (scheduled effects run too), VP, battery, PC and result or error."""
+    game = StubGame(**state)
+    try:
+        result = _named(action_func(game))
+        for effect in list(game.callbacks):
+            effect(game)
+    except Exception as e:
+        result = type(e).__name__
+    return game.log, game.vp, game.battery, game.pc, result
+
+
+# --- PARITY ---
+
+@pytest.mark.parametrize('where, action', ACTIONS, ids=[where for where, _ in ACTIONS])
+def test_interpreter_matches_the_card_lambda(where, action):
+    resolved = ACTION_INTERPRETER.resolve(action)
+    card_lambda = ACTION_CACHE.get(action['function'])
+    for state in STATES:
+        assert outcome(resolved, state) == outcome(card_lambda, state)
+
+
+def test_every_handler_runs_some_card():
+    interpreted = {action_key(action) for _, action in ACTIONS if compile_action(action) is not None}
+    assert interpreted == set(DISPATCH)
+
+
+def test_params_that_fall_short_of_the_lambda_use_the_lambda():
+    # BLU-005's params say "draw 1", but its lambda draws two tiles, keeps one and bottoms one
+    action = {"type": "DECK_OP", "params": {"op": "draw", "target": "hand", "count": 1},
+              "function": "lambda g: g.draw_tiles(2).keep_to_hand(1).send_to_bottom(1)"}
+    assert compile_action(action) is None
+    assert ACTION_INTERPRETER.resolve(action) is ACTION_CACHE.get(action['function'])
+
+    action = dict(action, function="lambda g: g.draw(1)")
+    assert compile_action(action) is not None
+
+
+def test_resolve_counts_hits_and_misses():
+    interpreter = ActionInterpreter()
+    for _, action in ACTIONS:
+        interpreter.resolve(action)
+    first = interpreter.resolve(ACTIONS[0][1])
+    assert interpreter.resolve(ACTIONS[0][1]) is first
+
+    stats = interpreter.stats()
+    assert (stats['hits'], stats['misses']) == (2, len(ACTIONS))
+    assert stats['interpreted'] + stats['compiled'] == len(ACTIONS)
+    assert 0 < stats['interpreted'] < len(ACTIONS)
@@ -0,0 +1,64 @@
+import random
+import turtle
+
+from Bounds import Bounds
+from DisplayList import Recorder, MOVE, LINE, PEN
+
+
+def test_unpatched_calls_see_the_true_position(monkeypatch):
+    """setx / color / dot mixed with forward inside a Bounds block."""
+    dots = []
+    with Recorder() as recorder:
+        # The Recorder has no dot or color; stand in for the Tk ones
+        monkeypatch.setattr(turtle, 'dot', lambda *args: dots.append(recorder.pos()))
+        monkeypatch.setattr(turtle, 'color', lambda *args: recorder.pencolor(*args))
+
+        with Bounds(100, 100):
+            turtle.pendown()
+            turtle.forward(10)
+            turtle.setx(20)
+            assert (turtle.xcor(), turtle.ycor()) == (20, 0)
+            turtle.color('red')
+            turtle.forward(10)
+            turtle.dot(5)
+            turtle.sety(70)  # Leaves the bounds at y = 50
+            assert (turtle.xcor(), turtle.ycor()) == (30, 70)
+
+    assert dots == [(30, 0)]
+    assert recorder.display_list.ops == [
+        (MOVE, 0.0, 0.0),
+        (PEN, 'black', 1.0), (LINE, 10.0, 0.0), (LINE, 20, 0.0),
+        (MOVE, 20, 0.0),
+        (PEN, 'red', 1.0), (LINE, 30.0, 0.0),
+        (MOVE, 30.0, 0.0), (LINE, 30.0, 50.0),
+        (MOVE, 30.0, 70),
+    ]
+
+
+def test_home_goes_through_the_clipped_path():
+    with Recorder() as recorder:
+        with Bounds(100, 100):
+            turtle.pendown()
+            turtle.goto(80, 0)
+            turtle.left(90)
+            turtle.home()
+            assert turtle.pos() == (0.0, 0.0)
+            assert turtle.heading() == 0
+
+    lines = [op for op in recorder.display_list.ops if op[0] == LINE]
+    assert lines == [(LINE, 50.0, 0.0), (LINE, 0.0, 0.0)]
+
+
+def test_render_without_a_stream_is_repeatable():
+    import Honeycomb
+
+    def render():
+        with Recorder() as recorder:
+            Honeycomb.renderCard()
+        return recorder.display_list.ops
+
+    state = random.getstate()
+    first = render()
+    random.seed(5)
+    assert render() == first
+    random.setstate(state)
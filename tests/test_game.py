@@ -0,0 +1,131 @@
+import os
+import random
+
+import pytest
+
+from direction import Orientation
+from game import DirectiveGame
+from journal import Journal
+from selfplay import load_cards
+from Tiles.tilePile import generate_tile_pile
+from zobrist import tile_key
+
+CARDS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cards.json')
+
+
+@pytest.fixture(scope='module')
+def cards():
+    return load_cards(CARDS_PATH)
+
+
+def state(game: DirectiveGame) -> tuple:
+    """The game worked out from scratch (not from any cached snapshot)."""
+    board, decks = game.board, game.card_decks
+    return (
+        tuple(sorted((c, id(t), t.orientation, id(t.ownership)) for c, t in board.grid.items())),
+        frozenset(board.valid_slots), board.zobrist,
+        tuple(sorted((slot, tuple(sorted(s.items()))) for slot, s in board.feeders.items())),
+        game.robot.snapshot(), tuple(game.robot.history),
+        tuple(map(id, decks.draw_pile.items)), tuple(map(id, decks.discard_pile.items)),
+        decks.draw_pile.hash, decks.discard_bits,
+        tuple(p.snapshot() for p in game.players), game.pc, game.rng.getstate(),
+    )
+
+
+def play(game: DirectiveGame, tiles, rng: random.Random, changes: int = 12):
+    for _ in range(changes):
+        op = rng.randrange(5)
+        if op == 0 and game.board.valid_slots:
+            game.board.place_tile(tiles.draw_one(), rng.choice(sorted(game.board.valid_slots)))
+        elif op == 1:
+            rng.choice(list(game.board.grid.values())).rotate()
+        elif op == 2:
+            game.robot.move(game.board)
+        elif op == 3:
+            game.players[0].hand.extend(game.card_decks.draw(2))
+        else:
+            game.card_decks.discard(game.card_decks.draw(3))
+            game.pc += 1
+            game.rng.random()
+
+
+@pytest.fixture
+def setup(cards):
+    game = DirectiveGame(cards, 2, seed=3)
+    return game, generate_tile_pile(game.stream('tiles')), random.Random(3)
+
+
+def test_restore_undoes_through_the_journal(setup):
+    game, tiles, rng = setup
+    play(game, tiles, rng)
+    snapshot, expected = game.snapshot(), state(game)
+    mark = game.journal.mark()
+
+    for _ in range(3):
+        play(game, tiles, rng)
+        game.restore(snapshot)
+        assert state(game) == expected
+        assert game.journal.mark() == mark and not game.journal._redo
+        assert game.snapshot() == snapshot
+
+
+def test_restore_rebuilds_once_the_history_was_rewritten(setup):
+    game, tiles, rng = setup
+    root = game.snapshot()
+    play(game, tiles, rng)
+    branch, expected = game.snapshot(), state(game)
+
+    game.restore(root)
+    play(game, tiles, rng)
+    assert not game.journal.reaches(branch.journal)
+    game.restore(branch)
+    assert state(game) == expected
+
+
+def test_restore_rebuilds_once_the_journal_forgot(cards):
+    game = DirectiveGame(cards, 2, seed=3, journal_capacity=8)
+    tiles, rng = generate_tile_pile(game.stream('tiles')), random.Random(3)
+    snapshot, expected = game.snapshot(), state(game)
+    play(game, tiles, rng, changes=30)
+    assert not game.journal.reaches(snapshot.journal)
+    game.restore(snapshot)
+    assert state(game) == expected
+
+
+def test_anchor_on_an_empty_log_does_not_survive_clear():
+    journal = Journal()
+    anchor = journal.anchor()
+    assert journal.reaches(anchor)
+    journal.clear()
+    assert not journal.reaches(anchor)
+
+
+def test_board_restore_detaches_tiles_placed_since(setup):
+    game, tiles, rng = setup
+    board = game.board
+    snapshot = board.snapshot()
+    tile = tiles.draw_one()
+    board.place_tile(tile, sorted(board.valid_slots)[0])
+
+    board.restore(snapshot)
+    zobrist, mark = board.zobrist, game.journal.mark()
+    tile.rotate()
+    tile.ownership = game.players[0]
+    assert (board.zobrist, game.journal.mark()) == (zobrist, mark)
+    assert board.snapshot() is snapshot
+
+
+def test_setting_a_placed_tiles_orientation_updates_the_board(setup):
+    game, tiles, rng = setup
+    board = game.board
+    tile = tiles.draw_one()
+    coords = sorted(board.valid_slots)[0]
+    board.place_tile(tile, coords)
+    expected, mark = state(game), game.journal.mark()
+
+    tile.orientation = Orientation((tile.orientation.value + 1) % 4)
+    assert board._tile_keys[coords] == tile_key(coords, tile)
+    assert game.journal.mark() == mark + 1
+
+    game.journal.undo_to(mark)
+    assert state(game) == expected
@@ -0,0 +1,34 @@
+import os
+import shutil
+
+from hydrate import LazyDeck, hydrate_json, load_deck, run_hydration
+
+CARDS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cards.json')
+
+
+def test_load_deck_builds_then_reads_the_cache(tmp_path):
+    cards_path = str(tmp_path / 'cards.json')
+    shutil.copy(CARDS_PATH, cards_path)
+    parsed = hydrate_json(cards_path)
+
+    built = load_deck(cards_path)  # Writes the cache
+    cached = load_deck(cards_path)  # Reads it back
+    assert isinstance(cached, LazyDeck)
+    assert os.listdir(tmp_path / '__pycache__')
+    for deck in (built, cached):
+        assert len(deck) == len(parsed)
+        assert list(deck) == parsed
+    assert cached[-1] == parsed[-1]
+    assert cached[2:5] == parsed[2:5]
+    assert [card.number for card in cached] == list(range(len(parsed)))
+
+
+def test_run_hydration(tmp_path, capsys):
+    cards_path = str(tmp_path / 'cards.json')
+    shutil.copy(CARDS_PATH, cards_path)
+    for _ in range(2):  # Parsed, then from the cache
+        deck = run_hydration(cards_path)
+        first = deck[0]
+        out = capsys.readouterr().out
+        assert f"Successfully hydrated {len(deck)} cards." in out
+        assert f"Execute Logic: {first.execute['action']['function']}" in out
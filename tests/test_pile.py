@@ -0,0 +1,74 @@
+import random
+
+from journal import Journal
+from pile import Pile
+from zobrist import zobrist_key
+
+
+def make_pile(items=range(10)):
+    return Pile(items, random.Random(1)).track_hash(lambda item: zobrist_key('test', item))
+
+
+def rehashed(pile):
+    """A fresh pile with the same contents, hashed from scratch."""
+    return Pile((), random.Random(0)).track_hash(pile.key).restore(pile.snapshot())
+
+
+def test_items_is_a_list_top_first():
+    pile = make_pile()
+    items = pile.items
+    assert isinstance(items, list)
+    assert items[:3] == pile.draw(3)
+    assert pile.items == items[3:]
+
+    pile.add_to_top(['a', 'b'])
+    pile.add_to_bottom(['y', 'z'])
+    assert pile.items == ['a', 'b'] + items[3:] + ['y', 'z']
+    assert len(pile) == len(items) + 1
+
+
+def test_assigning_items_replaces_the_contents():
+    pile = make_pile()
+    pile.items = sorted(pile.items)
+    assert pile.items == list(range(10))
+    assert pile.hash == rehashed(pile).hash
+
+
+def test_hash_follows_every_change():
+    pile = make_pile()
+    pile.draw(2)
+    pile.add_to_top([42])
+    pile.add_to_bottom([7, 8])
+    pile._pop_bottom(1)
+    pile.shuffle()
+    assert (pile.hash, pile._weight) == (rehashed(pile).hash, rehashed(pile)._weight)
+
+
+def test_journal_entries_stay_fixed_size():
+    journal = Journal()
+    draw, discard = make_pile(), make_pile(range(10, 15))
+    draw.journal = discard.journal = journal
+    start = draw.snapshot(), discard.snapshot(), draw.hash, discard.hash
+    mark = journal.mark()
+
+    discard.add_to_top(draw.draw(3))
+    draw.add_to_bottom(['x', 'y'])
+    discard.move_to_bottom(draw)
+    draw.shuffle()
+    assert len(journal) == 3 + 3 + 2 + 1 + 1
+    assert all(not isinstance(delta.after, (list, tuple)) for delta in journal.entries)
+    end = draw.snapshot(), discard.snapshot(), draw.hash, discard.hash
+
+    journal.undo_to(mark)
+    assert (draw.snapshot(), discard.snapshot(), draw.hash, discard.hash) == start
+    journal.redo(len(journal._redo))
+    assert (draw.snapshot(), discard.snapshot(), draw.hash, discard.hash) == end
+
+
+def test_piles_without_an_rng_do_not_use_the_global_one():
+    state = random.getstate()
+    first = Pile(range(20))
+    random.seed(99)
+    assert Pile(range(20)).items == first.items
+    assert random.getstate() == random.Random(99).getstate()
+    random.setstate(state)
@@ -0,0 +1,40 @@
+from types import SimpleNamespace
+
+from direction import Direction
+from journal import Journal
+from robot import Robot
+
+# A tile the robot goes straight through (exits indexed by entry side), on an endless board
+STRAIGHT = SimpleNamespace(transitions=SimpleNamespace(
+    exits=(Direction.Down, Direction.Right, Direction.Up, Direction.Left)))
+OPEN_BOARD = SimpleNamespace(get_tile_at=lambda coords: STRAIGHT)
+
+
+def test_history_is_not_crowded_out_by_other_entries():
+    journal = Journal(8)
+    robot = Robot(journal=journal, history_limit=4)
+    for _ in range(3):
+        robot.move(OPEN_BOARD)
+        for value in range(5, 9):
+            robot.battery = value
+    assert robot.history == [(0, 0), (0, 1), (0, 2), (0, 3)]
+
+    robot.move(OPEN_BOARD)
+    assert robot.history == [(0, 1), (0, 2), (0, 3), (0, 4)]
+
+
+def test_history_follows_undo_and_redo():
+    journal = Journal()
+    robot = Robot(journal=journal)
+    robot.move(OPEN_BOARD)
+    robot.move(OPEN_BOARD)
+    mark = journal.mark()
+    robot.move(OPEN_BOARD)
+    robot._trigger_system_reset()
+    robot.move(OPEN_BOARD)
+    assert robot.history == [(0, 0), (0, 1)]
+
+    journal.undo_to(mark)
+    assert robot.history == [(0, 0), (0, 1), (0, 2)]
+    journal.redo(3)
+    assert robot.history == [(0, 0), (0, 1)]
@@ -0,0 +1,54 @@
+from scheduler import EffectScheduler
+
+
+def noop(game):
+    pass
+
+
+def test_has_pending_ignores_cancelled_and_negated_entries():
+    scheduler = EffectScheduler()
+    seq = scheduler.schedule('on_move', noop)
+    scheduler.schedule('on_move', noop, tags=('BLU-001',))
+    assert scheduler.has_pending('on_move')
+
+    scheduler.cancel(seq)
+    assert scheduler.has_pending('on_move')
+    scheduler.negate('BLU-001')
+    assert not scheduler.has_pending('on_move')
+    assert scheduler.fire('on_move', None) == 0
+
+
+def test_dead_entries_do_not_pile_up():
+    scheduler = EffectScheduler()
+    scheduler.schedule('on_move', noop, persistent=True)
+    for _ in range(100):
+        scheduler.cancel(scheduler.schedule('on_move', noop))
+    assert len(scheduler._queues['on_move']) <= 2
+    assert scheduler.fire('on_move', None) == 1
+
+    scheduler.negate('on_move')
+    assert 'on_move' not in scheduler._queues
+
+
+def test_persistent_entries_stay_pending_after_firing():
+    scheduler = EffectScheduler()
+    ran = []
+    scheduler.schedule('on_move', ran.append, persistent=True)
+    scheduler.schedule('on_move', ran.append)
+    assert scheduler.fire('on_move', 'g') == 2
+    assert scheduler.has_pending('on_move')
+    assert scheduler.fire('on_move', 'g') == 1
+    assert ran == ['g'] * 3
+
+
+def test_restore_counts_live_entries():
+    scheduler = EffectScheduler()
+    scheduler.schedule('on_move', noop)
+    snapshot = scheduler.snapshot()
+    scheduler.fire('on_move', None)
+    assert not scheduler.has_pending('on_move')
+
+    scheduler.restore(snapshot)
+    assert scheduler.has_pending('on_move')
+    assert scheduler.fire('on_move', None) == 1
+    assert not scheduler.has_pending('on_move')
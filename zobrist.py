@@ -0,0 +1,96 @@
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from rng import derive_seed
+
+# 64-bit Zobrist hashing of game positions.
+# Every feature ('tile at coord with kind/orientation', 'robot at coord facing d', ...) gets a
+# fixed random key; a position's hash is the XOR of its features' keys, so a change is undone
+# by XOR-ing the old key out and the new one in. Keys are derived from ZOBRIST_SEED, so they
+# are the same in every process.
+
+MASK64 = (1 << 64) - 1
+ZOBRIST_SEED = 0x5EED_2B15
+
+# Ordered piles can't be a plain XOR (a push moves every card down one place), so they use a
+# polynomial: sum of key(card_i) * PILE_BASE^i mod 2^64, top card i = 0. Pushing or popping
+# at either end is then one multiply-add. PILE_BASE is odd, so it has an inverse mod 2^64.
+PILE_BASE = 0x9E37_79B9_7F4A_7C15
+PILE_BASE_INVERSE = pow(PILE_BASE, -1, 1 << 64)
+
+_KEYS: Dict[Tuple[Hashable, ...], int] = {}
+
+
+def zobrist_key(*feature: Hashable) -> int:
+    """The fixed 64-bit key of a feature, e.g. zobrist_key('robot', (0, 0), 2)."""
+    key = _KEYS.get(feature)
+    if key is None:
+        key = _KEYS[feature] = derive_seed(ZOBRIST_SEED, *feature)
+    return key
+
+
+def tile_key(coords, tile) -> int:
+    """Type, orientation, flip and owner of the tile placed at 'coords'."""
+    base = tile.wrapped_tile if tile._flipped else tile
+    key = zobrist_key('tile', coords, type(base).__name__, tile.orientation.value, tile._flipped)
+    owner = tile.ownership
+    if owner is not None:
+        key ^= zobrist_key('owner', coords, owner.name)
+    return key
+
+
+def mix64(value: int) -> int:
+    """Scrambles an arbitrary non-negative int (e.g. a card bitset) into 64 bits."""
+    h = 0
+    while True:
+        # splitmix64 finalizer over each 64-bit chunk
+        z = (h ^ (value & MASK64)) + 0x9E37_79B9_7F4A_7C15 & MASK64
+        z = (z ^ (z >> 30)) * 0xBF58_476D_1CE4_E5B9 & MASK64
+        z = (z ^ (z >> 27)) * 0x94D0_49BB_1331_11EB & MASK64
+        h = z ^ (z >> 31)
+        value >>= 64
+        if not value:
+            return h
+
+
+class TranspositionTable:
+    """
+    Bounded hash -> value map for search. Full: the least recently used entry goes.
+    Store whatever the search needs (score, depth, best move) as the value.
+    """
+
+    def __init__(self, capacity: int = 1 << 16):
+        self.capacity = capacity
+        self._entries: 'OrderedDict[int, Any]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._entries
+
+    def get(self, key: int, default: Optional[Any] = None) -> Optional[Any]:
+        entries = self._entries
+        value = entries.get(key, entries)
+        if value is entries:
+            self.misses += 1
+            return default
+        entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def store(self, key: int, value: Any):
+        entries = self._entries
+        entries[key] = value
+        entries.move_to_end(key)
+        if len(entries) > self.capacity:
+            entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._entries), "capacity": self.capacity, "hits": self.hits, "misses": self.misses}